@@ -0,0 +1,408 @@
+import calendar
+from array import array
+from datetime import date, timedelta
+
+from Sistema import IndiceDeRango, Inmobiliaria
+
+
+def _indiceDeMes(fecha):
+    return fecha.year * 12 + fecha.month - 1
+
+
+def _cuotasHasta(inicio, fecha):
+    """Cantidad de cuotas mensuales vencidas al dia fecha inclusive: la primera vence en inicio y cada una el mismo dia de los meses siguientes."""
+    meses = _indiceDeMes(fecha) - _indiceDeMes(inicio)
+    if meses < 0:
+        return 0
+    # En los meses mas cortos la cuota vence el ultimo dia ( un contrato del 31 vence el 30 de abril ).
+    dia = min(inicio.day, calendar.monthrange(fecha.year, fecha.month)[1])
+    return meses + (1 if fecha.day >= dia else 0)
+
+
+def _validarFecha(fecha, nombre):
+    if not isinstance(fecha, date):
+        raise TypeError(f"Error: {nombre} debe ser una fecha ( datetime.date ).")
+
+
+class ArbolDeFenwick():
+    """
+    Arbol de Fenwick de sumas sobre las posiciones 0..tamaño-1: sumar a una posicion y la suma de un prefijo cuestan
+    O(log tamaño).
+
+    Solo guarda los nodos que recibieron algun monto, en un diccionario, por lo que un arbol con pocos montos ocupa poco
+    aunque el rango de posiciones sea grande ( por ejemplo, los dias de todo el rango de fechas admitido ).
+
+    Args:
+        tamaño (int): cantidad de posiciones.
+    """
+
+    __slots__ = ("_tamaño", "_nodos")
+
+    def __init__(self, tamaño):
+        self._tamaño = tamaño
+        # Posicion ( indexada desde 1 ) -> suma del tramo que cubre el nodo.
+        self._nodos = {}
+
+    def sumar(self, posicion, monto):
+        nodos = self._nodos
+        posicion += 1
+        while posicion <= self._tamaño:
+            nodos[posicion] = nodos.get(posicion, 0.0) + monto
+            posicion += posicion & -posicion
+
+    def prefijo(self, posicion):
+        """Suma de las posiciones 0..posicion, ambas inclusive. Con posicion negativa es 0."""
+        nodos = self._nodos
+        total = 0.0
+        posicion = min(posicion + 1, self._tamaño)
+        while posicion > 0:
+            total += nodos.get(posicion, 0.0)
+            posicion -= posicion & -posicion
+        return total
+
+
+class Contrato():
+    """
+    Contrato de alquiler de un inmueble: inquilino, periodo [inicio, fin) y monto mensual.
+
+    Las cuotas vencen el dia de inicio de cada mes del periodo, empezando por el primero.
+
+    Args:
+        numero (int): numero del contrato en el libro.
+        codigo (int): codigo unico del inmueble alquilado.
+        inquilino (str): nombre del inquilino.
+        inicio (date): fecha de inicio, primer vencimiento.
+        fin (date): fecha de fin ( no incluida ).
+        montoMensual (int or float): monto de cada cuota.
+
+    Raises:
+        TypeError: si algun argumento no es del tipo indicado.
+        ValueError: si fin no es posterior a inicio o el monto no es positivo.
+    """
+
+    __slots__ = ("_numero", "_codigo", "_inquilino", "_inicio", "_fin", "_montoMensual", "_cuotas")
+
+    def __init__(self, numero, codigo, inquilino, inicio, fin, montoMensual):
+        if not isinstance(codigo, int):
+            raise TypeError("Error: el id debe ser un entero.")
+        if not isinstance(inquilino, str):
+            raise TypeError("Error: el nombre del inquilino debe ser una cadena de texto.")
+        _validarFecha(inicio, "inicio")
+        _validarFecha(fin, "fin")
+        if isinstance(montoMensual, bool) or not isinstance(montoMensual, (int, float)):
+            raise TypeError("Error: el monto mensual debe ser int o float.")
+        if fin <= inicio:
+            raise ValueError("Error: la fecha de fin debe ser posterior a la de inicio.")
+        if montoMensual <= 0:
+            raise ValueError("Error: el monto mensual debe ser positivo.")
+        self._numero = numero
+        self._codigo = codigo
+        self._inquilino = inquilino
+        self._inicio = inicio
+        self._fin = fin
+        self._montoMensual = montoMensual
+        self._cuotas = _cuotasHasta(inicio, fin - timedelta(days=1))
+
+    def getNumero(self):
+        return self._numero
+
+    def getCodigo(self):
+        return self._codigo
+
+    def getInquilino(self):
+        return self._inquilino
+
+    def getInicio(self):
+        return self._inicio
+
+    def getFin(self):
+        return self._fin
+
+    def getMontoMensual(self):
+        return self._montoMensual
+
+    def cantidadCuotas(self):
+        return self._cuotas
+
+    def cuotasVencidas(self, fecha):
+        """Cantidad de cuotas vencidas al dia fecha inclusive."""
+        return min(self._cuotas, _cuotasHasta(self._inicio, fecha))
+
+    def estaVigente(self, fecha):
+        return self._inicio <= fecha < self._fin
+
+    def __repr__(self):
+        return (f"Contrato {self._numero} (inmueble {self._codigo}, {self._inquilino}, "
+                f"{self._inicio.isoformat()} a {self._fin.isoformat()}, {self._montoMensual} por mes)")
+
+
+class LibroDeAlquileres():
+    """
+    Libro de contratos de alquiler, pagos y deudas de los inmuebles de una inmobiliaria.
+
+    Los contratos se asocian a los codigos unicos de los inmuebles. Las consultas no recorren el libro:
+        - los vencimientos de contratos estan en un IndiceDeRango por fecha de fin, O(log n + k);
+        - los pagos de cada contrato se acumulan por dia en un ArbolDeFenwick, por lo que registrar un pago ( aunque tenga
+          fecha anterior a otros ya registrados ) y lo pagado hasta una fecha ( y la deuda ) cuestan O(log dias);
+        - los ingresos se acumulan por mes en otro ArbolDeFenwick, por lo que el total de un periodo cuesta O(log meses) y
+          la serie mensual O(meses) sin importar la cantidad de pagos;
+        - los codigos con contratos se agrupan por dni del propietario, y el libro sigue como observador de la
+          inmobiliaria las ventas, altas y bajas, por lo que la deuda de un propietario solo recorre sus contratos.
+
+    Args:
+        inmobiliaria (Inmobiliaria): inmobiliaria cuyos inmuebles se alquilan.
+
+    Raises:
+        TypeError: si inmobiliaria no es una instancia de la clase Inmobiliaria.
+
+    Methods:
+        registrarContrato: Registra un contrato sobre un inmueble de la cartera.
+        alquilarConContrato: Alquila el inmueble con alquilarInmueble y registra su contrato.
+        registrarPago: Registra un pago de un contrato.
+        contratosDe: Contratos de un inmueble, del mas antiguo al mas reciente.
+        contratoVigente: Contrato de un inmueble vigente en una fecha.
+        contratosQueVencen: Contratos cuya fecha de fin esta en un periodo, ordenados por fecha de fin.
+        contratosQueVencenEnMes: Contratos cuya fecha de fin cae en un mes.
+        pagado: Total pagado de un contrato hasta una fecha.
+        deuda: Cuotas vencidas y no pagadas de un contrato a una fecha.
+        deudaDePropietario: Deuda de los contratos de los inmuebles de un propietario.
+        deudasPorPropietario: Deuda de cada propietario con contratos impagos.
+        ingresosMensuales: Serie de ingresos por mes.
+        ingresosEntre: Total de ingresos de un periodo de meses.
+    """
+
+    # Rango de fechas admitido para los pagos, que define el tamaño del arbol de ingresos.
+    añoInicial = 1900
+    añoFinal = 2200
+
+    def __init__(self, inmobiliaria):
+        if not isinstance(inmobiliaria, Inmobiliaria):
+            raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+        self._inmobiliaria = inmobiliaria
+        self._contratos = {}
+        # Codigo unico del inmueble -> contratos, en el orden en que se registraron.
+        self._contratosPorCodigo = {}
+        # Dni del propietario -> codigos de sus inmuebles en la cartera que tienen contratos.
+        self._codigosPorDni = {}
+        # Pares (ordinal de la fecha de fin, numero de contrato).
+        self._vencimientos = IndiceDeRango()
+        # Numero de contrato -> ArbolDeFenwick de sus pagos por dia ( relativo a añoInicial ).
+        self._pagos = {}
+        self._cantidadPagos = 0
+        self._primerDia = date(self.añoInicial, 1, 1).toordinal()
+        self._dias = date(self.añoFinal, 1, 1).toordinal() - self._primerDia
+        self._primerMes = self.añoInicial * 12
+        # Ingresos por mes ( relativo a añoInicial ), en un arbol para los totales de periodos y en un array para la serie.
+        self._arbolDeIngresos = ArbolDeFenwick((self.añoFinal - self.añoInicial) * 12)
+        self._ingresosPorMes = array("d", bytes(8 * (self.añoFinal - self.añoInicial) * 12))
+        inmobiliaria.agregarObservador(self._actualizarPropietarios)
+
+    def __len__(self):
+        return len(self._contratos)
+
+    def cantidadPagos(self):
+        return self._cantidadPagos
+
+    def getContrato(self, numero):
+        return self._contratos.get(numero)
+
+    def registrarContrato(self, codigo, inquilino, inicio, fin, montoMensual):
+        """
+            Registra un contrato sobre un inmueble de la cartera. No modifica el inmueble ( ver alquilarConContrato ).
+
+            Returns:
+                Contrato: el contrato registrado, con su numero.
+
+            Raises:
+                TypeError, ValueError: si los datos no pasan las validaciones de Contrato o el inmueble no esta en la cartera.
+        """
+        contrato = Contrato(len(self._contratos) + 1, codigo, inquilino, inicio, fin, montoMensual)
+        if self._inmobiliaria.buscarPropiedad(codigo) is None:
+            raise ValueError(f"Error: el inmueble {codigo} no esta en la cartera.")
+        self._guardarContrato(contrato)
+        return contrato
+
+    def _guardarContrato(self, contrato):
+        self._contratos[contrato.getNumero()] = contrato
+        self._contratosPorCodigo.setdefault(contrato.getCodigo(), []).append(contrato)
+        self._vencimientos.agregar(contrato.getFin().toordinal(), contrato.getNumero())
+        inmueble = self._inmobiliaria.buscarPropiedad(contrato.getCodigo())
+        if inmueble is not None:
+            self._codigosPorDni.setdefault(inmueble.getOwner().getDni(), set()).add(contrato.getCodigo())
+
+    def _moverCodigo(self, codigo, anterior, nuevo):
+        if anterior is not None:
+            codigos = self._codigosPorDni.get(anterior)
+            if codigos is not None:
+                codigos.discard(codigo)
+                if not codigos:
+                    del self._codigosPorDni[anterior]
+        if nuevo is not None:
+            self._codigosPorDni.setdefault(nuevo, set()).add(codigo)
+
+    def _actualizarPropietarios(self, evento, **datos):
+        # Observador de la inmobiliaria: mantiene _codigosPorDni cuando un inmueble con contratos cambia de propietario,
+        # se da de baja o vuelve a la cartera.
+        inmueble = datos.get("inmueble")
+        if inmueble is None or inmueble.getUniquecode() not in self._contratosPorCodigo:
+            return
+        codigo = inmueble.getUniquecode()
+        if evento == "cambio" and datos["campo"] == "dni":
+            self._moverCodigo(codigo, datos["anterior"], inmueble.getOwner().getDni())
+        elif evento == "baja":
+            self._moverCodigo(codigo, inmueble.getOwner().getDni(), None)
+        elif evento == "alta":
+            self._moverCodigo(codigo, None, inmueble.getOwner().getDni())
+
+    def alquilarConContrato(self, codigo, inquilino, inicio, fin, montoMensual):
+        """
+            Alquila el inmueble con Inmobiliaria.alquilarInmueble ( que asigna el inquilino, el estado y la ganancia ) y, si
+            el alquiler se concreta, registra su contrato.
+
+            Returns:
+                Contrato: el contrato registrado, o None si el inmueble no esta en alquiler o no esta en la cartera.
+
+            Raises:
+                TypeError, ValueError: si los datos del contrato no son validos. En ese caso el inmueble no se alquila.
+        """
+        contrato = Contrato(len(self._contratos) + 1, codigo, inquilino, inicio, fin, montoMensual)
+        if not self._inmobiliaria.alquilarInmueble(codigo, inquilino):
+            return None
+        self._guardarContrato(contrato)
+        return contrato
+
+    def registrarPago(self, numero, monto, fecha):
+        """
+            Registra un pago de un contrato. Los pagos pueden registrarse en cualquier orden de fechas.
+
+            Args:
+                numero (int): numero del contrato.
+                monto (int or float): monto pagado, positivo.
+                fecha (date): fecha del pago.
+
+            Raises:
+                TypeError: si el monto no es un numero o la fecha no es un date.
+                ValueError: si el contrato no existe, el monto no es positivo o la fecha esta fuera del rango admitido.
+        """
+        if numero not in self._contratos:
+            raise ValueError(f"Error: no existe el contrato {numero}.")
+        if isinstance(monto, bool) or not isinstance(monto, (int, float)):
+            raise TypeError("Error: el monto debe ser int o float.")
+        if monto <= 0:
+            raise ValueError("Error: el monto debe ser positivo.")
+        _validarFecha(fecha, "fecha")
+        mes = _indiceDeMes(fecha) - self._primerMes
+        if not 0 <= mes < len(self._ingresosPorMes):
+            raise ValueError(f"Error: la fecha debe estar entre {self.añoInicial} y {self.añoFinal - 1}.")
+
+        pagos = self._pagos.get(numero)
+        if pagos is None:
+            pagos = self._pagos[numero] = ArbolDeFenwick(self._dias)
+        pagos.sumar(fecha.toordinal() - self._primerDia, monto)
+        self._cantidadPagos += 1
+
+        self._ingresosPorMes[mes] += monto
+        self._arbolDeIngresos.sumar(mes, monto)
+
+    def contratosDe(self, codigo):
+        return list(self._contratosPorCodigo.get(codigo, ()))
+
+    def contratoVigente(self, codigo, fecha=None):
+        """Devuelve el contrato mas reciente del inmueble vigente en fecha ( por defecto hoy ), o None."""
+        fecha = date.today() if fecha is None else fecha
+        for contrato in reversed(self._contratosPorCodigo.get(codigo, ())):
+            if contrato.estaVigente(fecha):
+                return contrato
+        return None
+
+    def contratosQueVencen(self, desde, hasta):
+        """
+            Devuelve los contratos cuya fecha de fin esta entre desde y hasta, ambas inclusive.
+
+            Returns:
+                list: Contratos ordenados por fecha de fin y numero.
+        """
+        _validarFecha(desde, "desde")
+        _validarFecha(hasta, "hasta")
+        return [self._contratos[numero] for numero in self._vencimientos.rango(desde.toordinal(), hasta.toordinal())]
+
+    def contratosQueVencenEnMes(self, año, mes):
+        return self.contratosQueVencen(date(año, mes, 1), date(año, mes, calendar.monthrange(año, mes)[1]))
+
+    def pagado(self, numero, fecha=None):
+        """Total pagado del contrato con pagos de fecha menor o igual a fecha ( por defecto, todos )."""
+        pagos = self._pagos.get(numero)
+        if pagos is None:
+            return 0.0
+        return pagos.prefijo(self._dias if fecha is None else fecha.toordinal() - self._primerDia)
+
+    def deuda(self, numero, fecha=None):
+        """
+            Monto de las cuotas vencidas a la fecha ( por defecto hoy ) que no cubren los pagos hechos hasta esa fecha.
+
+            Raises:
+                ValueError: si el contrato no existe.
+        """
+        contrato = self._contratos.get(numero)
+        if contrato is None:
+            raise ValueError(f"Error: no existe el contrato {numero}.")
+        fecha = date.today() if fecha is None else fecha
+        return max(0.0, contrato.cuotasVencidas(fecha) * contrato.getMontoMensual() - self.pagado(numero, fecha))
+
+    def deudaDePropietario(self, dni, fecha=None):
+        """
+            Deuda a la fecha de todos los contratos de los inmuebles que el propietario tiene en la cartera.
+
+            El costo depende de los contratos del propietario, no del tamaño del libro ni de la cartera.
+        """
+        fecha = date.today() if fecha is None else fecha
+        return sum(self.deuda(contrato.getNumero(), fecha)
+                   for codigo in self._codigosPorDni.get(dni, ())
+                   for contrato in self._contratosPorCodigo[codigo])
+
+    def deudasPorPropietario(self, fecha=None):
+        """
+            Deuda a la fecha de cada propietario que tiene contratos impagos. Recorre los contratos de los inmuebles que
+            estan en la cartera, ya agrupados por propietario, una vez y sin recorrer los pagos.
+
+            Returns:
+                dict: dni -> deuda.
+        """
+        fecha = date.today() if fecha is None else fecha
+        deudas = {}
+        for dni, codigos in self._codigosPorDni.items():
+            deuda = sum(self.deuda(contrato.getNumero(), fecha)
+                        for codigo in codigos for contrato in self._contratosPorCodigo[codigo])
+            if deuda > 0:
+                deudas[dni] = deuda
+        return deudas
+
+    def _ingresosHasta(self, mes):
+        """Suma de los ingresos de los meses 0..mes ( relativos a añoInicial )."""
+        return self._arbolDeIngresos.prefijo(mes)
+
+    def ingresosEntre(self, desde, hasta):
+        """Total de los pagos registrados en los meses de desde a hasta ( fechas ), ambos inclusive."""
+        _validarFecha(desde, "desde")
+        _validarFecha(hasta, "hasta")
+        inicio = max(0, _indiceDeMes(desde) - self._primerMes)
+        fin = _indiceDeMes(hasta) - self._primerMes
+        if fin < inicio:
+            return 0.0
+        return self._ingresosHasta(fin) - (self._ingresosHasta(inicio - 1) if inicio else 0.0)
+
+    def ingresosMensuales(self, desde, hasta):
+        """
+            Serie de ingresos por mes entre los meses de desde y hasta ( fechas ), ambos inclusive.
+
+            Returns:
+                list: tuplas (año, mes, total), una por mes aunque no tenga pagos.
+        """
+        _validarFecha(desde, "desde")
+        _validarFecha(hasta, "hasta")
+        serie = []
+        for indice in range(_indiceDeMes(desde), _indiceDeMes(hasta) + 1):
+            mes = indice - self._primerMes
+            total = self._ingresosPorMes[mes] if 0 <= mes < len(self._ingresosPorMes) else 0.0
+            serie.append((indice // 12, indice % 12 + 1, total))
+        return serie
@@ -0,0 +1,142 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from Sistema import Inmobiliaria
+
+
+class AsyncInmobiliaria():
+    """
+    Fachada asyncio sobre una Inmobiliaria.
+
+    Expone versiones awaitable de las operaciones de la inmobiliaria para usarla desde un servidor asyncio sin bloquear el loop:
+        - Las mutaciones sobre un mismo inmueble se serializan con un asyncio.Lock por codigo; inmuebles distintos no se esperan.
+          Se ejecutan en el executor: toman el candado de indices, que las busquedas y reportes del executor retienen mientras
+          recorren la cartera, y esperarlo en el loop lo bloquearia.
+        - Las lecturas por codigo de un mismo ciclo del loop se agrupan y se resuelven juntas.
+        - Los reportes y calculos de precios sobre la cartera se ejecutan en un executor de hilos.
+
+    La inmobiliaria se crea en modo concurrente, ya que el executor la lee desde otros hilos.
+
+    Args:
+        inmobiliaria (Inmobiliaria, opcional): inmobiliaria a envolver. Por defecto se crea una con concurrente=True.
+        executor (Executor, opcional): executor para las mutaciones y el trabajo pesado. Por defecto un ThreadPoolExecutor propio.
+
+    Raises:
+        TypeError: si inmobiliaria no es una instancia de la clase Inmobiliaria.
+        ValueError: si inmobiliaria no esta en modo concurrente.
+    """
+
+    def __init__(self, inmobiliaria=None, executor=None):
+        if inmobiliaria is None:
+            inmobiliaria = Inmobiliaria(concurrente=True)
+        if not isinstance(inmobiliaria, Inmobiliaria):
+            raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+        if not inmobiliaria.esConcurrente():
+            raise ValueError("Error: la inmobiliaria debe crearse con concurrente=True.")
+        self._inmobiliaria = inmobiliaria
+        self._executorPropio = executor is None
+        self._executor = ThreadPoolExecutor() if executor is None else executor
+        # codigo -> [asyncio.Lock, cantidad de tareas que lo usan]
+        self._candados = {}
+        self._lecturasPendientes = []
+
+    def getInmobiliaria(self):
+        return self._inmobiliaria
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        if self._executorPropio:
+            self._executor.shutdown(wait=True)
+
+    @asynccontextmanager
+    async def _candadoDe(self, codigo):
+        entrada = self._candados.get(codigo)
+        if entrada is None:
+            entrada = self._candados[codigo] = [asyncio.Lock(), 0]
+        entrada[1] += 1
+        try:
+            async with entrada[0]:
+                yield
+        finally:
+            entrada[1] -= 1
+            if entrada[1] == 0:
+                # Sin tareas esperando, el candado se descarta para no acumular uno por inmueble.
+                del self._candados[codigo]
+
+    async def _enExecutor(self, funcion, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, funcion, *args)
+
+    async def _mutar(self, codigo, funcion, *args):
+        async with self._candadoDe(codigo):
+            return await self._enExecutor(funcion, *args)
+
+    # Mutaciones
+
+    async def anañadirPropiedad(self, inmueble, costo):
+        return await self._mutar(inmueble.getUniquecode(), self._inmobiliaria.anañadirPropiedad, inmueble, costo)
+
+    async def eliminarPropiedad(self, id):
+        return await self._mutar(id, self._inmobiliaria.eliminarPropiedad, id)
+
+    async def venderPropiedad(self, id, nuevo_propietario):
+        return await self._mutar(id, self._inmobiliaria.venderPropiedad, id, nuevo_propietario)
+
+    async def alquilarInmueble(self, id, inquilino):
+        return await self._mutar(id, self._inmobiliaria.alquilarInmueble, id, inquilino)
+
+    async def ponerEnVenta(self, id):
+        return await self._mutar(id, self._inmobiliaria.ponerEnVenta, id)
+
+    async def ponerEnAlquiler(self, id):
+        return await self._mutar(id, self._inmobiliaria.ponerEnAlquiler, id)
+
+    # Lecturas
+
+    async def buscarPropiedad(self, id):
+        """
+            Devuelve la propiedad con el codigo indicado, o None.
+
+            Las lecturas pedidas en el mismo ciclo del loop se resuelven juntas en una sola pasada.
+        """
+        futuro = asyncio.get_running_loop().create_future()
+        if not self._lecturasPendientes:
+            asyncio.get_running_loop().call_soon(self._resolverLecturas)
+        self._lecturasPendientes.append((id, futuro))
+        return await futuro
+
+    def _resolverLecturas(self):
+        pendientes, self._lecturasPendientes = self._lecturasPendientes, []
+        buscar = self._inmobiliaria.buscarPropiedad
+        for id, futuro in pendientes:
+            if not futuro.cancelled():
+                futuro.set_result(buscar(id))
+
+    async def buscar(self, **criterios):
+        """Version awaitable de Inmobiliaria.buscar. Acepta los mismos criterios y se ejecuta en el executor."""
+        return await self._enExecutor(lambda: self._inmobiliaria.buscar(**criterios))
+
+    async def getlistaPropiedades(self):
+        return await self._enExecutor(self._inmobiliaria.getlistaPropiedades)
+
+    async def getGanancias(self):
+        return self._inmobiliaria.getGanancias()
+
+    # Trabajo pesado en el executor
+
+    async def calcularPrecio(self, propiedad):
+        return await self._enExecutor(self._inmobiliaria.calcularPrecio, propiedad)
+
+    async def calcularPreciosBatch(self, codigos=None):
+        return await self._enExecutor(self._inmobiliaria.calcularPreciosBatch, codigos)
+
+    async def datallarInmueble(self):
+        return await self._enExecutor(self._inmobiliaria.datallarInmueble)
+
+    async def escribirReporte(self, archivo):
+        return await self._enExecutor(self._inmobiliaria.escribirReporte, archivo)
@@ -0,0 +1,281 @@
+import math
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+
+from Sistema import Inmobiliaria, Inmueble, Propietario
+
+_MAGIA = b"INMB"
+_VERSION = 3
+
+# magia, version, tamaño de registro, cantidad de inmuebles, cantidad de cadenas, ganancias, unique_code_seq, offset de la tabla de cadenas,
+# cantidad de tipos con ganancias, offset de la tabla de ganancias por tipo.
+_ENCABEZADO = struct.Struct("<4sHHqqdqqqq")
+
+# codigo, dni, coveredArea, costo, decimal, entero, rooms, tipo, address, fullname, inquilino, estado, cochera, pileta, quincho,
+# latitud, longitud, enteros. tipo, address, fullname e inquilino son posiciones en la tabla de cadenas; un inmueble sin
+# coordenadas guarda NaN en latitud y longitud. enteros marca con un bit cada campo decimal que era int ( ver _ENTEROS ), para
+# devolverlo con su tipo original.
+_REGISTRO = struct.Struct("<qqdddqiIIIIB???ddB")
+
+_ENTEROS = {"coveredArea": 1, "costo": 2, "decimal": 4}
+
+# tipo ( posicion en la tabla de cadenas ), ganancias acumuladas.
+_GANANCIA = struct.Struct("<Id")
+
+# Atributos propios de cada clase hija -> campo del registro que los guarda.
+_EXTRAS = {
+    "Casa": {"patioSurface": "decimal"},
+    "Departamento": {"expenses": "decimal", "departmentNumber": "entero"},
+    "Salon": {"capacidad": "entero"},
+    "Quinta": {"pileta": "pileta", "quincho": "quincho"},
+}
+
+_OFFSET = struct.Struct("<q")
+
+
+def escribirSnapshotBinario(inmobiliaria, ruta):
+    """
+        Escribe la cartera de una inmobiliaria en un snapshot binario de registros de ancho fijo.
+
+        Los registros quedan ordenados por codigo unico, y las cadenas ( direcciones, nombres, inquilinos y tipos ) se
+        guardan una sola vez en una tabla al final del archivo, seguida de las ganancias por tipo de inmueble. Se escribe en un archivo temporal que se renombra al terminar.
+
+        Args:
+            inmobiliaria (Inmobiliaria): inmobiliaria a guardar.
+            ruta (str): ruta del archivo.
+
+        Returns:
+            int: cantidad de inmuebles escritos.
+
+        Raises:
+            TypeError: si inmobiliaria no es una instancia de la clase Inmobiliaria.
+            ValueError: si algun inmueble es de un tipo sin formato binario.
+    """
+    if not isinstance(inmobiliaria, Inmobiliaria):
+        raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+
+    cadenas = {}
+
+    def cadena(texto):
+        posicion = cadenas.get(texto)
+        if posicion is None:
+            posicion = cadenas[texto] = len(cadenas)
+        return posicion
+
+    propiedades = sorted(inmobiliaria.getlistaPropiedades(), key=lambda inmueble: inmueble.getUniquecode())
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(bytes(_ENCABEZADO.size))
+        for inmueble in propiedades:
+            registro = inmueble.aRegistro()
+            extras = _EXTRAS.get(registro["tipo"])
+            if extras is None:
+                raise ValueError(f'Error: el tipo {registro["tipo"]} no tiene formato binario.')
+            campos = {"decimal": 0.0, "entero": 0, "pileta": False, "quincho": False}
+            for clave, campo in extras.items():
+                campos[campo] = registro[clave]
+            latitud, longitud = inmueble.getCoordenadas() or (math.nan, math.nan)
+            valores = {"coveredArea": registro["coveredArea"], "costo": registro["costo"], "decimal": campos["decimal"]}
+            enteros = sum(bit for campo, bit in _ENTEROS.items() if isinstance(valores[campo], int))
+            archivo.write(_REGISTRO.pack(
+                registro["codigo"], registro["dni"], registro["coveredArea"], registro["costo"], campos["decimal"],
+                campos["entero"], registro["rooms"], cadena(registro["tipo"]), cadena(registro["address"]),
+                cadena(registro["fullname"]), cadena(registro["inquilino"]), inmueble.getCodigoEstado(),
+                registro["cochera"], campos["pileta"], campos["quincho"], latitud, longitud,
+                enteros))
+
+        gananciasPorTipo = [(cadena(tipo), total) for tipo, total in inmobiliaria.getAgregados().gananciasPorTipo().items()]
+        offsetCadenas = archivo.tell()
+        codificadas = [texto.encode("utf-8") for texto in cadenas]
+        posicion = 0
+        for codificada in codificadas:
+            archivo.write(_OFFSET.pack(posicion))
+            posicion += len(codificada)
+        archivo.write(_OFFSET.pack(posicion))
+        for codificada in codificadas:
+            archivo.write(codificada)
+        offsetGanancias = archivo.tell()
+        for tipo, total in gananciasPorTipo:
+            archivo.write(_GANANCIA.pack(tipo, total))
+
+        archivo.seek(0)
+        archivo.write(_ENCABEZADO.pack(_MAGIA, _VERSION, _REGISTRO.size, len(propiedades), len(cadenas),
+                                       inmobiliaria.getGanancias(), Inmueble.unique_code_seq, offsetCadenas,
+                                       len(gananciasPorTipo), offsetGanancias))
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+    return len(propiedades)
+
+
+class SnapshotBinario(Mapping):
+    """
+    Vista de solo lectura codigo -> Inmueble sobre un snapshot binario abierto con mmap.
+
+    Abrir el archivo solo lee el encabezado: los registros se decodifican cuando se piden y los objetos Inmueble se
+    materializan ( con Inmueble.desdeRegistroConfiable ) recien al acceder a ellos, una sola vez por codigo. Los propietarios se
+    comparten por dni. La busqueda por codigo es binaria sobre los registros, que estan ordenados.
+
+    Args:
+        ruta (str): ruta de un archivo escrito con escribirSnapshotBinario.
+
+    Raises:
+        ValueError: si el archivo no es un snapshot binario de una version conocida.
+
+    Methods:
+        registro: Decodifica el registro de una posicion como diccionario ( formato de Inmueble.aRegistro ).
+        getGananciasPorTipo: Devuelve las ganancias acumuladas por tipo de inmueble.
+        posicion: Devuelve la posicion de un codigo, o -1.
+        vista: Devuelve un memoryview de solo lectura sobre los registros, sin copiarlos.
+        cargarInmobiliaria: Materializa todos los inmuebles en una Inmobiliaria.
+        cerrar: Libera el mmap y el archivo.
+    """
+
+    def __init__(self, ruta):
+        if not isinstance(ruta, str):
+            raise TypeError("Error: la ruta debe ser un str")
+        self._archivo = open(ruta, "rb")
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            (magia, version, tamañoRegistro, self._cantidad, self._cantidadCadenas, self._ganancias,
+             self._secuenciaDeCodigos, offsetCadenas, self._cantidadGanancias,
+             self._offsetGanancias) = _ENCABEZADO.unpack_from(self._mapa, 0)
+        except (ValueError, struct.error):
+            self._archivo.close()
+            raise ValueError("Error: el archivo no es un snapshot binario.")
+        if magia != _MAGIA or version != _VERSION or tamañoRegistro != _REGISTRO.size:
+            self.cerrar()
+            raise ValueError("Error: el archivo no es un snapshot binario o es de otra version.")
+        self._offsetCadenas = offsetCadenas
+        self._inicioTexto = offsetCadenas + _OFFSET.size * (self._cantidadCadenas + 1)
+        # Mapas de identidad: cada codigo o dni se materializa una sola vez.
+        self._inmuebles = {}
+        self._propietarios = {}
+        # Evita que los inmuebles nuevos repitan codigos del snapshot.
+        Inmueble.reservarCodigo(self._secuenciaDeCodigos)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        self._mapa.close()
+        self._archivo.close()
+
+    def getGanancias(self):
+        return self._ganancias
+
+    def getGananciasPorTipo(self):
+        ganancias = {}
+        for numero in range(self._cantidadGanancias):
+            tipo, total = _GANANCIA.unpack_from(self._mapa, self._offsetGanancias + numero * _GANANCIA.size)
+            ganancias[self._cadena(tipo)] = total
+        return ganancias
+
+    def vista(self):
+        """Devuelve un memoryview de solo lectura sobre los registros ( cantidad x tamañoRegistro bytes ), sin copiarlos."""
+        return memoryview(self._mapa)[_ENCABEZADO.size:_ENCABEZADO.size + self._cantidad * _REGISTRO.size]
+
+    def _cadena(self, posicion):
+        inicio, fin = struct.unpack_from("<qq", self._mapa, self._offsetCadenas + _OFFSET.size * posicion)
+        return self._mapa[self._inicioTexto + inicio:self._inicioTexto + fin].decode("utf-8")
+
+    def _codigo(self, posicion):
+        return _OFFSET.unpack_from(self._mapa, _ENCABEZADO.size + posicion * _REGISTRO.size)[0]
+
+    def posicion(self, codigo):
+        """Devuelve la posicion del registro con el codigo indicado, o -1 si no esta. Busqueda binaria, O(log n)."""
+        bajo, alto = 0, self._cantidad
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if self._codigo(medio) < codigo:
+                bajo = medio + 1
+            else:
+                alto = medio
+        if bajo < self._cantidad and self._codigo(bajo) == codigo:
+            return bajo
+        return -1
+
+    def registro(self, posicion):
+        """
+            Decodifica un registro del snapshot.
+
+            Args:
+                posicion (int): posicion del registro, entre 0 y len(snapshot) - 1.
+
+            Returns:
+                dict: datos del inmueble con las claves de Inmueble.aRegistro.
+
+            Raises:
+                IndexError: si la posicion esta fuera de rango.
+        """
+        if not 0 <= posicion < self._cantidad:
+            raise IndexError("Error: posicion fuera del snapshot.")
+        (codigo, dni, coveredArea, costo, decimal, entero, rooms, tipo, address, fullname, inquilino, estado,
+         cochera, pileta, quincho, latitud, longitud, enteros) = _REGISTRO.unpack_from(self._mapa,
+                                                                                        _ENCABEZADO.size + posicion * _REGISTRO.size)
+        if enteros:
+            coveredArea = int(coveredArea) if enteros & _ENTEROS["coveredArea"] else coveredArea
+            costo = int(costo) if enteros & _ENTEROS["costo"] else costo
+            decimal = int(decimal) if enteros & _ENTEROS["decimal"] else decimal
+        registro = {"tipo": self._cadena(tipo), "codigo": codigo, "coveredArea": coveredArea,
+                    "address": self._cadena(address), "rooms": rooms, "dni": dni, "fullname": self._cadena(fullname),
+                    "estado": Inmueble.posible_estado[estado], "cochera": cochera,
+                    "inquilino": self._cadena(inquilino), "costo": costo}
+        campos = {"decimal": decimal, "entero": entero, "pileta": pileta, "quincho": quincho}
+        for clave, campo in _EXTRAS[registro["tipo"]].items():
+            registro[clave] = campos[campo]
+        if not math.isnan(latitud):
+            registro["latitud"] = latitud
+            registro["longitud"] = longitud
+        return registro
+
+    def _materializar(self, registro):
+        propietario = self._propietarios.get(registro["dni"])
+        if propietario is None:
+            propietario = self._propietarios[registro["dni"]] = Propietario(registro["fullname"], registro["dni"])
+        inmueble = Inmueble.desdeRegistroConfiable(registro, propietario)
+        self._inmuebles[registro["codigo"]] = inmueble
+        return inmueble
+
+    def __getitem__(self, codigo):
+        inmueble = self._inmuebles.get(codigo)
+        if inmueble is None:
+            posicion = self.posicion(codigo) if isinstance(codigo, int) else -1
+            if posicion < 0:
+                raise KeyError(codigo)
+            inmueble = self._materializar(self.registro(posicion))
+        return inmueble
+
+    def __contains__(self, codigo):
+        return codigo in self._inmuebles or (isinstance(codigo, int) and self.posicion(codigo) >= 0)
+
+    def __iter__(self):
+        for posicion in range(self._cantidad):
+            yield self._codigo(posicion)
+
+    def __len__(self):
+        return self._cantidad
+
+    def cargarInmobiliaria(self, concurrente=False):
+        """
+            Materializa todos los inmuebles del snapshot en una nueva inmobiliaria, con sus ganancias totales y por tipo.
+
+            Returns:
+                Inmobiliaria: la inmobiliaria reconstruida.
+        """
+        inmobiliaria = Inmobiliaria(concurrente=concurrente)
+        for posicion in range(self._cantidad):
+            codigo = self._codigo(posicion)
+            inmueble = self._inmuebles.get(codigo)
+            if inmueble is None:
+                inmueble = self._materializar(self.registro(posicion))
+            inmobiliaria.anañadirPropiedad(inmueble, inmueble.getCosto())
+        inmobiliaria.setGanancias(self._ganancias)
+        for tipo, total in self.getGananciasPorTipo().items():
+            inmobiliaria.getAgregados().fijarGanancia(tipo, total)
+        return inmobiliaria
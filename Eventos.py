@@ -0,0 +1,250 @@
+import json
+import os
+from threading import Lock
+
+from Sistema import Inmobiliaria, Inmueble, Propietario
+
+# Campo informado por _notificarCambio -> clave de Inmueble.aRegistro con el valor nuevo.
+_CLAVES_DE_CAMPO = {"area": "coveredArea", "address": "address", "rooms": "rooms", "estado": "estado",
+                    "cochera": "cochera", "inquilino": "inquilino", "costo": "costo", "patioSurface": "patioSurface",
+                    "expenses": "expenses", "departmentNumber": "departmentNumber", "capacidad": "capacidad",
+                    "pileta": "pileta", "quincho": "quincho", "fullname": "fullname"}
+
+# Clave de registro -> metodo que aplica el valor al reproducir el evento.
+_SETTERS = {"coveredArea": "setCoveredArea", "address": "setAddress", "rooms": "setRooms", "estado": "setEstado",
+            "cochera": "setCochera", "inquilino": "modificarInquilino", "costo": "setCosto",
+            "patioSurface": "setPatioSurface", "expenses": "setExpenses", "departmentNumber": "setDepartamentNumber",
+            "capacidad": "setCapacidad", "pileta": "setPileta", "quincho": "setQuincho", "coordenadas": "setCoordenadas"}
+
+
+class RegistroDeEventos():
+    """
+    Registro de eventos append-only ( JSONL, un evento por linea ) con snapshots periodicos de la inmobiliaria.
+
+    Se conecta como observador de una inmobiliaria y guarda altas, bajas, cambios de atributos ( estados, transferencias
+    de propietario, inquilinos, costos ) y ganancias. Cada eventosPorSnapshot eventos escribe un snapshot completo y abre un
+    nuevo segmento del registro, por lo que la recuperacion carga el ultimo snapshot y reproduce solo su segmento: el tiempo
+    de arranque queda acotado sin importar el largo del historial.
+
+    Archivos en el directorio:
+        snapshot-<n>.jsonl: encabezado ( n, ganancias, gananciasPorTipo, unique_code_seq ) y un registro por inmueble, con los eventos 1..n aplicados.
+        eventos-<n>.jsonl: eventos n+1 en adelante, hasta el siguiente snapshot.
+
+    Args:
+        directorio (str): carpeta del registro. Se crea si no existe.
+        eventosPorSnapshot (int): cantidad de eventos entre snapshots.
+
+    Methods:
+        recuperar: Reconstruye la inmobiliaria desde el ultimo snapshot y la conecta al registro.
+        snapshot: Fuerza un snapshot.
+        compactar: Borra los snapshots y segmentos anteriores al ultimo snapshot.
+        cerrar: Escribe lo pendiente y cierra el segmento actual.
+    """
+
+    def __init__(self, directorio, eventosPorSnapshot=100000):
+        if not isinstance(directorio, str):
+            raise TypeError("Error: el directorio debe ser un str")
+        if not isinstance(eventosPorSnapshot, int) or eventosPorSnapshot <= 0:
+            raise ValueError("Error: eventosPorSnapshot debe ser un entero positivo.")
+        os.makedirs(directorio, exist_ok=True)
+        self._directorio = directorio
+        self.eventosPorSnapshot = eventosPorSnapshot
+        self._inmobiliaria = None
+        self._segmento = None
+        self._secuencia = 0
+        self._inicioSegmento = 0
+        # Serializa la escritura de eventos y snapshots cuando la inmobiliaria es concurrente.
+        self._candado = Lock()
+
+    def _ruta(self, prefijo, numero):
+        return os.path.join(self._directorio, f"{prefijo}-{numero:012d}.jsonl")
+
+    def _numeros(self, prefijo):
+        numeros = []
+        for nombre in os.listdir(self._directorio):
+            if nombre.startswith(prefijo + "-") and nombre.endswith(".jsonl"):
+                numeros.append(int(nombre[len(prefijo) + 1:-len(".jsonl")]))
+        return sorted(numeros)
+
+    def recuperar(self, concurrente=False):
+        """
+            Reconstruye la inmobiliaria: carga el ultimo snapshot ( si existe ) y reproduce solo los eventos posteriores.
+
+            Args:
+                concurrente (bool): se pasa al constructor de Inmobiliaria.
+
+            Returns:
+                Inmobiliaria: la inmobiliaria recuperada, ya conectada a este registro.
+        """
+        inmobiliaria = Inmobiliaria(concurrente=concurrente)
+        propietarios = {}
+        snapshots = self._numeros("snapshot")
+        inicio = snapshots[-1] if snapshots else 0
+        self._secuencia = inicio
+
+        if snapshots:
+            with open(self._ruta("snapshot", inicio), encoding="utf-8") as archivo:
+                encabezado = json.loads(archivo.readline())
+                Inmueble.reservarCodigo(encabezado["unique_code_seq"])
+                inmobiliaria.setGanancias(encabezado["ganancias"])
+                for tipo, total in encabezado.get("gananciasPorTipo", {}).items():
+                    inmobiliaria.getAgregados().fijarGanancia(tipo, total)
+                for linea in archivo:
+                    registro = json.loads(linea)
+                    inmueble = Inmueble.desdeRegistroConfiable(registro, self._propietario(propietarios, registro))
+                    inmobiliaria.anañadirPropiedad(inmueble, registro["costo"])
+
+        ruta = self._ruta("eventos", inicio)
+        if os.path.exists(ruta):
+            with open(ruta, encoding="utf-8") as archivo:
+                for linea in archivo:
+                    if not linea.endswith("\n"):
+                        break  # Ultima linea incompleta de una escritura interrumpida.
+                    evento = json.loads(linea)
+                    self._aplicar(inmobiliaria, propietarios, evento)
+                    self._secuencia = evento["n"]
+
+        self._inicioSegmento = inicio
+        self._segmento = open(ruta, "a", encoding="utf-8")
+        self.conectar(inmobiliaria)
+        return inmobiliaria
+
+    @staticmethod
+    def _propietario(propietarios, registro):
+        propietario = propietarios.get(registro["dni"])
+        if propietario is None:
+            propietario = propietarios[registro["dni"]] = Propietario(registro["fullname"], registro["dni"])
+        return propietario
+
+    def _aplicar(self, inmobiliaria, propietarios, evento):
+        tipo = evento["e"]
+        # Todos los eventos llevan valores absolutos, por lo que reproducirlos sobre un estado que ya los incluye no lo altera.
+        if tipo == "alta":
+            registro = evento["r"]
+            if inmobiliaria.buscarPropiedad(registro["codigo"]) is None:
+                inmueble = Inmueble.desdeRegistroConfiable(registro, self._propietario(propietarios, registro))
+                inmobiliaria.anañadirPropiedad(inmueble, registro["costo"])
+        elif tipo == "baja":
+            inmobiliaria.eliminarPropiedad(evento["c"])
+        elif tipo == "ganancias":
+            inmobiliaria.setGanancias(evento["t"] - inmobiliaria.getGanancias())
+            if "tp" in evento:
+                inmobiliaria.getAgregados().fijarGanancia(evento["tp"], evento["tt"])
+        elif tipo == "cambio":
+            inmueble = inmobiliaria.buscarPropiedad(evento["c"])
+            if inmueble is None:
+                return
+            clave, valor = evento["k"], evento["v"]
+            if clave == "dni":
+                # Transferencia de propietario ( venta o cambio de dni ).
+                anterior = inmueble.getOwner()
+                nuevo = self._propietario(propietarios, {"dni": valor, "fullname": evento["f"]})
+                if nuevo is not anterior:
+                    anterior.eliminarPropiedad(inmueble.getUniquecode())
+                    inmueble.setOwner(nuevo)
+                    nuevo.añadirPropiedad(inmueble)
+            elif clave == "fullname":
+                inmueble.getOwner().setFullname(valor)
+            else:
+                getattr(inmueble, _SETTERS[clave])(valor)
+
+    def conectar(self, inmobiliaria):
+        if not isinstance(inmobiliaria, Inmobiliaria):
+            raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+        if self._segmento is None:
+            raise ValueError("Error: primero hay que llamar a recuperar().")
+        self._inmobiliaria = inmobiliaria
+        inmobiliaria.agregarObservador(self)
+
+    def __call__(self, evento, **datos):
+        if evento == "alta":
+            linea = {"e": "alta", "r": datos["inmueble"].aRegistro()}
+        elif evento == "baja":
+            linea = {"e": "baja", "c": datos["inmueble"].getUniquecode()}
+        elif evento == "ganancias":
+            linea = {"e": "ganancias", "m": datos["monto"], "t": datos["total"]}
+            if datos.get("tipo") is not None:
+                linea["tp"] = datos["tipo"]
+                linea["tt"] = self._inmobiliaria.getAgregados().gananciasPorTipo(datos["tipo"])
+        elif evento == "cambio":
+            inmueble = datos["inmueble"]
+            campo = datos["campo"]
+            if campo == "dni":
+                linea = {"e": "cambio", "c": inmueble.getUniquecode(), "k": "dni", "v": inmueble.getOwner().getDni(),
+                         "f": inmueble.getOwner().getFullname()}
+            elif campo == "coordenadas":
+                # En aRegistro son dos claves ( latitud y longitud ); el evento lleva el par, o None si se borraron.
+                linea = {"e": "cambio", "c": inmueble.getUniquecode(), "k": "coordenadas", "v": inmueble.getCoordenadas()}
+            elif campo in _CLAVES_DE_CAMPO:
+                clave = _CLAVES_DE_CAMPO[campo]
+                linea = {"e": "cambio", "c": inmueble.getUniquecode(), "k": clave, "v": inmueble.aRegistro()[clave]}
+            else:
+                return
+        else:
+            return
+
+        with self._candado:
+            self._secuencia += 1
+            linea["n"] = self._secuencia
+            self._segmento.write(json.dumps(linea, ensure_ascii=False) + "\n")
+            if self._secuencia - self._inicioSegmento >= self.eventosPorSnapshot:
+                self._escribirSnapshot()
+
+    def snapshot(self):
+        """
+            Escribe un snapshot de la inmobiliaria conectada y empieza un nuevo segmento del registro.
+
+            El snapshot se escribe en un archivo temporal y se renombra al terminar, para que una interrupcion no deje
+            un snapshot incompleto. En modo concurrente puede incluir cambios cuyos eventos quedan en el segmento siguiente;
+            como los eventos llevan valores absolutos, reproducirlos no altera el resultado.
+        """
+        with self._candado:
+            self._escribirSnapshot()
+
+    def _escribirSnapshot(self):
+        inmobiliaria = self._inmobiliaria
+        self._segmento.flush()
+        ruta = self._ruta("snapshot", self._secuencia)
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(json.dumps({"n": self._secuencia, "ganancias": inmobiliaria.getGanancias(),
+                                      "gananciasPorTipo": inmobiliaria.getAgregados().gananciasPorTipo(),
+                                      "unique_code_seq": Inmueble.unique_code_seq}) + "\n")
+            for inmueble in inmobiliaria.getlistaPropiedades():
+                archivo.write(json.dumps(inmueble.aRegistro(), ensure_ascii=False) + "\n")
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta)
+
+        self._segmento.close()
+        self._inicioSegmento = self._secuencia
+        self._segmento = open(self._ruta("eventos", self._secuencia), "a", encoding="utf-8")
+
+    def compactar(self):
+        """Borra los snapshots y segmentos anteriores al ultimo snapshot. Devuelve la cantidad de archivos borrados."""
+        snapshots = self._numeros("snapshot")
+        if not snapshots:
+            return 0
+        borrados = 0
+        for prefijo in ("snapshot", "eventos"):
+            for numero in self._numeros(prefijo):
+                if numero < snapshots[-1]:
+                    os.remove(self._ruta(prefijo, numero))
+                    borrados += 1
+        return borrados
+
+    def getSecuencia(self):
+        return self._secuencia
+
+    def confirmar(self):
+        """Escribe en disco los eventos pendientes del buffer."""
+        self._segmento.flush()
+        os.fsync(self._segmento.fileno())
+
+    def cerrar(self):
+        if self._inmobiliaria is not None:
+            self._inmobiliaria.quitarObservador(self)
+        if self._segmento is not None:
+            self.confirmar()
+            self._segmento.close()
+            self._segmento = None
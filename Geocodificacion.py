@@ -0,0 +1,105 @@
+import csv
+import os
+import re
+from bisect import bisect_right
+
+from Sistema import IndiceDeTexto, Inmobiliaria
+
+# Tabla de tramos de calles incluida con el proyecto.
+TABLA_DE_CALLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "calles.csv")
+
+
+class Geocodificador():
+    """
+    Geocodificacion local de direcciones con el formato "Calle Altura", sin servicios externos.
+
+    Usa una tabla de tramos de calles: cada fila es un tramo recto en el que las alturas desde..hasta van de
+    (latDesde, lonDesde) a (latHasta, lonHasta), y la posicion de una altura se interpola dentro de su tramo. Los nombres de
+    calle se comparan sin mayusculas ni tildes. Por defecto usa calles.csv, incluida junto a este modulo.
+
+    Args:
+        ruta (str, opcional): CSV con las columnas calle, desde, hasta, latDesde, lonDesde, latHasta y lonHasta.
+
+    Methods:
+        geocodificar: Devuelve las coordenadas de una direccion, o None si no esta en la tabla.
+        geocodificarCartera: Asigna coordenadas a los inmuebles de una inmobiliaria a partir de sus direcciones.
+    """
+
+    _direccion = re.compile(r"^\s*(.*?)\s+(\d+)\s*$")
+
+    def __init__(self, ruta=TABLA_DE_CALLES):
+        # Calle normalizada -> tramos ( desde, hasta, latDesde, lonDesde, latHasta, lonHasta ) ordenados por altura.
+        self._tramos = {}
+        with open(ruta, encoding="utf-8", newline="") as archivo:
+            for fila in csv.DictReader(archivo):
+                tramo = (int(fila["desde"]), int(fila["hasta"]), float(fila["latDesde"]), float(fila["lonDesde"]),
+                         float(fila["latHasta"]), float(fila["lonHasta"]))
+                self._tramos.setdefault(self._normalizar(fila["calle"]), []).append(tramo)
+        for tramos in self._tramos.values():
+            tramos.sort()
+        self._inicios = {calle: [tramo[0] for tramo in tramos] for calle, tramos in self._tramos.items()}
+
+    @staticmethod
+    def _normalizar(calle):
+        return " ".join(IndiceDeTexto.tokens(calle))
+
+    def geocodificar(self, direccion):
+        """
+            Ubica una direccion con el formato "Calle Altura" interpolando dentro del tramo de la calle que contiene la altura.
+
+            Returns:
+                tuple: (latitud, longitud) en grados, o None si la calle o la altura no estan en la tabla.
+
+            Raises:
+                TypeError: si la direccion no es un str.
+        """
+        if not isinstance(direccion, str):
+            raise TypeError("Error: la direccion debe ser una cadena.")
+        partes = self._direccion.match(direccion)
+        if partes is None:
+            return None
+        calle = self._normalizar(partes.group(1))
+        tramos = self._tramos.get(calle)
+        if tramos is None:
+            return None
+        altura = int(partes.group(2))
+        posicion = bisect_right(self._inicios[calle], altura) - 1
+        if posicion < 0 or altura > tramos[posicion][1]:
+            return None
+        desde, hasta, latDesde, lonDesde, latHasta, lonHasta = tramos[posicion]
+        fraccion = 0.0 if hasta == desde else (altura - desde) / (hasta - desde)
+        return (latDesde + (latHasta - latDesde) * fraccion, lonDesde + (lonHasta - lonDesde) * fraccion)
+
+    def geocodificarCartera(self, inmobiliaria, sobrescribir=False):
+        """
+            Asigna coordenadas con setCoordenadas a los inmuebles de la cartera, lo que actualiza el indice espacial.
+
+            Args:
+                inmobiliaria (Inmobiliaria): inmobiliaria cuyos inmuebles se ubican.
+                sobrescribir (bool): si es False, los inmuebles que ya tienen coordenadas no se modifican.
+
+            Returns:
+                tuple: (cantidad de inmuebles ubicados, cantidad de direcciones que no estan en la tabla).
+
+            Raises:
+                TypeError: si inmobiliaria no es una instancia de la clase Inmobiliaria.
+        """
+        if not isinstance(inmobiliaria, Inmobiliaria):
+            raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+        # Muchas propiedades comparten direccion ( departamentos de un mismo edificio ): cada una se resuelve una vez.
+        resueltas = {}
+        ubicados = 0
+        sinUbicar = 0
+        for inmueble in inmobiliaria.getlistaPropiedades():
+            if inmueble.getCoordenadas() is not None and not sobrescribir:
+                continue
+            direccion = inmueble.getAddress()
+            if direccion not in resueltas:
+                resueltas[direccion] = self.geocodificar(direccion)
+            coordenadas = resueltas[direccion]
+            if coordenadas is None:
+                sinUbicar += 1
+            else:
+                inmueble.setCoordenadas(coordenadas)
+                ubicados += 1
+        return ubicados, sinUbicar
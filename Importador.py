@@ -0,0 +1,220 @@
+import csv
+import json
+from itertools import islice
+
+from Sistema import Inmobiliaria, Inmueble, Propietario
+
+# Columnas de exportacion: primero las de la clase base y luego las propias de cada clase hija.
+COLUMNAS = ["tipo", "codigo", "coveredArea", "address", "rooms", "dni", "fullname", "estado", "cochera", "inquilino",
+            "costo", "patioSurface", "expenses", "departmentNumber", "capacidad", "pileta", "quincho", "latitud", "longitud"]
+
+# Valores por defecto de los argumentos opcionales de los constructores.
+_VALORES_POR_DEFECTO = {"rooms": 0, "estado": "en venta", "cochera": False, "inquilino": "", "costo": 0,
+                        "capacidad": 0, "pileta": True, "quincho": True}
+
+_BOOLEANOS = {"true": True, "1": True, "si": True, "sí": True, "false": False, "0": False, "no": False}
+
+
+def _numero(texto):
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def _booleano(texto):
+    try:
+        return _BOOLEANOS[texto.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Error: {texto!r} no es un valor booleano.")
+
+
+# Conversion de las celdas de texto de un CSV al tipo que esperan los constructores.
+_CONVERSORES = {"codigo": int, "coveredArea": _numero, "rooms": int, "dni": int, "cochera": _booleano, "costo": _numero,
+                "patioSurface": _numero, "expenses": _numero, "departmentNumber": int, "capacidad": int,
+                "pileta": _booleano, "quincho": _booleano, "latitud": float, "longitud": float}
+
+
+def leerCSV(archivo):
+    """
+        Genera las filas de un CSV con encabezado como diccionarios con valores ya convertidos.
+
+        Las celdas vacias se omiten, para que tomen el valor por defecto del constructor.
+
+        Args:
+            archivo: objeto de archivo de texto abierto para lectura.
+
+        Yields:
+            dict: una fila por inmueble. Si una celda no se puede convertir, la fila incluye la clave "_error".
+    """
+    for fila in csv.DictReader(archivo):
+        registro = {}
+        try:
+            for clave, valor in fila.items():
+                if valor is None or valor == "":
+                    continue
+                conversor = _CONVERSORES.get(clave)
+                registro[clave] = conversor(valor) if conversor else valor
+        except ValueError as e:
+            registro = {clave: valor for clave, valor in fila.items() if valor}
+            registro["_error"] = f"Error: columna {clave}: {e}"
+        yield registro
+
+
+def leerJSONL(archivo):
+    """
+        Genera los objetos de un archivo JSONL ( un objeto JSON por linea ). Las lineas vacias se ignoran.
+
+        Yields:
+            dict: una fila por inmueble. Si una linea no es JSON valido, la fila incluye la clave "_error".
+    """
+    for linea in archivo:
+        linea = linea.strip()
+        if not linea:
+            continue
+        try:
+            registro = json.loads(linea)
+        except ValueError as e:
+            registro = {"_error": f"Error: JSON invalido: {e}", "_linea": linea}
+        if not isinstance(registro, dict):
+            registro = {"_error": "Error: cada linea debe ser un objeto JSON.", "_linea": linea}
+        yield registro
+
+
+def construirInmueble(fila, propietarios):
+    """
+        Construye el inmueble de una fila con el constructor de la clase indicada en fila["tipo"].
+
+        Los propietarios se deduplican por dni: si el dni ya esta en el diccionario se reutiliza esa instancia.
+
+        Args:
+            fila (dict): datos del inmueble, con las claves de Inmueble.aRegistro. "codigo" se ignora.
+            propietarios (dict): dni -> Propietario, se completa con los propietarios nuevos.
+
+        Returns:
+            Inmueble: el inmueble construido, con su inquilino y sus coordenadas si la fila los indica.
+
+        Raises:
+            TypeError, ValueError: si falta un dato obligatorio o los datos no pasan las validaciones de los constructores.
+    """
+    if "_error" in fila:
+        raise ValueError(fila["_error"])
+
+    clases = {clase.__name__: clase for clase in Inmueble.__subclasses__()}
+    clase = clases.get(fila.get("tipo"))
+    if clase is None:
+        raise ValueError(f'Error: tipo de inmueble desconocido: {fila.get("tipo")}')
+
+    try:
+        dni = fila["dni"]
+        propietario = propietarios.get(dni)
+        if propietario is None:
+            propietario = Propietario(fila.get("fullname", ""), dni)
+
+        registro = dict(_VALORES_POR_DEFECTO)
+        registro.update(fila)
+        inmueble = clase._construirDesdeRegistro(registro, propietario)
+    except KeyError as e:
+        raise ValueError(f"Error: falta el dato obligatorio {e.args[0]}")
+    try:
+        if registro["inquilino"]:
+            # modificarInquilino no valida: el dato viene de un archivo y se controla aca, como en alquilarInmueble.
+            if not isinstance(registro["inquilino"], str):
+                raise TypeError("Error: el nombre del inquilino debe ser una cadena de texto.")
+            inmueble.modificarInquilino(registro["inquilino"])
+        if "latitud" in registro or "longitud" in registro:
+            inmueble.setCoordenadas((registro.get("latitud"), registro.get("longitud")))
+    except (TypeError, ValueError):
+        # La fila se rechaza: el inmueble ya construido no debe quedar en la cartera del propietario.
+        propietario.eliminarPropiedad(inmueble.getUniquecode())
+        raise
+    # El propietario nuevo se registra recien cuando su fila es valida.
+    propietarios.setdefault(dni, propietario)
+    return inmueble
+
+
+def importar(filas, inmobiliaria, rechazos=None, propietarios=None, tamañoLote=1000):
+    """
+        Importa un flujo de filas a la inmobiliaria, de a lotes y sin cargar todo el archivo en memoria.
+
+        Args:
+            filas (iterable): diccionarios, por ejemplo de leerCSV o leerJSONL.
+            inmobiliaria (Inmobiliaria): destino de los inmuebles.
+            rechazos (opcional): archivo de texto donde se escribe, como JSONL, cada fila rechazada con su numero y el error.
+            propietarios (dict, opcional): dni -> Propietario ya conocidos. Se completa con los nuevos. Por defecto se parte
+                de los propietarios registrados en la inmobiliaria, para no duplicar un dni que ya tiene inmuebles en cartera.
+            tamañoLote (int): cantidad de inmuebles que se añaden juntos a la inmobiliaria.
+
+        Returns:
+            tuple: (cantidad de inmuebles importados, cantidad de filas rechazadas).
+
+        Raises:
+            TypeError: si inmobiliaria no es una instancia de la clase Inmobiliaria.
+    """
+    if not isinstance(inmobiliaria, Inmobiliaria):
+        raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+    if propietarios is None:
+        propietarios = inmobiliaria.getPropietarios()
+
+    def construidos():
+        nonlocal rechazados
+        for numero, fila in enumerate(filas, start=1):
+            try:
+                costo = fila.get("costo", 0)
+                if "_error" in fila:
+                    raise ValueError(fila["_error"])
+                if isinstance(costo, bool) or not isinstance(costo, (int, float)) or costo < 0:
+                    raise TypeError("Error: El costo del inmueble debe estar expresado en enteros o floats positivos.")
+                inmueble = construirInmueble(fila, propietarios)
+            except (TypeError, ValueError) as e:
+                rechazados += 1
+                if rechazos is not None:
+                    datos = {clave: valor for clave, valor in fila.items() if clave != "_error"}
+                    rechazos.write(json.dumps({"fila": numero, "error": str(e), "datos": datos},
+                                              ensure_ascii=False) + "\n")
+            else:
+                yield inmueble, costo
+
+    importados = 0
+    rechazados = 0
+    pendientes = construidos()
+    while True:
+        lote = list(islice(pendientes, tamañoLote))
+        if not lote:
+            break
+        importados += inmobiliaria.anañadirPropiedades(lote)
+    return importados, rechazados
+
+
+def exportarCSV(inmuebles, archivo):
+    """
+        Escribe los inmuebles como CSV, fila por fila, sin armar la salida completa en memoria.
+
+        Args:
+            inmuebles (iterable): inmuebles a exportar, por ejemplo inmobiliaria.getlistaPropiedades().
+            archivo: objeto de archivo de texto abierto para escritura ( con newline="" ).
+
+        Returns:
+            int: cantidad de filas escritas.
+    """
+    escritor = csv.DictWriter(archivo, fieldnames=COLUMNAS, restval="")
+    escritor.writeheader()
+    cantidad = 0
+    for inmueble in inmuebles:
+        escritor.writerow(inmueble.aRegistro())
+        cantidad += 1
+    return cantidad
+
+
+def exportarJSONL(inmuebles, archivo):
+    """
+        Escribe los inmuebles como JSONL ( un objeto por linea ), sin armar la salida completa en memoria.
+
+        Returns:
+            int: cantidad de lineas escritas.
+    """
+    cantidad = 0
+    for inmueble in inmuebles:
+        archivo.write(json.dumps(inmueble.aRegistro(), ensure_ascii=False) + "\n")
+        cantidad += 1
+    return cantidad
@@ -0,0 +1,230 @@
+import cProfile
+import functools
+import os
+import pstats
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+
+from Sistema import Inmobiliaria
+
+
+class _Metrica():
+    __slots__ = ("llamadas", "errores", "segundos", "maximo", "cubetas", "recorridos", "recorridoTotal", "recorridoMaximo")
+
+    def __init__(self, cantidadCubetas):
+        self.reiniciar(cantidadCubetas)
+
+    def reiniciar(self, cantidadCubetas):
+        self.llamadas = 0
+        self.errores = 0
+        self.segundos = 0.0
+        self.maximo = 0.0
+        # Cantidad de llamadas por cubeta de latencia ( no acumulada; la ultima cubeta es +Inf ).
+        self.cubetas = [0] * cantidadCubetas
+        self.recorridos = 0
+        self.recorridoTotal = 0
+        self.recorridoMaximo = 0
+
+
+class Instrumentacion():
+    """
+    Instrumentacion opcional de las operaciones de una o mas inmobiliarias.
+
+    instrumentar() reemplaza, solo en la instancia indicada, cada operacion por una envoltura que mide la cantidad de
+    llamadas, los errores, la latencia ( como histograma ) y, en los reportes, la cantidad de inmuebles recorridos.
+    Las inmobiliarias sin instrumentar no pagan ningun costo, ya que sus metodos no cambian; desinstrumentar() las
+    devuelve a ese estado.
+
+    Args:
+        limites (iterable, opcional): limites superiores en segundos de las cubetas del histograma de latencia.
+
+    Methods:
+        instrumentar: Empieza a medir las operaciones de una inmobiliaria.
+        desinstrumentar: Deja de medir una inmobiliaria ( o todas ).
+        snapshot: Devuelve las metricas como diccionario.
+        exportarPrometheus: Escribe las metricas en formato de texto de Prometheus.
+        reiniciar: Pone las metricas en cero.
+    """
+
+    operaciones = ("venderPropiedad", "alquilarInmueble", "ponerEnVenta", "ponerEnAlquiler", "eliminarPropiedad",
+                   "anañadirPropiedad", "calcularPrecio", "calcularPreciosBatch", "datallarInmueble", "escribirReporte",
+                   "venderPropiedadesBatch", "alquilarInmueblesBatch", "ponerEnVentaBatch", "ponerEnAlquilerBatch")
+
+    # Operaciones que recorren toda la cartera: se registra cuantos inmuebles tenia al llamarlas.
+    _recorrenCartera = ("calcularPreciosBatch", "datallarInmueble", "escribirReporte")
+
+    limitesPorDefecto = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self, limites=None):
+        limites = tuple(sorted(self.limitesPorDefecto if limites is None else limites))
+        if not limites or any(isinstance(limite, bool) or not isinstance(limite, (int, float)) or limite <= 0
+                              for limite in limites):
+            raise ValueError("Error: los limites del histograma deben ser numeros positivos.")
+        self._limites = limites
+        self._metricas = {}
+        self._candado = Lock()
+        self._instrumentadas = []
+
+    def _metrica(self, operacion):
+        metrica = self._metricas.get(operacion)
+        if metrica is None:
+            metrica = self._metricas[operacion] = _Metrica(len(self._limites) + 1)
+        return metrica
+
+    def instrumentar(self, inmobiliaria):
+        """
+            Empieza a medir las operaciones de una inmobiliaria. Llamarla dos veces con la misma inmobiliaria no tiene efecto.
+
+            Raises:
+                TypeError: si inmobiliaria no es una instancia de la clase Inmobiliaria.
+        """
+        if not isinstance(inmobiliaria, Inmobiliaria):
+            raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+        if any(instrumentada is inmobiliaria for instrumentada in self._instrumentadas):
+            return
+        for operacion in self.operaciones:
+            setattr(inmobiliaria, operacion, self._envolver(inmobiliaria, operacion, getattr(inmobiliaria, operacion)))
+        self._instrumentadas.append(inmobiliaria)
+
+    def desinstrumentar(self, inmobiliaria=None):
+        """Deja de medir la inmobiliaria indicada, o todas si no se indica ninguna. Las metricas se conservan."""
+        for instrumentada in list(self._instrumentadas):
+            if inmobiliaria is None or instrumentada is inmobiliaria:
+                for operacion in self.operaciones:
+                    vars(instrumentada).pop(operacion, None)
+                self._instrumentadas.remove(instrumentada)
+
+    def _envolver(self, inmobiliaria, operacion, original):
+        metrica = self._metrica(operacion)
+        recorre = operacion in self._recorrenCartera
+        limites = self._limites
+        candado = self._candado
+        reloj = time.perf_counter
+
+        @functools.wraps(original)
+        def envoltura(*args, **kwargs):
+            recorrido = inmobiliaria.cantidadPropiedades() if recorre else None
+            error = False
+            inicio = reloj()
+            try:
+                return original(*args, **kwargs)
+            except BaseException:
+                error = True
+                raise
+            finally:
+                segundos = reloj() - inicio
+                with candado:
+                    metrica.llamadas += 1
+                    metrica.errores += error
+                    metrica.segundos += segundos
+                    if segundos > metrica.maximo:
+                        metrica.maximo = segundos
+                    metrica.cubetas[bisect_left(limites, segundos)] += 1
+                    if recorrido is not None:
+                        metrica.recorridos += 1
+                        metrica.recorridoTotal += recorrido
+                        if recorrido > metrica.recorridoMaximo:
+                            metrica.recorridoMaximo = recorrido
+
+        return envoltura
+
+    def reiniciar(self):
+        with self._candado:
+            for metrica in self._metricas.values():
+                metrica.reiniciar(len(self._limites) + 1)
+
+    def snapshot(self):
+        """
+            Devuelve las metricas acumuladas.
+
+            Returns:
+                dict: operacion -> {llamadas, errores, segundos, maximo, histograma, recorridos}. histograma es una lista de
+                      pares (limite, llamadas acumuladas) que termina en (inf, llamadas); recorridos solo aparece en las
+                      operaciones que recorren la cartera, con cantidad, total y maximo de inmuebles recorridos.
+        """
+        resultado = {}
+        with self._candado:
+            for operacion, metrica in self._metricas.items():
+                acumulado = 0
+                histograma = []
+                for limite, cantidad in zip(self._limites + (float("inf"),), metrica.cubetas):
+                    acumulado += cantidad
+                    histograma.append((limite, acumulado))
+                datos = {"llamadas": metrica.llamadas, "errores": metrica.errores, "segundos": metrica.segundos,
+                         "maximo": metrica.maximo, "histograma": histograma}
+                if operacion in self._recorrenCartera:
+                    datos["recorridos"] = {"cantidad": metrica.recorridos, "total": metrica.recorridoTotal,
+                                           "maximo": metrica.recorridoMaximo}
+                resultado[operacion] = datos
+        return resultado
+
+    def textoPrometheus(self, prefijo="inmobiliaria"):
+        """Devuelve las metricas en el formato de texto de exposicion de Prometheus."""
+        metricas = self.snapshot()
+        lineas = [f"# HELP {prefijo}_llamadas_total Llamadas por operacion.",
+                  f"# TYPE {prefijo}_llamadas_total counter"]
+        lineas += [f'{prefijo}_llamadas_total{{operacion="{operacion}"}} {datos["llamadas"]}'
+                   for operacion, datos in metricas.items()]
+        lineas += [f"# HELP {prefijo}_errores_total Llamadas que terminaron con una excepcion.",
+                   f"# TYPE {prefijo}_errores_total counter"]
+        lineas += [f'{prefijo}_errores_total{{operacion="{operacion}"}} {datos["errores"]}'
+                   for operacion, datos in metricas.items()]
+        lineas += [f"# HELP {prefijo}_latencia_segundos Latencia de cada operacion.",
+                   f"# TYPE {prefijo}_latencia_segundos histogram"]
+        for operacion, datos in metricas.items():
+            for limite, acumulado in datos["histograma"]:
+                le = "+Inf" if limite == float("inf") else repr(float(limite))
+                lineas.append(f'{prefijo}_latencia_segundos_bucket{{operacion="{operacion}",le="{le}"}} {acumulado}')
+            lineas.append(f'{prefijo}_latencia_segundos_sum{{operacion="{operacion}"}} {datos["segundos"]!r}')
+            lineas.append(f'{prefijo}_latencia_segundos_count{{operacion="{operacion}"}} {datos["llamadas"]}')
+        lineas += [f"# HELP {prefijo}_inmuebles_recorridos Inmuebles recorridos por las operaciones sobre toda la cartera.",
+                   f"# TYPE {prefijo}_inmuebles_recorridos summary"]
+        for operacion, datos in metricas.items():
+            if "recorridos" in datos:
+                lineas.append(f'{prefijo}_inmuebles_recorridos_sum{{operacion="{operacion}"}} {datos["recorridos"]["total"]}')
+                lineas.append(f'{prefijo}_inmuebles_recorridos_count{{operacion="{operacion}"}} {datos["recorridos"]["cantidad"]}')
+        return "\n".join(lineas) + "\n"
+
+    def exportarPrometheus(self, ruta, prefijo="inmobiliaria"):
+        """
+            Escribe las metricas en formato de texto de Prometheus ( por ejemplo para el textfile collector de node_exporter ).
+
+            Se escribe en un archivo temporal que se renombra al terminar, para que el lector nunca vea un archivo a medias.
+        """
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.textoPrometheus(prefijo))
+        os.replace(temporal, ruta)
+
+
+@contextmanager
+def perfilar(ruta=None, salida=None, orden="cumulative", limite=30):
+    """
+        Ejecuta el bloque con cProfile activo.
+
+        Ejemplo:
+            with perfilar("ventas.prof"):
+                for codigo in codigos:
+                    inmobiliaria.venderPropiedad(codigo, comprador)
+
+        Args:
+            ruta (str, opcional): archivo donde se guardan las estadisticas ( para pstats o snakeviz ).
+            salida (opcional): archivo de texto donde se imprime el resumen, por ejemplo sys.stdout.
+            orden (str): criterio de orden del resumen, como en pstats.
+            limite (int): cantidad de funciones del resumen.
+
+        Yields:
+            cProfile.Profile: el perfil, para inspeccionarlo al salir del bloque.
+    """
+    perfil = cProfile.Profile()
+    perfil.enable()
+    try:
+        yield perfil
+    finally:
+        perfil.disable()
+        if ruta is not None:
+            perfil.dump_stats(ruta)
+        if salida is not None:
+            pstats.Stats(perfil, stream=salida).sort_stats(orden).print_stats(limite)
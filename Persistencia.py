@@ -0,0 +1,392 @@
+import json
+import sqlite3
+import time
+import weakref
+from abc import ABCMeta, abstractmethod
+from collections.abc import Mapping
+from threading import RLock
+
+from Sistema import Inmobiliaria, Inmueble, Propietario
+
+
+class Almacenamiento(metaclass=ABCMeta):
+    """
+    Clase base abstracta para los backends de persistencia de la inmobiliaria.
+
+    Un almacenamiento se conecta a una inmobiliaria como observador: las altas, bajas, cambios de estado y ganancias
+    se acumulan como escrituras pendientes y se graban juntas al llamar a confirmar(), o automaticamente cuando
+    se alcanza tamañoLote operaciones pendientes.
+
+    Las escrituras pendientes y el acceso al backend se serializan con un candado, porque los eventos pueden llegar desde
+    varios hilos ( inmobiliaria concurrente o AsyncInmobiliaria, que muta desde su executor ).
+
+    Methods:
+        conectar: Registra el almacenamiento como observador de una inmobiliaria.
+        guardarInmobiliaria: Graba toda la cartera y las ganancias en una sola transaccion.
+        cargarInmobiliaria: Reconstruye una inmobiliaria a partir de lo almacenado, con sus ganancias totales y por tipo.
+        obtenerInmueble: Devuelve un inmueble por su codigo, hidratandolo solo si hace falta.
+        cartera: Devuelve un Mapping perezoso codigo -> Inmueble.
+        confirmar: Graba las escrituras pendientes.
+    """
+
+    tamañoLote = 1000
+
+    def __init__(self):
+        self._sucios = {}
+        self._bajas = set()
+        self._transiciones = []
+        self._ganancias = None
+        # tipo de inmueble -> ganancias acumuladas, pendientes de grabar.
+        self._gananciasPorTipo = {}
+        self._inmobiliaria = None
+        self._candado = RLock()
+        # Mapas de identidad: cada codigo o dni se hidrata una sola vez mientras siga en uso. Las referencias son debiles
+        # para que los inmuebles y propietarios que ya nadie usa se liberen en lugar de acumularse en el mapa.
+        self._inmuebles = weakref.WeakValueDictionary()
+        self._propietarios = weakref.WeakValueDictionary()
+
+    def conectar(self, inmobiliaria):
+        if not isinstance(inmobiliaria, Inmobiliaria):
+            raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+        self._inmobiliaria = inmobiliaria
+        inmobiliaria.agregarObservador(self)
+
+    def __call__(self, evento, **datos):
+        """Recibe los eventos de la inmobiliaria conectada y los acumula como escrituras pendientes."""
+        with self._candado:
+            self._registrarEvento(evento, datos)
+            if len(self._sucios) + len(self._bajas) + len(self._transiciones) >= self.tamañoLote:
+                self.confirmar()
+
+    def _registrarEvento(self, evento, datos):
+        if evento == "alta" or evento == "cambio":
+            inmueble = datos["inmueble"]
+            codigo = inmueble.getUniquecode()
+            self._bajas.discard(codigo)
+            self._sucios[codigo] = inmueble
+            self._inmuebles[codigo] = inmueble
+            if evento == "cambio" and datos["campo"] == "estado":
+                self._transiciones.append((codigo, datos["anterior"], inmueble.getEstado(), time.time()))
+        elif evento == "baja":
+            codigo = datos["inmueble"].getUniquecode()
+            self._sucios.pop(codigo, None)
+            self._inmuebles.pop(codigo, None)
+            self._bajas.add(codigo)
+        elif evento == "ganancias":
+            self._ganancias = datos["total"]
+            if datos.get("tipo") is not None:
+                self._gananciasPorTipo[datos["tipo"]] = self._inmobiliaria.getAgregados().gananciasPorTipo(datos["tipo"])
+
+    def guardarInmobiliaria(self, inmobiliaria):
+        with self._candado:
+            for inmueble in inmobiliaria.getlistaPropiedades():
+                self._sucios[inmueble.getUniquecode()] = inmueble
+                self._inmuebles[inmueble.getUniquecode()] = inmueble
+            self._ganancias = inmobiliaria.getGanancias()
+            self._gananciasPorTipo.update(inmobiliaria.getAgregados().gananciasPorTipo())
+            self.confirmar()
+
+    def cargarInmobiliaria(self):
+        """
+            Reconstruye una inmobiliaria con todos los inmuebles almacenados y la conecta a este almacenamiento.
+
+            Returns:
+                Inmobiliaria: la inmobiliaria reconstruida, con sus ganancias.
+        """
+        inmobiliaria = Inmobiliaria()
+        for inmueble in self.iterarInmuebles():
+            inmobiliaria.anañadirPropiedad(inmueble, inmueble.getCosto())
+        inmobiliaria.setGanancias(self.leerGanancias())
+        for tipo, total in self.leerGananciasPorTipo().items():
+            inmobiliaria.getAgregados().fijarGanancia(tipo, total)
+        self.conectar(inmobiliaria)
+        return inmobiliaria
+
+    def obtenerInmueble(self, codigo):
+        """
+            Devuelve el inmueble con el codigo indicado, hidratandolo desde el almacenamiento solo la primera vez.
+
+            Returns:
+                Inmueble: el inmueble, o None si no esta almacenado.
+        """
+        with self._candado:
+            inmueble = self._inmuebles.get(codigo)
+            if inmueble is None and codigo not in self._bajas:
+                registro = self._leerRegistro(codigo)
+                if registro is not None:
+                    inmueble = self._hidratar(registro)
+            return inmueble
+
+    def iterarInmuebles(self):
+        """Genera todos los inmuebles almacenados, hidratando de a uno los que todavia no estan en memoria."""
+        for registro in self._leerRegistros():
+            with self._candado:
+                inmueble = self._inmuebles.get(registro["codigo"])
+                if inmueble is None:
+                    inmueble = self._hidratar(registro)
+            yield inmueble
+
+    def cartera(self):
+        return CarteraPerezosa(self)
+
+    def _obtenerPropietario(self, dni, fullname):
+        propietario = self._propietarios.get(dni)
+        if propietario is None:
+            propietario = Propietario(fullname, dni)
+            self._propietarios[dni] = propietario
+        return propietario
+
+    def _hidratar(self, registro):
+        inmueble = Inmueble.desdeRegistroConfiable(registro, self._obtenerPropietario(registro["dni"], registro["fullname"]))
+        self._inmuebles[inmueble.getUniquecode()] = inmueble
+        return inmueble
+
+    @abstractmethod
+    def confirmar(self):
+        pass
+
+    @abstractmethod
+    def leerGanancias(self):
+        pass
+
+    @abstractmethod
+    def leerGananciasPorTipo(self):
+        pass
+
+    @abstractmethod
+    def codigos(self):
+        pass
+
+    @abstractmethod
+    def cantidad(self):
+        pass
+
+    @abstractmethod
+    def _leerRegistro(self, codigo):
+        pass
+
+    @abstractmethod
+    def _leerRegistros(self):
+        pass
+
+
+class AlmacenamientoSQLite(Almacenamiento):
+    """
+    Almacenamiento en un archivo SQLite local ( o en memoria con ruta ":memory:" ), usando el modulo sqlite3 de la libreria estandar.
+
+    Tablas:
+        propietarios: dni y nombre.
+        inmuebles: una fila por inmueble, con los atributos propios de cada clase hija en la columna extras ( JSON ). Las
+            columnas REAL devuelven float: enteros marca con un bit cada una que era int ( ver _ENTEROS ), como el
+            formato binario, para devolverla con su tipo original.
+        transiciones: historial de cambios de estado.
+        meta: ganancias, ganancias por tipo ( claves "ganancias:<tipo>" ) y ultimo codigo unico asignado.
+
+    La conexion se abre con check_same_thread=False, ya que los eventos pueden llegar desde otros hilos; el candado del
+    almacenamiento serializa su uso.
+
+    Args:
+        ruta (str): ruta del archivo de base de datos.
+    """
+
+    _esquema = """
+        CREATE TABLE IF NOT EXISTS propietarios (
+            dni INTEGER PRIMARY KEY,
+            fullname TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS inmuebles (
+            codigo INTEGER PRIMARY KEY,
+            tipo TEXT NOT NULL,
+            coveredArea REAL NOT NULL,
+            address TEXT NOT NULL,
+            rooms INTEGER NOT NULL,
+            dni INTEGER NOT NULL REFERENCES propietarios(dni),
+            estado TEXT NOT NULL,
+            cochera INTEGER NOT NULL,
+            inquilino TEXT NOT NULL,
+            costo REAL NOT NULL,
+            extras TEXT NOT NULL,
+            enteros INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS transiciones (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            codigo INTEGER NOT NULL,
+            anterior TEXT NOT NULL,
+            nuevo TEXT NOT NULL,
+            momento REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS transiciones_codigo ON transiciones(codigo);
+        CREATE TABLE IF NOT EXISTS meta (
+            clave TEXT PRIMARY KEY,
+            valor REAL NOT NULL
+        );
+    """
+
+    _columnas = ("codigo", "tipo", "coveredArea", "address", "rooms", "dni", "estado", "cochera", "inquilino", "costo")
+
+    _ENTEROS = {"coveredArea": 1, "costo": 2}
+
+    def __init__(self, ruta):
+        super().__init__()
+        if not isinstance(ruta, str):
+            raise TypeError("Error: la ruta debe ser un str")
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False)
+        self._conexion.executescript(self._esquema)
+        if "enteros" not in {fila[1] for fila in self._conexion.execute("PRAGMA table_info(inmuebles)")}:
+            # Archivo anterior a la columna: sus filas se siguen leyendo como float.
+            with self._conexion:
+                self._conexion.execute("ALTER TABLE inmuebles ADD COLUMN enteros INTEGER NOT NULL DEFAULT 0")
+        ultimo = self._leerMeta("unique_code_seq")
+        if ultimo is not None:
+            # Evita que los inmuebles nuevos repitan codigos ya almacenados.
+            Inmueble.reservarCodigo(int(ultimo))
+
+    def cerrar(self):
+        with self._candado:
+            self.confirmar()
+            self._conexion.close()
+
+    def confirmar(self):
+        """Graba en una sola transaccion todas las escrituras pendientes."""
+        with self._candado:
+            self._confirmar()
+
+    def _confirmar(self):
+        if not (self._sucios or self._bajas or self._transiciones or self._ganancias is not None or self._gananciasPorTipo):
+            return
+
+        propietarios = {}
+        filas = []
+        for inmueble in self._sucios.values():
+            registro = inmueble.aRegistro()
+            propietarios[registro["dni"]] = registro["fullname"]
+            extras = {clave: valor for clave, valor in registro.items()
+                      if clave not in self._columnas and clave != "fullname"}
+            enteros = sum(bit for campo, bit in self._ENTEROS.items() if isinstance(registro[campo], int))
+            filas.append(tuple(registro[columna] for columna in self._columnas) + (json.dumps(extras), enteros))
+
+        with self._conexion:
+            self._conexion.executemany("INSERT OR REPLACE INTO propietarios (dni, fullname) VALUES (?, ?)",
+                                       propietarios.items())
+            self._conexion.executemany(
+                f"INSERT OR REPLACE INTO inmuebles ({', '.join(self._columnas)}, extras, enteros) "
+                f"VALUES ({', '.join('?' * 12)})",
+                filas)
+            self._conexion.executemany("DELETE FROM inmuebles WHERE codigo = ?", ((codigo,) for codigo in self._bajas))
+            self._conexion.executemany("INSERT INTO transiciones (codigo, anterior, nuevo, momento) VALUES (?, ?, ?, ?)",
+                                       self._transiciones)
+            if self._ganancias is not None:
+                self._escribirMeta("ganancias", self._ganancias)
+            for tipo, total in self._gananciasPorTipo.items():
+                self._escribirMeta("ganancias:" + tipo, total)
+            self._escribirMeta("unique_code_seq", Inmueble.unique_code_seq)
+
+        self._sucios = {}
+        self._bajas = set()
+        self._transiciones = []
+        self._ganancias = None
+        self._gananciasPorTipo = {}
+
+    def _leerMeta(self, clave):
+        with self._candado:
+            fila = self._conexion.execute("SELECT valor FROM meta WHERE clave = ?", (clave,)).fetchone()
+        return None if fila is None else fila[0]
+
+    def _escribirMeta(self, clave, valor):
+        self._conexion.execute("INSERT OR REPLACE INTO meta (clave, valor) VALUES (?, ?)", (clave, valor))
+
+    def leerGanancias(self):
+        if self._ganancias is not None:
+            return self._ganancias
+        ganancias = self._leerMeta("ganancias")
+        return 0 if ganancias is None else ganancias
+
+    def leerGananciasPorTipo(self):
+        """
+            Devuelve las ganancias acumuladas por tipo de inmueble.
+
+            Returns:
+                dict: tipo de inmueble -> ganancias.
+        """
+        with self._candado:
+            self.confirmar()
+            filas = self._conexion.execute("SELECT clave, valor FROM meta WHERE clave LIKE 'ganancias:%'").fetchall()
+        return {clave[len("ganancias:"):]: valor for clave, valor in filas}
+
+    def codigos(self):
+        with self._candado:
+            self.confirmar()
+            return [fila[0] for fila in self._conexion.execute("SELECT codigo FROM inmuebles ORDER BY codigo")]
+
+    def cantidad(self):
+        with self._candado:
+            self.confirmar()
+            return self._conexion.execute("SELECT COUNT(*) FROM inmuebles").fetchone()[0]
+
+    def historialDeEstados(self, codigo):
+        """
+            Devuelve las transiciones de estado almacenadas de un inmueble.
+
+            Returns:
+                list: tuplas (anterior, nuevo, momento) en orden cronologico.
+        """
+        with self._candado:
+            self.confirmar()
+            return self._conexion.execute("SELECT anterior, nuevo, momento FROM transiciones WHERE codigo = ? ORDER BY id",
+                                          (codigo,)).fetchall()
+
+    def _aRegistro(self, fila):
+        registro = dict(zip(self._columnas, fila[:10]))
+        registro["fullname"] = fila[10]
+        registro["cochera"] = bool(registro["cochera"])
+        registro.update(json.loads(fila[11]))
+        for campo, bit in self._ENTEROS.items():
+            if fila[12] & bit:
+                registro[campo] = int(registro[campo])
+        return registro
+
+    def _consulta(self):
+        columnas = ", ".join(f"i.{columna}" for columna in self._columnas)
+        return f"SELECT {columnas}, p.fullname, i.extras, i.enteros FROM inmuebles i JOIN propietarios p ON p.dni = i.dni"
+
+    def _leerRegistro(self, codigo):
+        with self._candado:
+            self.confirmar()
+            fila = self._conexion.execute(self._consulta() + " WHERE i.codigo = ?", (codigo,)).fetchone()
+        return None if fila is None else self._aRegistro(fila)
+
+    def _leerRegistros(self):
+        with self._candado:
+            self.confirmar()
+            cursor = self._conexion.execute(self._consulta() + " ORDER BY i.codigo")
+        while True:
+            # El candado se toma por tanda y no durante todo el recorrido, que se consume de a poco.
+            with self._candado:
+                filas = cursor.fetchmany(self.tamañoLote)
+            if not filas:
+                break
+            for fila in filas:
+                yield self._aRegistro(fila)
+
+
+class CarteraPerezosa(Mapping):
+    """
+    Vista de solo lectura codigo -> Inmueble sobre un almacenamiento.
+
+    Los inmuebles se hidratan recien cuando se accede a ellos.
+    """
+
+    def __init__(self, almacenamiento):
+        self._almacenamiento = almacenamiento
+
+    def __getitem__(self, codigo):
+        inmueble = self._almacenamiento.obtenerInmueble(codigo)
+        if inmueble is None:
+            raise KeyError(codigo)
+        return inmueble
+
+    def __iter__(self):
+        return iter(self._almacenamiento.codigos())
+
+    def __len__(self):
+        return self._almacenamiento.cantidad()
@@ -0,0 +1,179 @@
+import math
+from array import array
+from operator import attrgetter, mul
+
+from Sistema import Inmobiliaria, Inmueble
+
+# Caracteristica de una regla -> atributo del inmueble que la contiene.
+_ATRIBUTOS = {"coveredArea": "_coveredArea", "rooms": "_rooms", "cochera": "_cochera", "patioSurface": "_patioSurface",
+              "expenses": "_expenses", "capacidad": "_capacidad", "pileta": "_pileta", "quincho": "_quincho"}
+
+# Regla base: monto por unidad de area cubierta y cochera, la misma que usa Inmobiliaria.calcularPrecio.
+REGLA_BASE = {"coveredArea": 500, "cochera": 500}
+
+
+def _clasePorNombre(nombre):
+    # Busca entre Inmueble y todas sus clases hijas ( no solo las directas ) la que tiene ese nombre.
+    pendientes = [Inmueble]
+    while pendientes:
+        clase = pendientes.pop()
+        if clase.__name__ == nombre:
+            return clase
+        pendientes.extend(clase.__subclasses__())
+    return None
+
+
+def _sumaPonderada(atributos, coeficientes):
+    # Funcion inmueble -> suma de atributo * coeficiente. Las tablas tienen pocos terminos, asi que hasta cuatro se arma una
+    # expresion fija con un attrgetter por atributo; con mas se leen todos juntos y se suman los productos.
+    lectores = [attrgetter(atributo) for atributo in atributos]
+    if not lectores:
+        return lambda inmueble: 0.0
+    if len(lectores) == 1:
+        (a,), (ca,) = lectores, coeficientes
+        return lambda inmueble: a(inmueble) * ca
+    if len(lectores) == 2:
+        (a, b), (ca, cb) = lectores, coeficientes
+        return lambda inmueble: a(inmueble) * ca + b(inmueble) * cb
+    if len(lectores) == 3:
+        (a, b, c), (ca, cb, cc) = lectores, coeficientes
+        return lambda inmueble: a(inmueble) * ca + b(inmueble) * cb + c(inmueble) * cc
+    if len(lectores) == 4:
+        (a, b, c, d), (ca, cb, cc, cd) = lectores, coeficientes
+        return lambda inmueble: a(inmueble) * ca + b(inmueble) * cb + c(inmueble) * cc + d(inmueble) * cd
+    leer = attrgetter(*atributos)
+    return lambda inmueble: sum(map(mul, leer(inmueble), coeficientes))
+
+
+class MotorDePrecios():
+    """
+    Motor de precios con una tabla de reglas por tipo de inmueble.
+
+    Cada regla asigna un monto por unidad a caracteristicas del inmueble ( area cubierta, cochera, superficie de patio,
+    expensas, capacidad, pileta, quincho ). Al crear el motor cada tabla se compila una sola vez en una funcion que lee
+    los atributos juntos y los multiplica por coeficientes ya afectados por el costo de gestion, sin busquedas en
+    diccionarios por inmueble. A diferencia de calcularPrecio, devuelve numeros.
+
+    La regla de "Inmueble" es la base ( por defecto REGLA_BASE, la de calcularPrecio ). Las tablas de las clases hijas
+    indican sus caracteristicas propias y se suman a la base, cuyos montos pueden reemplazar. Los tipos sin tabla propia
+    usan la de su clase padre mas cercana con tabla ( como minimo la base ). El motor no supone montos para las
+    caracteristicas propias de cada clase hija: se configuran en reglas.
+
+    Args:
+        reglas (dict): nombre de clase -> {caracteristica: monto por unidad}. Puede ser {} para valorar todo con la base.
+        costoDeGestionventa (int or float): porcentaje que se suma al precio, como en calcularPrecio.
+
+    Raises:
+        TypeError: si una tabla no es un diccionario o un monto no es un entero o float finito.
+        ValueError: si una regla es de una clase que no es Inmueble ni una de sus clases hijas, o usa una caracteristica
+            desconocida o que esa clase no tiene ( por ejemplo patioSurface en Salon ).
+
+    Methods:
+        desdeInmobiliaria: Crea un motor con los parametros de una inmobiliaria.
+        precio: Devuelve el precio sugerido de un inmueble.
+        precios: Devuelve los precios de muchos inmuebles como array('d').
+        valorarCartera: Devuelve los precios de toda la cartera de una inmobiliaria.
+    """
+
+    def __init__(self, reglas, costoDeGestionventa=Inmobiliaria.costoDeGestionventa):
+        if not isinstance(reglas, dict):
+            raise TypeError("Error: reglas debe ser un diccionario nombre de clase -> tabla.")
+        if isinstance(costoDeGestionventa, bool) or not isinstance(costoDeGestionventa, (int, float)):
+            raise TypeError("Error: costoDeGestionventa debe ser un entero o float.")
+        base = reglas.get("Inmueble", REGLA_BASE)
+        if not isinstance(base, dict):
+            raise TypeError("Error: cada regla debe ser un diccionario caracteristica -> monto.")
+        self._reglas = {"Inmueble": dict(base)}
+        for nombre, tabla in reglas.items():
+            if not isinstance(tabla, dict):
+                raise TypeError("Error: cada regla debe ser un diccionario caracteristica -> monto.")
+            if nombre != "Inmueble":
+                self._reglas[nombre] = dict(base, **tabla)
+        for nombre, tabla in self._reglas.items():
+            self._validarRegla(nombre, tabla)
+        self._factor = 1 + costoDeGestionventa
+        self._compilados = {nombre: self._compilar(tabla) for nombre, tabla in self._reglas.items()}
+        # type -> funcion, se completa a medida que aparecen tipos.
+        self._porTipo = {}
+
+    @classmethod
+    def desdeInmobiliaria(cls, inmobiliaria, reglas):
+        """Crea un motor cuya base ( area cubierta y cochera ) usa metroCuadrado y precioCochera de la inmobiliaria."""
+        if not isinstance(inmobiliaria, Inmobiliaria):
+            raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+        if not isinstance(reglas, dict):
+            raise TypeError("Error: reglas debe ser un diccionario nombre de clase -> tabla.")
+        tablas = dict(reglas)
+        tablas["Inmueble"] = dict(reglas.get("Inmueble", {}), coveredArea=inmobiliaria.metroCuadrado,
+                                  cochera=inmobiliaria.precioCochera)
+        return cls(tablas, inmobiliaria.costoDeGestionventa)
+
+    @staticmethod
+    def _validarRegla(nombre, tabla):
+        # Se valida al crear el motor: una regla mal escrita no debe pasar inadvertida hasta que aparezca un inmueble de esa clase.
+        clase = _clasePorNombre(nombre)
+        if clase is None:
+            raise ValueError(f"Error: la regla {nombre} no corresponde a Inmueble ni a ninguna de sus clases hijas.")
+        for caracteristica in tabla:
+            if caracteristica not in _ATRIBUTOS:
+                raise ValueError(f"Error: caracteristica de precio desconocida: {caracteristica}")
+            if not hasattr(clase, _ATRIBUTOS[caracteristica]):
+                raise ValueError(f"Error: {nombre} no tiene la caracteristica {caracteristica}.")
+
+    def _compilar(self, tabla):
+        if not isinstance(tabla, dict):
+            raise TypeError("Error: cada regla debe ser un diccionario caracteristica -> monto.")
+        atributos = []
+        coeficientes = []
+        for caracteristica, monto in tabla.items():
+            if isinstance(monto, bool) or not isinstance(monto, (int, float)) or not math.isfinite(monto):
+                raise TypeError(f"Error: el monto de {caracteristica} debe ser un entero o float finito.")
+            if monto:
+                atributos.append(_ATRIBUTOS[caracteristica])
+                coeficientes.append(float(monto) * self._factor)
+        return _sumaPonderada(tuple(atributos), tuple(coeficientes))
+
+    def _funcionDe(self, tipo):
+        funcion = self._porTipo.get(tipo)
+        if funcion is None:
+            if not (isinstance(tipo, type) and issubclass(tipo, Inmueble)):
+                raise TypeError("Error: solo se pueden valorar instancias de la clase Inmueble.")
+            for clase in tipo.__mro__:
+                if clase.__name__ in self._compilados:
+                    funcion = self._porTipo[tipo] = self._compilados[clase.__name__]
+                    break
+        return funcion
+
+    def precio(self, inmueble):
+        """
+            Devuelve el precio sugerido de un inmueble, mas costos de gestion.
+
+            Returns:
+                float: precio segun la regla de su tipo.
+
+            Raises:
+                TypeError: si inmueble no es una instancia de la clase Inmueble.
+        """
+        return float(self._funcionDe(type(inmueble))(inmueble))
+
+    def precios(self, inmuebles):
+        """
+            Devuelve los precios sugeridos de muchos inmuebles, en el mismo orden.
+
+            Returns:
+                array: precios como array('d').
+        """
+        porTipo = self._porTipo
+        funcionDe = self._funcionDe
+        return array("d", [(porTipo.get(type(inmueble)) or funcionDe(type(inmueble)))(inmueble) for inmueble in inmuebles])
+
+    def valorarCartera(self, inmobiliaria):
+        """
+            Devuelve los precios sugeridos de toda la cartera.
+
+            Returns:
+                array: precios como array('d'), en el orden de inmobiliaria.getlistaPropiedades().
+        """
+        if not isinstance(inmobiliaria, Inmobiliaria):
+            raise TypeError("Error: inmobiliaria debe ser una instancia de la clase Inmobiliaria.")
+        return self.precios(inmobiliaria.getlistaPropiedades())
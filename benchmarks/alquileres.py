@@ -0,0 +1,56 @@
+"""
+Benchmark del libro de alquileres: carga de contratos y pagos, y consultas de vencimientos del mes, deuda por propietario
+e ingresos mensuales contra recorridos lineales de los mismos datos.
+
+Uso: python benchmarks/alquileres.py [contratos] [pagosPorContrato]   ( por defecto 200000 y 12, 2.4 millones de pagos )
+"""
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from generador import SEMILLA, generarCartera
+from Alquileres import LibroDeAlquileres
+
+CONSULTAS = 1000
+
+
+def medirConsulta(consulta, argumentos):
+    inicio = time.perf_counter()
+    for argumento in argumentos:
+        consulta(*argumento)
+    return (time.perf_counter() - inicio) / len(argumentos) * 1e6
+
+
+def main(cantidad, pagosPorContrato):
+    azar = random.Random(SEMILLA)
+    inmobiliaria, inmuebles = generarCartera(cantidad)
+    libro = LibroDeAlquileres(inmobiliaria)
+    pagos = []
+    inicio = time.perf_counter()
+    for inmueble in inmuebles:
+        desde = date(2020, 1, 1) + timedelta(days=azar.randrange(1500))
+        contrato = libro.registrarContrato(inmueble.getUniquecode(), "Inquilino", desde,
+                                           desde + timedelta(days=azar.randrange(365, 1100)), azar.randrange(100, 2000))
+        for cuota in range(pagosPorContrato):
+            fecha = desde + timedelta(days=30 * cuota + azar.randrange(20))
+            libro.registrarPago(contrato.getNumero(), contrato.getMontoMensual(), fecha)
+            pagos.append((fecha, contrato.getMontoMensual()))
+    print(f"{cantidad} contratos, {libro.cantidadPagos()} pagos: carga {time.perf_counter() - inicio:.2f} s")
+
+    meses = [(2021 + azar.randrange(4), azar.randrange(1, 13)) for _ in range(CONSULTAS)]
+    print(f"  contratos que vencen en el mes: {medirConsulta(libro.contratosQueVencenEnMes, meses):.0f} us por consulta")
+    dnis = [(azar.choice(inmuebles).getOwner().getDni(), date(2023, 6, 30)) for _ in range(CONSULTAS)]
+    print(f"  deuda de un propietario: {medirConsulta(libro.deudaDePropietario, dnis):.0f} us por consulta")
+    periodos = [(date(año, mes, 1), date(año + 1, mes, 1)) for año, mes in meses]
+    print(f"  ingresos de un periodo de 12 meses: {medirConsulta(libro.ingresosEntre, periodos):.1f} us por consulta")
+    print(f"  serie mensual de 12 meses: {medirConsulta(libro.ingresosMensuales, periodos):.1f} us por consulta")
+
+    desde, hasta = periodos[0]
+    inicio = time.perf_counter()
+    sum(monto for fecha, monto in pagos if desde <= fecha < hasta)
+    print(f"  ingresos de un periodo recorriendo los pagos: {(time.perf_counter() - inicio) * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000, int(sys.argv[2]) if len(sys.argv) > 2 else 12)
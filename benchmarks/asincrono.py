@@ -0,0 +1,76 @@
+"""
+Generador de carga local para AsyncInmobiliaria: latencia p50 y p99 con clientes concurrentes.
+
+Cada cliente hace una mezcla de lecturas por codigo, busquedas, ventas, alquileres y calculos de precio sobre la misma cartera.
+
+Uso: python benchmarks/asincrono.py [cantidad]   ( por defecto 100000 inmuebles )
+"""
+import asyncio
+import random
+import sys
+import time
+
+from generador import SEMILLA, generarCartera, generarPropietarios
+from Asincrono import AsyncInmobiliaria
+from Sistema import Inmobiliaria
+
+CLIENTES = [1, 10, 100, 1000]
+OPERACIONES_POR_CLIENTE = 200
+
+
+def percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+async def cliente(agencia, codigos, compradores, azar, latencias):
+    for numero in range(OPERACIONES_POR_CLIENTE):
+        codigo = azar.choice(codigos)
+        operacion = azar.random()
+        inicio = time.perf_counter()
+        if operacion < 0.6:
+            tipo = "lectura"
+            await agencia.buscarPropiedad(codigo)
+        elif operacion < 0.75:
+            tipo = "venta"
+            await agencia.ponerEnVenta(codigo)
+            await agencia.venderPropiedad(codigo, azar.choice(compradores))
+        elif operacion < 0.9:
+            tipo = "alquiler"
+            await agencia.ponerEnAlquiler(codigo)
+            await agencia.alquilarInmueble(codigo, f"Inquilino {numero}")
+        elif operacion < 0.98:
+            tipo = "busqueda"
+            await agencia.buscar(area=(100, 101), estado="en venta")
+        else:
+            tipo = "precio"
+            await agencia.calcularPreciosBatch(azar.sample(codigos, 100))
+        latencias.setdefault(tipo, []).append(time.perf_counter() - inicio)
+
+
+async def correr(cantidad, clientes):
+    inmobiliaria, inmuebles = generarCartera(cantidad, inmobiliaria=Inmobiliaria(concurrente=True))
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+    compradores = generarPropietarios(50)
+    latencias = {}
+    async with AsyncInmobiliaria(inmobiliaria) as agencia:
+        inicio = time.perf_counter()
+        await asyncio.gather(*(cliente(agencia, codigos, compradores, random.Random(SEMILLA + numero), latencias)
+                               for numero in range(clientes)))
+        tiempo = time.perf_counter() - inicio
+    return tiempo, latencias
+
+
+def main(cantidad):
+    print(f"{cantidad} inmuebles, {OPERACIONES_POR_CLIENTE} operaciones por cliente")
+    for clientes in CLIENTES:
+        tiempo, latencias = asyncio.run(correr(cantidad, clientes))
+        todas = [valor for valores in latencias.values() for valor in valores]
+        print(f"  {clientes} clientes: {len(todas) / tiempo:,.0f} ops/s, p50 {percentil(todas, 50) * 1000:.3f} ms,"
+              f" p99 {percentil(todas, 99) * 1000:.3f} ms")
+        for tipo, valores in sorted(latencias.items()):
+            print(f"    {tipo}: p50 {percentil(valores, 50) * 1000:.3f} ms, p99 {percentil(valores, 99) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
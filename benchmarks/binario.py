@@ -0,0 +1,53 @@
+"""
+Benchmark del snapshot binario: escritura, apertura con mmap, accesos aleatorios y carga completa de la cartera.
+
+La apertura solo lee el encabezado, por lo que su tiempo no depende de la cantidad de inmuebles; la carga completa
+materializa cada inmueble con sus validaciones y sirve de referencia.
+
+Uso: python benchmarks/binario.py [cantidad]   ( por defecto 1000000 )
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from generador import SEMILLA, generarCartera
+from Binario import SnapshotBinario, escribirSnapshotBinario
+
+ACCESOS = 10000
+
+
+def main(cantidad):
+    inmobiliaria, inmuebles = generarCartera(cantidad)
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+    ruta = os.path.join(tempfile.mkdtemp(prefix="binario-"), "cartera.bin")
+    try:
+        inicio = time.perf_counter()
+        escribirSnapshotBinario(inmobiliaria, ruta)
+        print(f"{cantidad} inmuebles: escritura {time.perf_counter() - inicio:.2f} s,"
+              f" {os.path.getsize(ruta) / cantidad:.0f} bytes por inmueble")
+
+        inicio = time.perf_counter()
+        snapshot = SnapshotBinario(ruta)
+        print(f"  apertura: {(time.perf_counter() - inicio) * 1000:.3f} ms")
+
+        azar = random.Random(SEMILLA)
+        muestra = [azar.choice(codigos) for _ in range(ACCESOS)]
+        inicio = time.perf_counter()
+        for codigo in muestra:
+            assert snapshot[codigo].getUniquecode() == codigo
+        print(f"  {ACCESOS} accesos aleatorios: {(time.perf_counter() - inicio) / ACCESOS * 1e6:.1f} us por acceso")
+
+        inicio = time.perf_counter()
+        cargada = snapshot.cargarInmobiliaria()
+        print(f"  carga completa: {time.perf_counter() - inicio:.2f} s")
+        assert len(cargada.getlistaPropiedades()) == cantidad
+        snapshot.cerrar()
+    finally:
+        os.remove(ruta)
+        os.rmdir(os.path.dirname(ruta))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,68 @@
+"""
+Benchmark de Inmobiliaria.calcularPreciosBatch sobre las columnas, contra calcularPrecio en un bucle ( que arma una cadena
+que hay que volver a convertir ) y contra la misma formula recorriendo los objetos Inmueble.
+
+Mide la pasada con NumPy, si esta instalado, y la alternativa en Python puro. Verifica que todos den los mismos precios
+( calcularPrecio suma el costo de gestion en lugar de multiplicar por 1 + costo, por lo que puede variar el ultimo decimal ).
+
+Uso: python benchmarks/columnas.py [cantidad ...]   ( por defecto 100000 1000000 )
+"""
+import statistics
+import sys
+import time
+
+from generador import generarCartera
+import Sistema
+
+REPETICIONES = 5
+
+
+def medir(funcion):
+    tiempos = []
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos), resultado
+
+
+def iguales(precios, esperados):
+    return len(precios) == len(esperados) and all(abs(precio - esperado) <= 1e-9 * abs(esperado)
+                                                  for precio, esperado in zip(precios, esperados))
+
+
+def main(cantidades):
+    for cantidad in cantidades:
+        inmobiliaria, _ = generarCartera(cantidad)
+        columnas = inmobiliaria.getColumnas()
+        # Mismo orden que las columnas, para comparar los resultados.
+        inmuebles = [inmobiliaria.buscarPropiedad(codigo) for codigo in columnas.codigos]
+        factor = 1 + inmobiliaria.costoDeGestionventa
+        metroCuadrado = inmobiliaria.metroCuadrado
+        precioCochera = inmobiliaria.precioCochera
+        print(f"{cantidad} inmuebles ( NumPy {'si' if Sistema.numpy is not None else 'no'} )")
+
+        base, esperado = medir(lambda: [float(inmobiliaria.calcularPrecio(inmueble).rsplit(":", 1)[1])
+                                        for inmueble in inmuebles])
+        print(f"  calcularPrecio en bucle: {base * 1000:.1f} ms")
+        objetos, precios = medir(lambda: [(inmueble.getCoveredArea() * metroCuadrado
+                                           + precioCochera * inmueble.getCochera()) * factor for inmueble in inmuebles])
+        assert iguales(precios, esperado)
+        print(f"  formula sobre los objetos: {objetos * 1000:.1f} ms, x{base / objetos:.1f}")
+
+        numpy = Sistema.numpy
+        Sistema.numpy = None
+        try:
+            puro, precios = medir(inmobiliaria.calcularPreciosBatch)
+        finally:
+            Sistema.numpy = numpy
+        assert iguales(precios, esperado)
+        print(f"  calcularPreciosBatch, Python puro: {puro * 1000:.1f} ms, x{base / puro:.1f}")
+        if numpy is not None:
+            vectorizado, precios = medir(inmobiliaria.calcularPreciosBatch)
+            assert iguales(precios, esperado)
+            print(f"  calcularPreciosBatch, NumPy: {vectorizado * 1000:.1f} ms, x{base / vectorizado:.1f}")
+
+
+if __name__ == "__main__":
+    main([int(argumento) for argumento in sys.argv[1:]] or [100000, 1000000])
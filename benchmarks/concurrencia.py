@@ -0,0 +1,97 @@
+"""
+Benchmark de estres del modo concurrente de Inmobiliaria: throughput de ventas y alquileres a medida que crece la cantidad de hilos.
+
+Cada corrida reparte inmuebles distintos entre los hilos ( no compiten por el mismo candado ) y al final verifica que las
+ganancias coincidan con las esperadas. Una segunda prueba hace competir a todos los hilos por los mismos inmuebles y verifica
+que cada uno se venda una sola vez.
+
+Uso: python benchmarks/concurrencia.py [cantidad]   ( por defecto 100000 )
+"""
+import sys
+import threading
+import time
+
+from generador import generarCartera, generarPropietarios
+from Sistema import Inmobiliaria
+
+HILOS = [1, 2, 4, 8, 16]
+
+
+def cartera(cantidad, concurrente):
+    inmobiliaria, inmuebles = generarCartera(cantidad, inmobiliaria=Inmobiliaria(concurrente=concurrente))
+    return inmobiliaria, [inmueble.getUniquecode() for inmueble in inmuebles]
+
+
+def operar(inmobiliaria, codigos, compradores, desde=0):
+    for numero, codigo in enumerate(codigos, start=desde):
+        if numero % 2:
+            inmobiliaria.ponerEnAlquiler(codigo)
+            inmobiliaria.alquilarInmueble(codigo, f"Inquilino {numero}")
+        else:
+            inmobiliaria.ponerEnVenta(codigo)
+            inmobiliaria.venderPropiedad(codigo, compradores[numero % len(compradores)])
+
+
+def esperadas(inmobiliaria, codigos):
+    total = 0
+    for numero, codigo in enumerate(codigos):
+        costo = inmobiliaria.buscarPropiedad(codigo).getCosto()
+        total += costo * (inmobiliaria.costoDeGestionAlquiler if numero % 2 else inmobiliaria.costoDeGestionventa)
+    return total
+
+
+def correr(inmobiliaria, codigos, hilos, compradores):
+    porcion = (len(codigos) + hilos - 1) // hilos
+    trabajos = [threading.Thread(target=operar, args=(inmobiliaria, codigos[inicio:inicio + porcion], compradores, inicio))
+                for inicio in range(0, len(codigos), porcion)]
+    inicio = time.perf_counter()
+    for trabajo in trabajos:
+        trabajo.start()
+    for trabajo in trabajos:
+        trabajo.join()
+    return time.perf_counter() - inicio
+
+
+def competir(cantidad, hilos):
+    inmobiliaria, codigos = cartera(cantidad, True)
+    compradores = generarPropietarios(hilos)
+    vendidas = [0] * hilos
+
+    def vender(numero):
+        for codigo in codigos:
+            inmobiliaria.ponerEnVenta(codigo)
+            if inmobiliaria.venderPropiedad(codigo, compradores[numero]):
+                vendidas[numero] += 1
+
+    trabajos = [threading.Thread(target=vender, args=(numero,)) for numero in range(hilos)]
+    for trabajo in trabajos:
+        trabajo.start()
+    for trabajo in trabajos:
+        trabajo.join()
+    # Una venta deja el inmueble en "vendido" y ponerEnVenta lo puede reabrir, pero cada reventa pasa por el candado del inmueble.
+    propias = sum(comprador.cantidadPropiedades() for comprador in compradores)
+    assert propias == len(codigos), "Transferencias inconsistentes entre propietarios"
+    return sum(vendidas)
+
+
+def main(cantidad):
+    compradores = generarPropietarios(50)
+    inmobiliaria, codigos = cartera(cantidad, False)
+    esperado = esperadas(inmobiliaria, codigos)
+    tiempo = correr(inmobiliaria, codigos, 1, compradores)
+    print(f"{cantidad} inmuebles, 2 operaciones por inmueble")
+    print(f"  sin modo concurrente, 1 hilo: {2 * cantidad / tiempo:,.0f} ops/s")
+
+    for hilos in HILOS:
+        inmobiliaria, codigos = cartera(cantidad, True)
+        esperado = esperadas(inmobiliaria, codigos)
+        tiempo = correr(inmobiliaria, codigos, hilos, compradores)
+        assert abs(inmobiliaria.getGanancias() - esperado) < 1e-6 * max(1, esperado), "Ganancias inconsistentes"
+        print(f"  concurrente, {hilos} hilos: {2 * cantidad / tiempo:,.0f} ops/s")
+
+    ventas = competir(min(cantidad, 10000), 8)
+    print(f"  8 hilos compitiendo por {min(cantidad, 10000)} inmuebles: {ventas} ventas, transferencias consistentes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
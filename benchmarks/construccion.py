@@ -0,0 +1,35 @@
+"""
+Microbenchmark de construccion de inmuebles desde registros: Inmueble.desdeRegistro ( constructores con validaciones )
+contra Inmueble.desdeRegistroConfiable ( sin validaciones, para datos del propio almacenamiento ).
+
+Uso: python benchmarks/construccion.py [cantidad]   ( por defecto 200000 )
+"""
+import sys
+import time
+
+from generador import generarInmuebles
+from Sistema import Inmueble, Propietario
+
+
+def medir(construir, registros):
+    propietario = Propietario("Propietario", 1)
+    inicio = time.perf_counter()
+    for registro in registros:
+        construir(registro, propietario)
+    return len(registros) / (time.perf_counter() - inicio)
+
+
+def main(cantidad):
+    porTipo = {}
+    for inmueble in generarInmuebles(cantidad):
+        porTipo.setdefault(type(inmueble).__name__, []).append(inmueble.aRegistro())
+
+    print(f"{cantidad} registros, objetos por segundo")
+    for tipo, registros in sorted(porTipo.items()):
+        validado = medir(Inmueble.desdeRegistro, registros)
+        confiable = medir(Inmueble.desdeRegistroConfiable, registros)
+        print(f"  {tipo}: desdeRegistro {validado:,.0f}, desdeRegistroConfiable {confiable:,.0f}, x{confiable / validado:.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
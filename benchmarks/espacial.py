@@ -0,0 +1,58 @@
+"""
+Benchmark del indice espacial: busquedas por radio y por recuadro con filtros de estado y tipo, contra un recorrido
+lineal de la cartera, para varios tamaños.
+
+Los inmuebles se ubican al azar dentro de una region de 3 x 3 grados, por lo que la densidad crece con la cartera: el
+tiempo de consulta acompaña a la cantidad de resultados y no a la cantidad de inmuebles recorridos.
+
+Uso: python benchmarks/espacial.py [cantidad ...]   ( por defecto 100000 1000000 )
+"""
+import random
+import sys
+import time
+
+from generador import SEMILLA, generarCartera
+from Sistema import IndiceEspacial
+
+CONSULTAS = 200
+RADIO_KM = 2
+REGION = (-36.0, -60.0, -33.0, -57.0)
+
+
+def buscarLineal(inmobiliaria, latitud, longitud, radioKm, estado):
+    return [inmueble for inmueble in inmobiliaria.getlistaPropiedades()
+            if inmueble.getEstado() == estado and type(inmueble).__name__ == "Casa"
+            and IndiceEspacial.distancia((latitud, longitud), inmueble.getCoordenadas()) <= radioKm]
+
+
+def medir(cantidad):
+    azar = random.Random(SEMILLA)
+    latMin, lonMin, latMax, lonMax = REGION
+    inmobiliaria, inmuebles = generarCartera(cantidad)
+    inicio = time.perf_counter()
+    for inmueble in inmuebles:
+        inmueble.setCoordenadas((azar.uniform(latMin, latMax), azar.uniform(lonMin, lonMax)))
+    print(f"{cantidad} inmuebles: ubicacion e indexado {time.perf_counter() - inicio:.2f} s")
+
+    centros = [(azar.uniform(latMin, latMax), azar.uniform(lonMin, lonMax)) for _ in range(CONSULTAS)]
+    inicio = time.perf_counter()
+    encontrados = sum(len(inmobiliaria.buscarCercanos(latitud, longitud, RADIO_KM, estado="en venta", tipo="Casa"))
+                      for latitud, longitud in centros)
+    porConsulta = (time.perf_counter() - inicio) / CONSULTAS
+    print(f"  radio {RADIO_KM} km, casas en venta: {porConsulta * 1e6:.0f} us por consulta,"
+          f" {encontrados / CONSULTAS:.1f} resultados promedio")
+
+    inicio = time.perf_counter()
+    encontrados = sum(len(inmobiliaria.buscarEnRecuadro(latitud, longitud, latitud + 0.05, longitud + 0.05))
+                      for latitud, longitud in centros)
+    porConsulta = (time.perf_counter() - inicio) / CONSULTAS
+    print(f"  recuadro de 0.05 grados: {porConsulta * 1e6:.0f} us por consulta, {encontrados / CONSULTAS:.1f} resultados promedio")
+
+    inicio = time.perf_counter()
+    buscarLineal(inmobiliaria, *centros[0], RADIO_KM, "en venta")
+    print(f"  recorrido lineal: {(time.perf_counter() - inicio) * 1e6:.0f} us por consulta")
+
+
+if __name__ == "__main__":
+    for cantidad in [int(argumento) for argumento in sys.argv[1:]] or [100000, 1000000]:
+        medir(cantidad)
@@ -0,0 +1,76 @@
+"""
+Benchmark de RegistroDeEventos: throughput de escritura de eventos y tiempo de recuperacion a medida que crece el historial.
+
+Genera una cartera, la registra y le aplica ciclos de puesta en venta / en alquiler. Cada tanto mide cuanto tarda recuperar()
+desde el directorio: con snapshots periodicos el tiempo depende del tamaño de la cartera y de eventosPorSnapshot, no del largo
+del historial. Al final compara el estado recuperado con el original.
+
+Uso: python benchmarks/eventos.py [eventos] [inmuebles]   ( por defecto 10000000 10000 )
+"""
+import shutil
+import sys
+import tempfile
+import time
+
+from generador import generarInmuebles
+from Eventos import RegistroDeEventos
+
+EVENTOS_POR_SNAPSHOT = 100000
+MEDICIONES = 5
+
+
+def estado(inmobiliaria):
+    return [inmueble.aRegistro() for inmueble in inmobiliaria.getlistaPropiedades()], inmobiliaria.getGanancias()
+
+
+def medirRecuperacion(directorio):
+    registro = RegistroDeEventos(directorio, EVENTOS_POR_SNAPSHOT)
+    inicio = time.perf_counter()
+    inmobiliaria = registro.recuperar()
+    tiempo = time.perf_counter() - inicio
+    registro.cerrar()
+    return tiempo, inmobiliaria
+
+
+def main(eventos, cantidad):
+    directorio = tempfile.mkdtemp(prefix="eventos-")
+    try:
+        registro = RegistroDeEventos(directorio, EVENTOS_POR_SNAPSHOT)
+        inmobiliaria = registro.recuperar()
+        inmuebles = generarInmuebles(cantidad)
+        inmobiliaria.anañadirPropiedades((inmueble, 100000) for inmueble in inmuebles)
+        codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+
+        print(f"{cantidad} inmuebles, {eventos} eventos, snapshot cada {EVENTOS_POR_SNAPSHOT}")
+        intervalo = max(1, eventos // MEDICIONES)
+        siguiente = intervalo
+        escritura = 0.0
+        inicio = time.perf_counter()
+        numero = 0
+        while registro.getSecuencia() < eventos:
+            codigo = codigos[numero % len(codigos)]
+            if (numero // len(codigos)) % 2:
+                inmobiliaria.ponerEnVenta(codigo)
+            else:
+                inmobiliaria.ponerEnAlquiler(codigo)
+            numero += 1
+            if registro.getSecuencia() >= siguiente:
+                escritura += time.perf_counter() - inicio
+                registro.confirmar()
+                tiempo, _ = medirRecuperacion(directorio)
+                print(f"  {registro.getSecuencia()} eventos: {registro.getSecuencia() / escritura:,.0f} eventos/s,"
+                      f" recuperacion {tiempo:.2f} s")
+                siguiente += intervalo
+                inicio = time.perf_counter()
+        registro.cerrar()
+
+        _, recuperada = medirRecuperacion(directorio)
+        assert estado(recuperada) == estado(inmobiliaria), "El estado recuperado no coincide con el original"
+        print(f"  archivos borrados al compactar: {registro.compactar()}")
+    finally:
+        shutil.rmtree(directorio)
+
+
+if __name__ == "__main__":
+    argumentos = [int(argumento) for argumento in sys.argv[1:]]
+    main(*(argumentos + [10000000, 10000][len(argumentos):]))
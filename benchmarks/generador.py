@@ -0,0 +1,79 @@
+"""
+Generador de carteras sinteticas para los benchmarks.
+
+Usa una semilla fija para que las corridas sean reproducibles, y mezcla Casa, Departamento, Salon y Quinta.
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Sistema import Casa, Departamento, Inmobiliaria, Propietario, Quinta, Salon
+
+SEMILLA = 1234
+
+CALLES = ["San Martin", "Belgrano", "Rivadavia", "Sarmiento", "Mitre", "Moreno", "Urquiza", "Alvear"]
+
+ESTADOS = ["en alquiler", "en venta", "en alquiler o venta"]
+
+
+def generarPropietarios(cantidad):
+    return [Propietario(f"Propietario {numero}", 20000000 + numero)
+            for numero in range(cantidad)]
+
+
+def generarInmuebles(cantidad, semilla=SEMILLA, propietarios=None):
+    """
+        Genera inmuebles de los cuatro tipos con atributos aleatorios.
+
+        Args:
+            cantidad (int): cantidad de inmuebles.
+            semilla (int): semilla del generador aleatorio.
+            propietarios (list, opcional): propietarios a repartir. Por defecto uno cada 20 inmuebles.
+
+        Returns:
+            list: inmuebles generados.
+    """
+    azar = random.Random(semilla)
+    if propietarios is None:
+        propietarios = generarPropietarios(max(1, cantidad // 20))
+
+    inmuebles = []
+    for numero in range(cantidad):
+        owner = propietarios[numero % len(propietarios)]
+        area = round(azar.uniform(30, 400), 1)
+        direccion = f"{azar.choice(CALLES)} {azar.randrange(1, 5000)}"
+        estado = azar.choice(ESTADOS)
+        cochera = azar.random() < 0.4
+        tipo = azar.random()
+        if tipo < 0.4:
+            inmueble = Departamento(area, direccion, azar.randrange(1, 5), owner, round(azar.uniform(0, 800), 1),
+                                    azar.randrange(1, 40), cochera, estado)
+        elif tipo < 0.75:
+            inmueble = Casa(area, direccion, azar.randrange(1, 7), owner, round(azar.uniform(0, 300), 1), estado, cochera)
+        elif tipo < 0.9:
+            inmueble = Salon(area, direccion, owner, azar.randrange(0, 500), estado, cochera)
+        else:
+            inmueble = Quinta(area, direccion, owner, azar.random() < 0.5, azar.random() < 0.5, estado, cochera)
+        inmuebles.append(inmueble)
+    return inmuebles
+
+
+def generarCartera(cantidad, semilla=SEMILLA, inmobiliaria=None):
+    """
+        Genera una inmobiliaria con una cartera de inmuebles sinteticos, cada uno con un costo aleatorio.
+
+        Args:
+            inmobiliaria (Inmobiliaria, opcional): inmobiliaria a completar, por ejemplo una concurrente. Por defecto una nueva.
+
+        Returns:
+            tuple: (Inmobiliaria, list de inmuebles).
+    """
+    azar = random.Random(semilla + 1)
+    if inmobiliaria is None:
+        inmobiliaria = Inmobiliaria()
+    inmuebles = generarInmuebles(cantidad, semilla)
+    for inmueble in inmuebles:
+        inmobiliaria.anañadirPropiedad(inmueble, azar.randrange(20000, 500000))
+    return inmobiliaria, inmuebles
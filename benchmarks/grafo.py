@@ -0,0 +1,71 @@
+"""
+Benchmark del grafo propietario / inmueble: pausa de una recoleccion completa del gc, objetos que sigue el gc y memoria
+residente con la cartera cargada, cuantos inmuebles quedan retenidos por sus propietarios despues de eliminar una parte
+de la cartera, y cuanto crece la memoria residente al reponer esa parte con inmuebles nuevos ( si los eliminados se
+liberaron, los nuevos reutilizan su memoria ).
+
+Uso: python benchmarks/grafo.py [cantidad] [fraccionEliminada]   ( por defecto 1000000 y 0.2 )
+"""
+import gc
+import resource
+import statistics
+import sys
+import time
+
+from generador import SEMILLA, generarCartera, generarInmuebles
+
+RECOLECCIONES = 5
+
+
+def memoriaResidente():
+    # VmRSS en MB; si /proc no esta disponible se informa el maximo de la corrida.
+    try:
+        with open("/proc/self/status") as estado:
+            for linea in estado:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def pausaDeRecoleccion():
+    pausas = []
+    for _ in range(RECOLECCIONES):
+        inicio = time.perf_counter()
+        gc.collect()
+        pausas.append(time.perf_counter() - inicio)
+    return statistics.median(pausas) * 1000
+
+
+def informar(titulo, inmobiliaria, propietarios):
+    asociados = sum(propietario.cantidadPropiedades() for propietario in propietarios)
+    print(f"  {titulo}: pausa del gc {pausaDeRecoleccion():.0f} ms, {len(gc.get_objects()):,} objetos seguidos,"
+          f" {memoriaResidente():.0f} MB residentes")
+    print(f"    inmuebles en cartera {len(inmobiliaria.getlistaPropiedades()):,},"
+          f" asociados a propietarios {asociados:,}")
+
+
+def main(cantidad, fraccionEliminada):
+    print(f"{cantidad} inmuebles")
+    inicio = time.perf_counter()
+    inmobiliaria, inmuebles = generarCartera(cantidad)
+    print(f"  carga: {time.perf_counter() - inicio:.1f} s")
+    propietarios = list({id(inmueble.getOwner()): inmueble.getOwner() for inmueble in inmuebles}.values())
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+    # Solo la inmobiliaria sostiene la cartera.
+    del inmuebles
+    informar("cartera completa", inmobiliaria, propietarios)
+
+    for codigo in codigos[:int(cantidad * fraccionEliminada)]:
+        inmobiliaria.eliminarPropiedad(codigo)
+    informar(f"tras eliminar el {fraccionEliminada:.0%}", inmobiliaria, propietarios)
+
+    nuevos = generarInmuebles(int(cantidad * fraccionEliminada), SEMILLA + 2, propietarios)
+    inmobiliaria.anañadirPropiedades((inmueble, inmueble.getCosto()) for inmueble in nuevos)
+    del nuevos
+    informar("tras reponerlos", inmobiliaria, propietarios)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000, float(sys.argv[2]) if len(sys.argv) > 2 else 0.2)
@@ -0,0 +1,42 @@
+"""
+Benchmark del costo de Instrumentacion: throughput de ventas y alquileres sin instrumentar, instrumentado y despues de
+desinstrumentar ( que debe volver al costo original ).
+
+Uso: python benchmarks/instrumentacion.py [cantidad]   ( por defecto 100000 )
+"""
+import sys
+import time
+
+from generador import generarCartera, generarPropietarios
+from Instrumentacion import Instrumentacion
+
+
+def operar(inmobiliaria, codigos, compradores):
+    inicio = time.perf_counter()
+    for numero, codigo in enumerate(codigos):
+        if numero % 2:
+            inmobiliaria.ponerEnAlquiler(codigo)
+            inmobiliaria.alquilarInmueble(codigo, f"Inquilino {numero}")
+        else:
+            inmobiliaria.ponerEnVenta(codigo)
+            inmobiliaria.venderPropiedad(codigo, compradores[numero % len(compradores)])
+    return 2 * len(codigos) / (time.perf_counter() - inicio)
+
+
+def main(cantidad):
+    compradores = generarPropietarios(50)
+    instrumentacion = Instrumentacion()
+    print(f"{cantidad} inmuebles, 2 operaciones por inmueble")
+    for etapa in ("sin instrumentar", "instrumentado", "desinstrumentado"):
+        inmobiliaria, inmuebles = generarCartera(cantidad)
+        if etapa != "sin instrumentar":
+            instrumentacion.instrumentar(inmobiliaria)
+        if etapa == "desinstrumentado":
+            instrumentacion.desinstrumentar(inmobiliaria)
+        throughput = operar(inmobiliaria, [inmueble.getUniquecode() for inmueble in inmuebles], compradores)
+        print(f"  {etapa}: {throughput:,.0f} ops/s")
+    print(f"  llamadas medidas a venderPropiedad: {instrumentacion.snapshot()['venderPropiedad']['llamadas']}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
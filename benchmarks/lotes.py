@@ -0,0 +1,65 @@
+"""
+Benchmark de las operaciones por lote: cierre de mes con ponerEnVenta + venderPropiedad sobre la mitad de la cartera y
+ponerEnAlquiler + alquilarInmueble sobre la otra mitad, llamando a los metodos de a uno en un bucle contra las versiones
+Batch ( venderPropiedadesBatch, alquilarInmueblesBatch, ponerEnVentaBatch, ponerEnAlquilerBatch ).
+
+Las versiones Batch siguen llamando a los setters por cada inmueble y solo agrupan los indices y los avisos, por lo que
+la diferencia esperable es chica ( alrededor de x1.1 a x1.2, y puede quedar por debajo de x1 con lotes chicos ).
+
+Uso: python benchmarks/lotes.py [cantidad] [tamañoLote]   ( por defecto 100000 y 5000 )
+"""
+import sys
+import time
+
+from generador import generarCartera
+from Sistema import Propietario
+
+
+def compradores(cantidad):
+    # Dni fuera del rango de generarPropietarios, para que cada comprador sea un propietario nuevo.
+    return [Propietario(f"Comprador {numero}", 90000000 + numero) for numero in range(cantidad)]
+
+
+def deAUno(inmobiliaria, ventas, alquileres):
+    inicio = time.perf_counter()
+    for codigo, comprador in ventas:
+        inmobiliaria.ponerEnVenta(codigo)
+        inmobiliaria.venderPropiedad(codigo, comprador)
+    for codigo, inquilino in alquileres:
+        inmobiliaria.ponerEnAlquiler(codigo)
+        inmobiliaria.alquilarInmueble(codigo, inquilino)
+    return time.perf_counter() - inicio
+
+
+def porLotes(inmobiliaria, ventas, alquileres, tamañoLote):
+    inicio = time.perf_counter()
+    for desde in range(0, len(ventas), tamañoLote):
+        lote = ventas[desde:desde + tamañoLote]
+        inmobiliaria.ponerEnVentaBatch([codigo for codigo, _ in lote])
+        inmobiliaria.venderPropiedadesBatch(lote)
+    for desde in range(0, len(alquileres), tamañoLote):
+        lote = alquileres[desde:desde + tamañoLote]
+        inmobiliaria.ponerEnAlquilerBatch([codigo for codigo, _ in lote])
+        inmobiliaria.alquilarInmueblesBatch(lote)
+    return time.perf_counter() - inicio
+
+
+def main(cantidad, tamañoLote):
+    print(f"{cantidad} inmuebles, lotes de {tamañoLote}, 2 operaciones por inmueble")
+    tiempos = {}
+    for modo in ("de a uno", "por lotes"):
+        inmobiliaria, inmuebles = generarCartera(cantidad)
+        codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+        grupo = compradores(50)
+        ventas = [(codigo, grupo[numero % len(grupo)]) for numero, codigo in enumerate(codigos[::2])]
+        alquileres = [(codigo, f"Inquilino {numero}") for numero, codigo in enumerate(codigos[1::2])]
+        if modo == "de a uno":
+            tiempos[modo] = deAUno(inmobiliaria, ventas, alquileres)
+        else:
+            tiempos[modo] = porLotes(inmobiliaria, ventas, alquileres, tamañoLote)
+        print(f"  {modo}: {2 * cantidad / tiempos[modo]:,.0f} ops/s, ganancias {inmobiliaria.getGanancias():,.0f}")
+    print(f"  aceleracion: x{tiempos['de a uno'] / tiempos['por lotes']:.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000, int(sys.argv[2]) if len(sys.argv) > 2 else 5000)
@@ -0,0 +1,85 @@
+"""
+Benchmark de memoria por inmueble con tracemalloc.
+
+Compara las clases de Sistema ( con __slots__ ) con una copia de las mismas clases sin las declaraciones __slots__, que
+guarda los atributos en un __dict__ por instancia como antes del cambio, para poder reproducir la diferencia.
+
+Uso: python benchmarks/memoria.py [cantidad]   ( por defecto 100000 )
+"""
+import ast
+import gc
+import sys
+import tracemalloc
+import types
+
+from generador import generarInmuebles
+import Sistema
+
+
+def cargarSinSlots():
+    """
+        Carga una copia del modulo Sistema con las asignaciones de __slots__ quitadas de todas las clases.
+
+        Returns:
+            module: modulo con las mismas clases y metodos, cuyas instancias usan __dict__.
+    """
+    ruta = Sistema.__file__
+    with open(ruta, encoding="utf-8") as archivo:
+        arbol = ast.parse(archivo.read(), ruta)
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.ClassDef):
+            nodo.body = [sentencia for sentencia in nodo.body
+                         if not (isinstance(sentencia, ast.Assign)
+                                 and any(isinstance(destino, ast.Name) and destino.id == "__slots__"
+                                         for destino in sentencia.targets))] or [ast.Pass()]
+    ast.fix_missing_locations(arbol)
+    modulo = types.ModuleType("SistemaSinSlots")
+    modulo.__file__ = ruta
+    sys.modules[modulo.__name__] = modulo
+    exec(compile(arbol, ruta, "exec"), modulo.__dict__)
+    return modulo
+
+
+def constructores(modulo):
+    return {
+        "Casa": lambda owner: modulo.Casa(120.5, "San Martin 100", 3, owner, 40.0),
+        "Departamento": lambda owner: modulo.Departamento(60.0, "Belgrano 200", 2, owner, 150.0, 4),
+        "Salon": lambda owner: modulo.Salon(300.0, "Mitre 300", owner, 120),
+        "Quinta": lambda owner: modulo.Quinta(250.0, "Alvear 400", owner),
+    }
+
+
+def bytesPorObjeto(crear, cantidad):
+    gc.collect()
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    objetos = crear(cantidad)
+    fin, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objetos
+    return (fin - inicio) / cantidad
+
+
+def bytesPorTipo(modulo, constructor, cantidad):
+    # Un propietario cada 20 inmuebles, igual que en la cartera mixta.
+    def crear(n):
+        propietarios = [modulo.Propietario(f"Propietario {numero}", 20000000 + numero)
+                        for numero in range(max(1, n // 20))]
+        return [constructor(propietarios[numero % len(propietarios)]) for numero in range(n)]
+    return bytesPorObjeto(crear, cantidad)
+
+
+def main(cantidad):
+    sinSlots = cargarSinSlots()
+    print(f"{cantidad} inmuebles")
+    print(f"  cartera mixta ( con propietarios ): {bytesPorObjeto(generarInmuebles, cantidad):.1f} bytes por inmueble")
+    print(f"  {'tipo':<14}{'__slots__':>12}{'__dict__':>12}{'ahorro':>9}")
+    conSlots = constructores(Sistema)
+    for nombre, constructor in constructores(sinSlots).items():
+        compacto = bytesPorTipo(Sistema, conSlots[nombre], cantidad)
+        original = bytesPorTipo(sinSlots, constructor, cantidad)
+        print(f"  {nombre:<14}{compacto:>12.1f}{original:>12.1f}{1 - compacto / original:>9.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
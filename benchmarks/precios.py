@@ -0,0 +1,50 @@
+"""
+Benchmark de MotorDePrecios por tipo de inmueble, contra calcularPrecio ( que arma una cadena que hay que volver a convertir ).
+
+Uso: python benchmarks/precios.py [cantidad]   ( por defecto 1000000 inmuebles mezclados )
+"""
+import sys
+import time
+
+from generador import generarCartera
+from Precios import MotorDePrecios
+
+# Montos de ejemplo para las caracteristicas propias de cada clase hija, solo para este benchmark.
+REGLAS = {
+    "Casa": {"patioSurface": 250},
+    "Departamento": {"expenses": -10},
+    "Salon": {"capacidad": 50},
+    "Quinta": {"pileta": 8000, "quincho": 4000},
+}
+
+
+def calcularPrecioNumerico(inmobiliaria, inmuebles):
+    return [float(inmobiliaria.calcularPrecio(inmueble).rsplit(":", 1)[1]) for inmueble in inmuebles]
+
+
+def medir(funcion, *args):
+    inicio = time.perf_counter()
+    funcion(*args)
+    return time.perf_counter() - inicio
+
+
+def main(cantidad):
+    inmobiliaria, inmuebles = generarCartera(cantidad)
+    motor = MotorDePrecios.desdeInmobiliaria(inmobiliaria, REGLAS)
+    porTipo = {}
+    for inmueble in inmuebles:
+        porTipo.setdefault(type(inmueble).__name__, []).append(inmueble)
+
+    print(f"{cantidad} inmuebles")
+    for tipo, grupo in sorted(porTipo.items()):
+        motorTiempo = medir(motor.precios, grupo)
+        cadenaTiempo = medir(calcularPrecioNumerico, inmobiliaria, grupo)
+        print(f"  {tipo} ( {len(grupo)} ): motor {len(grupo) / motorTiempo:,.0f} inmuebles/s,"
+              f" calcularPrecio {len(grupo) / cadenaTiempo:,.0f} inmuebles/s, x{cadenaTiempo / motorTiempo:.1f}")
+
+    tiempo = medir(motor.valorarCartera, inmobiliaria)
+    print(f"  cartera mezclada: {tiempo:.2f} s, {cantidad / tiempo:,.0f} inmuebles/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,52 @@
+"""
+Benchmark de Inmobiliaria.buscar contra el filtro lineal sobre getlistaPropiedades().
+
+Uso: python benchmarks/rangos.py [cantidad ...]   ( por defecto 10000 100000 1000000 )
+"""
+import sys
+import time
+
+from generador import generarCartera
+
+CONSULTAS = [
+    {"area": (100, 105)},
+    {"area": (50, 300), "rooms": (3, 3), "costo": (100000, 120000)},
+    {"costo": (20000, 25000), "estado": "en venta", "tipo": "Casa"},
+]
+
+REPETICIONES = 5
+
+
+def filtroLineal(inmobiliaria, area=None, rooms=None, costo=None, estado=None, tipo=None):
+    def dentro(valor, limites):
+        return limites is None or limites[0] <= valor <= limites[1]
+
+    return [inmueble for inmueble in inmobiliaria.getlistaPropiedades()
+            if dentro(inmueble.getCoveredArea(), area) and dentro(inmueble.getRooms(), rooms)
+            and dentro(inmueble.getCosto(), costo)
+            and (estado is None or inmueble.getEstado() == estado)
+            and (tipo is None or type(inmueble).__name__ == tipo)]
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / REPETICIONES, resultado
+
+
+def main(cantidades):
+    for cantidad in cantidades:
+        inicio = time.perf_counter()
+        inmobiliaria, _ = generarCartera(cantidad)
+        print(f"\n{cantidad} inmuebles ( cartera generada en {time.perf_counter() - inicio:.2f} s )")
+        for consulta in CONSULTAS:
+            tiempoLineal, esperado = medir(lambda: filtroLineal(inmobiliaria, **consulta))
+            tiempoIndice, obtenido = medir(lambda: inmobiliaria.buscar(**consulta))
+            assert obtenido == sorted(esperado, key=lambda inmueble: inmueble.getUniquecode())
+            print(f"  {consulta}: {len(obtenido)} resultados, lineal {tiempoLineal * 1000:.2f} ms,"
+                  f" buscar {tiempoIndice * 1000:.2f} ms, x{tiempoLineal / tiempoIndice:.1f}")
+
+
+if __name__ == "__main__":
+    main([int(argumento) for argumento in sys.argv[1:]] or [10000, 100000, 1000000])
@@ -0,0 +1,164 @@
+"""
+Suite de benchmarks del modelo de Sistema.py con salida JSON y comparacion contra una linea base.
+
+Para cada tamaño de cartera ( generada con la semilla fija de generador.py, mezclando Casa, Departamento, Salon y Quinta )
+mide construccion de inmuebles, anañadirPropiedad, busquedas por codigo, ventas, alquileres, datallarInmueble,
+describirPropiedad, calcularPrecio y memoria por inmueble. Las operaciones puntuales se miden sobre una muestra de hasta
+MUESTRA inmuebles, para que el tamaño de la cartera cambie el estado de las estructuras y no la duracion de la medicion.
+
+Uso:
+    python benchmarks/suite.py [--tamaños 1000 100000 1000000] [--salida resultados.json]
+                               [--baseline base.json] [--tolerancia 0.2]
+
+Con --baseline compara cada metrica con la linea base, marca las que empeoraron mas que la tolerancia y termina con
+codigo 1 si hay alguna. Para crear una linea base basta con guardar una corrida con --salida.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from generador import SEMILLA, generarInmuebles, generarPropietarios
+from Sistema import Inmobiliaria
+
+MUESTRA = 100000
+
+VERSION = 1
+
+
+def _metrica(valor, unidad, mejor="mayor"):
+    return {"valor": valor, "unidad": unidad, "mejor": mejor}
+
+
+def _porSegundo(cantidad, inicio):
+    return cantidad / (time.perf_counter() - inicio)
+
+
+def memoriaPorInmueble(cantidad):
+    gc.collect()
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    inmuebles = generarInmuebles(cantidad)
+    fin, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del inmuebles
+    return (fin - inicio) / cantidad
+
+
+def medirTamaño(cantidad):
+    resultados = {"memoria": _metrica(memoriaPorInmueble(cantidad), "bytes/inmueble", "menor")}
+    azar = random.Random(SEMILLA)
+
+    inicio = time.perf_counter()
+    inmuebles = generarInmuebles(cantidad)
+    resultados["construccion"] = _metrica(_porSegundo(cantidad, inicio), "inmuebles/s")
+
+    inmobiliaria = Inmobiliaria()
+    costos = [azar.randrange(20000, 500000) for _ in range(cantidad)]
+    inicio = time.perf_counter()
+    for inmueble, costo in zip(inmuebles, costos):
+        inmobiliaria.anañadirPropiedad(inmueble, costo)
+    resultados["alta"] = _metrica(_porSegundo(cantidad, inicio), "altas/s")
+
+    muestra = [inmueble.getUniquecode() for inmueble in azar.sample(inmuebles, min(cantidad, MUESTRA))]
+    inicio = time.perf_counter()
+    for codigo in muestra:
+        inmobiliaria.buscarPropiedad(codigo)
+    resultados["busqueda"] = _metrica(_porSegundo(len(muestra), inicio), "busquedas/s")
+
+    inicio = time.perf_counter()
+    for inmueble in inmuebles[:MUESTRA]:
+        inmobiliaria.calcularPrecio(inmueble)
+    resultados["calcularPrecio"] = _metrica(_porSegundo(min(cantidad, MUESTRA), inicio), "precios/s")
+
+    inicio = time.perf_counter()
+    detalle = inmobiliaria.datallarInmueble()
+    resultados["datallarInmueble"] = _metrica(_porSegundo(cantidad, inicio), "inmuebles/s")
+    inicio = time.perf_counter()
+    inmobiliaria.datallarInmueble()
+    resultados["datallarInmuebleCache"] = _metrica(_porSegundo(cantidad, inicio), "inmuebles/s")
+    del detalle
+
+    propietarios = {id(inmueble.getOwner()): inmueble.getOwner() for inmueble in inmuebles}.values()
+    inicio = time.perf_counter()
+    for propietario in propietarios:
+        propietario.describirPropiedad()
+    resultados["describirPropiedad"] = _metrica(_porSegundo(cantidad, inicio), "inmuebles/s")
+
+    compradores = generarPropietarios(50)
+    ventas = muestra[::2]
+    alquileres = muestra[1::2]
+    inicio = time.perf_counter()
+    for numero, codigo in enumerate(ventas):
+        inmobiliaria.ponerEnVenta(codigo)
+        inmobiliaria.venderPropiedad(codigo, compradores[numero % len(compradores)])
+    resultados["venta"] = _metrica(_porSegundo(len(ventas), inicio), "ventas/s")
+    inicio = time.perf_counter()
+    for codigo in alquileres:
+        inmobiliaria.ponerEnAlquiler(codigo)
+        inmobiliaria.alquilarInmueble(codigo, "Inquilino")
+    resultados["alquiler"] = _metrica(_porSegundo(len(alquileres), inicio), "alquileres/s")
+    return resultados
+
+
+def comparar(actual, base, tolerancia):
+    """
+        Compara dos corridas de la suite.
+
+        Returns:
+            list: tuplas (tamaño, metrica, valor base, valor actual, relacion, regresion). relacion es mayor a 1 cuando la
+                  corrida actual es mejor; regresion es True si empeoro mas que la tolerancia.
+    """
+    filas = []
+    for tamaño, metricas in actual["resultados"].items():
+        for nombre, metrica in metricas.items():
+            anterior = base["resultados"].get(tamaño, {}).get(nombre)
+            if anterior is None or not anterior["valor"] or not metrica["valor"]:
+                continue
+            if metrica["mejor"] == "mayor":
+                relacion = metrica["valor"] / anterior["valor"]
+            else:
+                relacion = anterior["valor"] / metrica["valor"]
+            filas.append((tamaño, nombre, anterior["valor"], metrica["valor"], relacion, relacion < 1 - tolerancia))
+    return filas
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de Sistema.py")
+    parser.add_argument("--tamaños", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--salida", help="archivo JSON donde se guardan los resultados")
+    parser.add_argument("--baseline", help="archivo JSON de una corrida anterior para comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="empeoramiento relativo tolerado ( 0.2 = 20%% )")
+    opciones = parser.parse_args(argumentos)
+
+    corrida = {"version": VERSION, "semilla": SEMILLA, "python": platform.python_version(),
+               "plataforma": platform.platform(), "momento": time.time(), "resultados": {}}
+    for cantidad in opciones.tamaños:
+        print(f"{cantidad} inmuebles...", file=sys.stderr)
+        corrida["resultados"][str(cantidad)] = medirTamaño(cantidad)
+
+    texto = json.dumps(corrida, indent=2, ensure_ascii=False)
+    if opciones.salida:
+        with open(opciones.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(texto + "\n")
+    else:
+        print(texto)
+
+    if opciones.baseline:
+        with open(opciones.baseline, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        filas = comparar(corrida, base, opciones.tolerancia)
+        for tamaño, nombre, anterior, actual, relacion, regresion in filas:
+            marca = "  REGRESION" if regresion else ""
+            print(f"{tamaño:>8} {nombre:<22} {anterior:>14,.1f} -> {actual:>14,.1f}  x{relacion:.2f}{marca}", file=sys.stderr)
+        if any(fila[5] for fila in filas):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
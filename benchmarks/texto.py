@@ -0,0 +1,44 @@
+"""
+Benchmark de la busqueda por texto: buscarTexto ( indices de texto ) contra un recorrido lineal de la cartera que compara
+subcadenas de direccion, propietario e inquilino.
+
+Uso: python benchmarks/texto.py [cantidad]   ( por defecto 1000000 )
+"""
+import sys
+import time
+
+from generador import generarCartera
+
+CONSULTAS = ("san martin", "rivadavia 12", "propietario 4", "inquilino 77", "mit", "zzz")
+REPETICIONES = 20
+
+
+def buscarLineal(inmobiliaria, consulta):
+    palabras = consulta.lower().split()
+    return [inmueble for inmueble in inmobiliaria.getlistaPropiedades()
+            if all(palabra in f"{inmueble.getAddress()} {inmueble.getOwner().getFullname()} {inmueble.getInquilino()}".lower()
+                   for palabra in palabras)]
+
+
+def main(cantidad):
+    inicio = time.perf_counter()
+    inmobiliaria, inmuebles = generarCartera(cantidad)
+    for numero, inmueble in enumerate(inmuebles[::10]):
+        inmobiliaria.ponerEnAlquiler(inmueble.getUniquecode())
+        inmobiliaria.alquilarInmueble(inmueble.getUniquecode(), f"Inquilino {numero}")
+    print(f"{cantidad} inmuebles: carga con indices {time.perf_counter() - inicio:.2f} s")
+
+    for consulta in CONSULTAS:
+        inicio = time.perf_counter()
+        for _ in range(REPETICIONES):
+            resultados = inmobiliaria.buscarTexto(consulta)
+        indexada = (time.perf_counter() - inicio) / REPETICIONES
+        inicio = time.perf_counter()
+        lineal = buscarLineal(inmobiliaria, consulta)
+        recorrido = time.perf_counter() - inicio
+        print(f"  {consulta!r}: buscarTexto {indexada * 1000:.2f} ms ({len(resultados)} mejores),"
+              f" recorrido lineal {recorrido * 1000:.0f} ms ({len(lineal)} coincidencias)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
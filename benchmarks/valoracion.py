@@ -0,0 +1,48 @@
+"""
+Benchmark de Inmobiliaria.valorarEscenarios: tiempo de valorar la cartera en muchos escenarios segun la cantidad de procesos.
+
+Tambien compara el tamaño de lo que se envia a los procesos ( columnas como bytes ) con el de pickle de los inmuebles
+completos, que arrastra a sus propietarios y al resto de la cartera de cada uno.
+
+Uso: python benchmarks/valoracion.py [cantidad] [escenarios]   ( por defecto 200000 16 )
+"""
+import os
+import pickle
+import sys
+import time
+
+from generador import generarCartera
+
+PROCESOS = [1, 2, 4, 8]
+
+
+def escenarios(cantidad):
+    return [{"metroCuadrado": 400 + 25 * numero, "precioCochera": 500 + 100 * (numero % 4),
+             "costoDeGestionventa": 0.1 + 0.01 * (numero % 10)} for numero in range(cantidad)]
+
+
+def main(cantidad, cantidadEscenarios):
+    inmobiliaria, inmuebles = generarCartera(cantidad)
+    pedidos = escenarios(cantidadEscenarios)
+    print(f"{cantidad} inmuebles, {cantidadEscenarios} escenarios, {os.cpu_count()} CPUs")
+
+    muestra = inmuebles[:1000]
+    columnas = inmobiliaria.getColumnas()
+    compacto = len(pickle.dumps((columnas.area[:1000].tobytes(), columnas.cochera[:1000].tobytes())))
+    completo = len(pickle.dumps(muestra))
+    print(f"  envio por 1000 inmuebles: columnas {compacto:,} bytes, objetos {completo:,} bytes")
+
+    base = None
+    for procesos in PROCESOS:
+        inicio = time.perf_counter()
+        resultados = inmobiliaria.valorarEscenarios(pedidos, procesos=procesos)
+        tiempo = time.perf_counter() - inicio
+        if base is None:
+            base = tiempo, resultados
+        assert resultados == base[1], "Los resultados dependen de la cantidad de procesos"
+        print(f"  {procesos} procesos: {tiempo:.2f} s, x{base[0] / tiempo:.2f}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(argumento) for argumento in sys.argv[1:]]
+    main(*(argumentos + [200000, 16][len(argumentos):]))
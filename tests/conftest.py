@@ -0,0 +1,64 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Sistema import Casa, Departamento, Inmobiliaria, Propietario, Quinta, Salon
+
+CALLES = ["San Martin", "Belgrano", "Rivadavia", "Sarmiento", "Mitre", "Moreno"]
+
+ESTADOS = ["en alquiler", "en venta", "en alquiler o venta"]
+
+
+def generarCartera(cantidad, semilla=7, propietarios=None, inmobiliaria=None):
+    """Cartera chica y reproducible con los cuatro tipos de inmueble, un tercio con coordenadas."""
+    azar = random.Random(semilla)
+    if propietarios is None:
+        propietarios = [Propietario(f"Propietario {numero}", 30000000 + numero) for numero in range(max(1, cantidad // 8))]
+    if inmobiliaria is None:
+        inmobiliaria = Inmobiliaria()
+    inmuebles = []
+    for numero in range(cantidad):
+        owner = propietarios[numero % len(propietarios)]
+        area = round(azar.uniform(30, 400), 1)
+        direccion = f"{azar.choice(CALLES)} {azar.randrange(1, 5000)}"
+        estado = azar.choice(ESTADOS)
+        cochera = azar.random() < 0.4
+        tipo = numero % 4
+        if tipo == 0:
+            inmueble = Casa(area, direccion, azar.randrange(1, 7), owner, round(azar.uniform(0, 300), 1), estado, cochera)
+        elif tipo == 1:
+            inmueble = Departamento(area, direccion, azar.randrange(1, 5), owner, round(azar.uniform(0, 800), 1),
+                                    azar.randrange(1, 40), cochera, estado)
+        elif tipo == 2:
+            inmueble = Salon(area, direccion, owner, azar.randrange(0, 500), estado, cochera)
+        else:
+            inmueble = Quinta(area, direccion, owner, azar.random() < 0.5, azar.random() < 0.5, estado, cochera)
+        if numero % 3 == 0:
+            inmueble.setCoordenadas((round(-34.6 + azar.uniform(-0.05, 0.05), 6),
+                                     round(-58.4 + azar.uniform(-0.05, 0.05), 6)))
+        inmobiliaria.anañadirPropiedad(inmueble, azar.choice([azar.randrange(1000, 90000),
+                                                              round(azar.uniform(1000, 90000), 2)]))
+        inmuebles.append(inmueble)
+    return inmobiliaria, inmuebles
+
+
+def estadoDeCartera(inmobiliaria):
+    """Datos de todos los inmuebles, ganancias y agregados, para comparar dos inmobiliarias."""
+    registros = sorted((inmueble.aRegistro() for inmueble in inmobiliaria.getlistaPropiedades()),
+                       key=lambda registro: registro["codigo"])
+    return {
+        "registros": registros,
+        "ganancias": round(inmobiliaria.getGanancias(), 6),
+        "gananciasPorTipo": {tipo: round(total, 6)
+                             for tipo, total in inmobiliaria.getAgregados().gananciasPorTipo().items()},
+        "cantidadPorEstado": inmobiliaria.getAgregados().cantidadPorEstado(),
+    }
+
+
+@pytest.fixture
+def cartera():
+    return generarCartera(80)
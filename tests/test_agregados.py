@@ -0,0 +1,93 @@
+import pytest
+
+from conftest import generarCartera
+from Sistema import AgregadosDeCartera, Inmobiliaria, Propietario
+
+
+def verificarAgregados(inmobiliaria):
+    """Compara los agregados incrementales con los mismos valores calculados recorriendo la cartera."""
+    inmuebles = inmobiliaria.getlistaPropiedades()
+    agregados = inmobiliaria.getAgregados()
+    cantidades = {}
+    for inmueble in inmuebles:
+        clave = (type(inmueble).__name__, inmueble.getEstado())
+        cantidades[clave] = cantidades.get(clave, 0) + 1
+    for (tipo, estado), cantidad in cantidades.items():
+        assert agregados.cantidad(tipo, estado) == cantidad
+    assert sum(agregados.cantidadPorEstado().values()) == len(inmuebles)
+    assert agregados.cantidadPorTipo() == {tipo: sum(cantidad for (otro, _), cantidad in cantidades.items() if otro == tipo)
+                                           for tipo, _ in cantidades}
+    assert agregados.valorEnVenta() == pytest.approx(sum(
+        inmueble.getCosto() for inmueble in inmuebles if inmueble.getEstado() in AgregadosDeCartera.estadosEnVenta), abs=1e-6)
+    alquilados = sum(1 for inmueble in inmuebles if inmueble.getEstado() == "alquilado")
+    assert agregados.tasaDeOcupacion() == pytest.approx(alquilados / len(inmuebles) if inmuebles else 0.0)
+
+
+def gananciasEsperadas(inmobiliaria, ventas, alquileres):
+    """Ganancias por tipo de vender los inmuebles de ventas y alquilar los de alquileres, con sus costos actuales."""
+    ganancias = {}
+    for codigos, gestion in ((ventas, inmobiliaria.costoDeGestionventa), (alquileres, inmobiliaria.costoDeGestionAlquiler)):
+        for codigo in codigos:
+            inmueble = inmobiliaria.buscarPropiedad(codigo)
+            tipo = type(inmueble).__name__
+            ganancias[tipo] = ganancias.get(tipo, 0) + inmueble.getCosto() * gestion
+    return ganancias
+
+
+def test_agregados_tras_operaciones_por_lote(cartera):
+    inmobiliaria, inmuebles = cartera
+    verificarAgregados(inmobiliaria)
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+    ventas, alquileres = codigos[:30], codigos[30:60]
+    comprador = Propietario("Comprador", 40000001)
+
+    inmobiliaria.ponerEnVentaBatch(ventas)
+    inmobiliaria.ponerEnAlquilerBatch(alquileres)
+    verificarAgregados(inmobiliaria)
+    esperadas = gananciasEsperadas(inmobiliaria, ventas, alquileres)
+    assert all(inmobiliaria.venderPropiedadesBatch([(codigo, comprador) for codigo in ventas]))
+    assert all(inmobiliaria.alquilarInmueblesBatch([(codigo, "Inquilino") for codigo in alquileres]))
+    verificarAgregados(inmobiliaria)
+    assert inmobiliaria.getAgregados().gananciasPorTipo() == pytest.approx(esperadas)
+    assert inmobiliaria.getGanancias() == pytest.approx(sum(esperadas.values()))
+    assert inmobiliaria.getAgregados().cantidadPorEstado("vendido") == len(ventas)
+
+
+def test_agregados_tras_operaciones_de_a_una(cartera):
+    inmobiliaria, inmuebles = cartera
+    comprador = Propietario("Comprador", 40000001)
+    for numero, inmueble in enumerate(inmuebles[:40]):
+        codigo = inmueble.getUniquecode()
+        if numero % 2:
+            inmobiliaria.ponerEnVenta(codigo)
+            inmobiliaria.venderPropiedad(codigo, comprador)
+        else:
+            inmobiliaria.ponerEnAlquiler(codigo)
+            inmobiliaria.alquilarInmueble(codigo, "Inquilino")
+    verificarAgregados(inmobiliaria)
+
+
+def test_agregados_tras_setters_y_bajas(cartera):
+    inmobiliaria, inmuebles = cartera
+    for inmueble in inmuebles[:20]:
+        inmueble.setCosto(inmueble.getCosto() + 1000)
+    inmuebles[20].setEstado("alquilado")
+    inmuebles[21].setEstado("en alquiler o venta")
+    for inmueble in inmuebles[30:40]:
+        inmobiliaria.eliminarPropiedad(inmueble.getUniquecode())
+    verificarAgregados(inmobiliaria)
+    assert inmobiliaria.getAgregados().resumen()["cantidadPorTipo"] == inmobiliaria.getAgregados().cantidadPorTipo()
+
+
+def test_agregados_concurrentes():
+    inmobiliaria, inmuebles = generarCartera(60, inmobiliaria=Inmobiliaria(concurrente=True))
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+    inmobiliaria.ponerEnVentaBatch(codigos[::2])
+    comprador = Propietario("Comprador", 40000002)
+    inmobiliaria.venderPropiedadesBatch([(codigo, comprador) for codigo in codigos[::4]])
+    verificarAgregados(inmobiliaria)
+
+
+def test_inmobiliaria_vacia():
+    agregados = Inmobiliaria().getAgregados()
+    assert agregados.tasaDeOcupacion() == 0.0 and agregados.cantidadPorEstado() == {} and agregados.valorEnVenta() == 0
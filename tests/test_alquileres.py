@@ -0,0 +1,152 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from Alquileres import Contrato, LibroDeAlquileres
+from Sistema import Propietario
+
+
+@pytest.fixture
+def libro(cartera):
+    """Libro con un contrato por inmueble y pagos al azar; devuelve tambien los pagos como (numero, fecha, monto)."""
+    inmobiliaria, inmuebles = cartera
+    libro = LibroDeAlquileres(inmobiliaria)
+    azar = random.Random(5)
+    for inmueble in inmuebles:
+        inicio = date(2023, 1, 1) + timedelta(days=azar.randrange(500))
+        libro.registrarContrato(inmueble.getUniquecode(), "Inquilino", inicio,
+                                inicio + timedelta(days=azar.randrange(60, 700)), azar.randrange(100, 1000))
+    pagos = []
+    for _ in range(600):
+        pago = (azar.randrange(1, len(inmuebles) + 1), date(2023, 1, 1) + timedelta(days=azar.randrange(900)),
+                azar.randrange(50, 900))
+        numero, fecha, monto = pago
+        libro.registrarPago(numero, monto, fecha)
+        pagos.append(pago)
+    return inmobiliaria, libro, pagos
+
+
+def test_cuotas():
+    # Un contrato que empieza el 31 vence el ultimo dia de los meses mas cortos.
+    contrato = Contrato(1, 1, "Ana", date(2024, 1, 31), date(2024, 6, 1), 100)
+    assert contrato.cantidadCuotas() == 5
+    assert contrato.cuotasVencidas(date(2024, 2, 28)) == 1
+    assert contrato.cuotasVencidas(date(2024, 2, 29)) == 2
+    assert contrato.cuotasVencidas(date(2030, 1, 1)) == 5
+    assert Contrato(1, 1, "Ana", date(2024, 1, 15), date(2025, 1, 15), 10).cantidadCuotas() == 12
+    assert Contrato(1, 1, "Ana", date(2024, 1, 15), date(2025, 1, 16), 10).cantidadCuotas() == 13
+
+
+def test_pagado_y_deuda(libro):
+    _, libro, pagos = libro
+    for numero in range(1, 30):
+        contrato = libro.getContrato(numero)
+        for fecha in (date(2023, 6, 30), date(2024, 3, 15), date(2026, 1, 1)):
+            pagado = sum(monto for pago, dia, monto in pagos if pago == numero and dia <= fecha)
+            assert libro.pagado(numero, fecha) == pytest.approx(pagado)
+            esperada = max(0, contrato.cuotasVencidas(fecha) * contrato.getMontoMensual() - pagado)
+            assert libro.deuda(numero, fecha) == pytest.approx(esperada)
+
+
+def test_vencimientos(libro):
+    _, libro, _ = libro
+    contratos = [libro.getContrato(numero) for numero in range(1, len(libro) + 1)]
+    desde, hasta = date(2023, 9, 1), date(2024, 2, 29)
+    esperados = sorted((contrato for contrato in contratos if desde <= contrato.getFin() <= hasta),
+                       key=lambda contrato: (contrato.getFin(), contrato.getNumero()))
+    assert libro.contratosQueVencen(desde, hasta) == esperados
+    assert libro.contratosQueVencenEnMes(2024, 2) == [contrato for contrato in esperados
+                                                     if (contrato.getFin().year, contrato.getFin().month) == (2024, 2)]
+
+
+def test_ingresos(libro):
+    _, libro, pagos = libro
+    for año, mes, total in libro.ingresosMensuales(date(2023, 1, 1), date(2025, 12, 31)):
+        assert total == pytest.approx(sum(monto for _, dia, monto in pagos if (dia.year, dia.month) == (año, mes)))
+    assert libro.ingresosEntre(date(2023, 3, 20), date(2024, 2, 1)) == pytest.approx(
+        sum(monto for _, dia, monto in pagos if date(2023, 3, 1) <= dia < date(2024, 3, 1)))
+    assert libro.ingresosEntre(date(2024, 1, 1), date(2023, 1, 1)) == 0.0
+
+
+def test_deudas_por_propietario(libro):
+    inmobiliaria, libro, _ = libro
+    fecha = date(2024, 6, 30)
+    esperadas = {}
+    for numero in range(1, len(libro) + 1):
+        contrato = libro.getContrato(numero)
+        dni = inmobiliaria.buscarPropiedad(contrato.getCodigo()).getOwner().getDni()
+        esperadas[dni] = esperadas.get(dni, 0.0) + libro.deuda(numero, fecha)
+    deudas = libro.deudasPorPropietario(fecha)
+    assert deudas == pytest.approx({dni: deuda for dni, deuda in esperadas.items() if deuda > 0})
+    for dni in esperadas:
+        assert libro.deudaDePropietario(dni, fecha) == pytest.approx(esperadas[dni])
+
+
+def test_alquilar_con_contrato(cartera):
+    inmobiliaria, inmuebles = cartera
+    libro = LibroDeAlquileres(inmobiliaria)
+    codigo = inmuebles[0].getUniquecode()
+    inmobiliaria.ponerEnAlquiler(codigo)
+    contrato = libro.alquilarConContrato(codigo, "Ana", date(2024, 1, 1), date(2025, 1, 1), 500)
+    assert contrato is not None and inmuebles[0].getEstado() == "alquilado"
+    assert libro.contratoVigente(codigo, date(2024, 5, 1)) is contrato
+    assert libro.contratoVigente(codigo, date(2025, 1, 1)) is None
+    # Ya alquilado: no se registra otro contrato.
+    assert libro.alquilarConContrato(codigo, "Ana", date(2024, 1, 1), date(2025, 1, 1), 500) is None
+    assert libro.contratosDe(codigo) == [contrato]
+
+
+def test_datos_invalidos(cartera):
+    inmobiliaria, inmuebles = cartera
+    libro = LibroDeAlquileres(inmobiliaria)
+    codigo = inmuebles[0].getUniquecode()
+    with pytest.raises(ValueError):
+        libro.registrarContrato(-1, "Ana", date(2024, 1, 1), date(2025, 1, 1), 100)
+    with pytest.raises(ValueError):
+        libro.registrarContrato(codigo, "Ana", date(2024, 1, 1), date(2023, 1, 1), 100)
+    with pytest.raises(TypeError):
+        libro.registrarContrato(codigo, "Ana", "2024-01-01", date(2025, 1, 1), 100)
+    numero = libro.registrarContrato(codigo, "Ana", date(2024, 1, 1), date(2025, 1, 1), 100).getNumero()
+    with pytest.raises(ValueError):
+        libro.registrarPago(numero + 1, 100, date(2024, 2, 1))
+    with pytest.raises(ValueError):
+        libro.registrarPago(numero, 0, date(2024, 2, 1))
+    with pytest.raises(TypeError):
+        libro.registrarPago(numero, 100, "2024-02-01")
+
+
+def test_pagos_en_cualquier_orden(cartera):
+    inmobiliaria, inmuebles = cartera
+    ordenado, desordenado = LibroDeAlquileres(inmobiliaria), LibroDeAlquileres(inmobiliaria)
+    pagos = [(date(2024, 1, 1) + timedelta(days=dia), 10 + dia) for dia in range(0, 400, 7)]
+    for libro in (ordenado, desordenado):
+        libro.registrarContrato(inmuebles[0].getUniquecode(), "Ana", date(2024, 1, 1), date(2025, 2, 1), 300)
+    for fecha, monto in pagos:
+        ordenado.registrarPago(1, monto, fecha)
+    for fecha, monto in reversed(pagos):
+        desordenado.registrarPago(1, monto, fecha)
+    for fecha in (date(2023, 12, 31), date(2024, 1, 1), date(2024, 7, 15), date(2030, 1, 1)):
+        esperado = sum(monto for dia, monto in pagos if dia <= fecha)
+        assert ordenado.pagado(1, fecha) == desordenado.pagado(1, fecha) == pytest.approx(esperado)
+    assert desordenado.pagado(1) == pytest.approx(sum(monto for _, monto in pagos))
+
+
+def test_deudas_siguen_ventas_y_bajas(libro):
+    inmobiliaria, libro, _ = libro
+    fecha = date(2024, 6, 30)
+    comprador = Propietario("Comprador", 60000001)
+    vendidos = [inmueble.getUniquecode() for inmueble in inmobiliaria.filtrarPropiedades(estado="en venta")][:3]
+    inmobiliaria.venderPropiedadesBatch([(codigo, comprador) for codigo in vendidos])
+    inmobiliaria.eliminarPropiedad(vendidos[0])
+    inmobiliaria.getlistaPropiedades()[0].getOwner().setDni(60000002)
+
+    esperadas = {}
+    for numero in range(1, len(libro) + 1):
+        inmueble = inmobiliaria.buscarPropiedad(libro.getContrato(numero).getCodigo())
+        if inmueble is not None:
+            dni = inmueble.getOwner().getDni()
+            esperadas[dni] = esperadas.get(dni, 0.0) + libro.deuda(numero, fecha)
+    assert libro.deudasPorPropietario(fecha) == pytest.approx({dni: deuda for dni, deuda in esperadas.items() if deuda > 0})
+    assert libro.deudaDePropietario(60000001, fecha) == pytest.approx(esperadas[60000001])
+    assert libro.deudaDePropietario(60000002, fecha) == pytest.approx(esperadas[60000002])
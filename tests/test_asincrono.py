@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import pytest
+
+from conftest import generarCartera
+from Asincrono import AsyncInmobiliaria
+from Sistema import Inmobiliaria, Propietario
+
+
+@pytest.fixture
+def servicio():
+    inmobiliaria, inmuebles = generarCartera(40, inmobiliaria=Inmobiliaria(concurrente=True))
+    asincrono = AsyncInmobiliaria(inmobiliaria)
+    yield asincrono, inmuebles
+    asincrono.cerrar()
+
+
+def test_mutaciones_de_un_inmueble_se_aplican_en_orden(servicio):
+    servicio, inmuebles = servicio
+    inmobiliaria = servicio.getInmobiliaria()
+    codigos = [inmueble.getUniquecode() for inmueble in inmobiliaria.filtrarPropiedades(estado="en alquiler")]
+    comprador = Propietario("Comprador", 80000001)
+    estados = {}
+
+    def registrarEstado(evento, **datos):
+        if evento == "cambio" and datos["campo"] == "estado":
+            estados.setdefault(datos["inmueble"].getUniquecode(), []).append(datos["inmueble"].getEstado())
+    inmobiliaria.agregarObservador(registrarEstado)
+
+    async def operar():
+        # Sin serializar por codigo, la venta podria ejecutarse antes de ponerEnVenta y devolver False.
+        return await asyncio.gather(*[operacion for codigo in codigos for operacion in (
+            servicio.ponerEnVenta(codigo), servicio.venderPropiedad(codigo, comprador), servicio.ponerEnAlquiler(codigo))])
+
+    resultados = asyncio.run(operar())
+    assert resultados == [True, True, True] * len(codigos)
+    assert estados == {codigo: ["en venta", "vendido", "en alquiler"] for codigo in codigos}
+    assert servicio._candados == {}
+
+
+def test_mutaciones_corren_en_el_executor(servicio):
+    servicio, inmuebles = servicio
+    hilos = []
+    servicio.getInmobiliaria().agregarObservador(lambda evento, **datos: hilos.append(threading.get_ident()))
+
+    async def operar():
+        await servicio.ponerEnVenta(inmuebles[0].getUniquecode())
+        await servicio.eliminarPropiedad(inmuebles[1].getUniquecode())
+        return threading.get_ident()
+
+    delLoop = asyncio.run(operar())
+    assert hilos and delLoop not in hilos
+
+
+def test_lecturas_del_mismo_ciclo(servicio):
+    servicio, inmuebles = servicio
+
+    async def leer():
+        return await asyncio.gather(*[servicio.buscarPropiedad(inmueble.getUniquecode()) for inmueble in inmuebles],
+                                    servicio.buscarPropiedad(-1))
+
+    assert asyncio.run(leer()) == inmuebles + [None]
+
+
+def test_reportes_y_precios(servicio):
+    servicio, inmuebles = servicio
+    inmobiliaria = servicio.getInmobiliaria()
+
+    async def consultar():
+        return (await servicio.calcularPreciosBatch(), await servicio.buscar(estado="en venta"),
+                await servicio.getGanancias())
+
+    precios, enVenta, ganancias = asyncio.run(consultar())
+    assert list(precios) == list(inmobiliaria.calcularPreciosBatch())
+    assert enVenta == inmobiliaria.buscar(estado="en venta")
+    assert ganancias == inmobiliaria.getGanancias()
+
+
+def test_requiere_inmobiliaria_concurrente():
+    with pytest.raises(ValueError):
+        AsyncInmobiliaria(Inmobiliaria())
+    with pytest.raises(TypeError):
+        AsyncInmobiliaria("inmobiliaria")
@@ -0,0 +1,63 @@
+import pytest
+
+from conftest import estadoDeCartera
+from Binario import SnapshotBinario, escribirSnapshotBinario
+from Sistema import Propietario
+
+
+@pytest.fixture
+def carteraConVentas(cartera):
+    inmobiliaria, inmuebles = cartera
+    comprador = Propietario("Comprador", 60000001)
+    for inmueble in inmuebles[:10]:
+        inmobiliaria.ponerEnVenta(inmueble.getUniquecode())
+        inmobiliaria.venderPropiedad(inmueble.getUniquecode(), comprador)
+    for inmueble in inmuebles[10:20]:
+        inmobiliaria.ponerEnAlquiler(inmueble.getUniquecode())
+        inmobiliaria.alquilarInmueble(inmueble.getUniquecode(), "Inquilino Diaz")
+    return inmobiliaria, inmuebles
+
+
+def test_ida_y_vuelta(carteraConVentas, tmp_path):
+    inmobiliaria, _ = carteraConVentas
+    ruta = str(tmp_path / "cartera.bin")
+    escribirSnapshotBinario(inmobiliaria, ruta)
+    with SnapshotBinario(ruta) as snapshot:
+        cargada = snapshot.cargarInmobiliaria()
+        assert snapshot.getGanancias() == inmobiliaria.getGanancias()
+        assert snapshot.getGananciasPorTipo() == inmobiliaria.getAgregados().gananciasPorTipo()
+    assert estadoDeCartera(cargada) == estadoDeCartera(inmobiliaria)
+
+
+def test_conserva_tipos_y_coordenadas(carteraConVentas, tmp_path):
+    inmobiliaria, inmuebles = carteraConVentas
+    ruta = str(tmp_path / "cartera.bin")
+    escribirSnapshotBinario(inmobiliaria, ruta)
+    with SnapshotBinario(ruta) as snapshot:
+        assert len(snapshot) == len(inmuebles)
+        for inmueble in inmuebles:
+            original = inmueble.aRegistro()
+            leido = snapshot.registro(snapshot.posicion(inmueble.getUniquecode()))
+            assert leido == original
+            # Los enteros no vuelven como float, ni al reves.
+            assert all(type(leido[clave]) is type(original[clave]) for clave in original)
+            assert snapshot[inmueble.getUniquecode()].getCoordenadas() == inmueble.getCoordenadas()
+
+
+def test_acceso_por_codigo(cartera, tmp_path):
+    inmobiliaria, inmuebles = cartera
+    ruta = str(tmp_path / "cartera.bin")
+    escribirSnapshotBinario(inmobiliaria, ruta)
+    with SnapshotBinario(ruta) as snapshot:
+        inmueble = snapshot[inmuebles[7].getUniquecode()]
+        assert inmueble is snapshot[inmuebles[7].getUniquecode()]
+        assert snapshot.posicion(-1) == -1
+        with pytest.raises(KeyError):
+            snapshot[-1]
+
+
+def test_rechaza_archivos_ajenos(tmp_path):
+    ruta = tmp_path / "otro.bin"
+    ruta.write_bytes(b"no es un snapshot")
+    with pytest.raises(ValueError):
+        SnapshotBinario(str(ruta))
@@ -0,0 +1,72 @@
+import pytest
+
+import Sistema
+from Sistema import Propietario
+
+
+def verificarColumnas(inmobiliaria):
+    columnas = inmobiliaria.getColumnas()
+    assert sorted(columnas.codigos) == sorted(inmueble.getUniquecode() for inmueble in inmobiliaria.getlistaPropiedades())
+    for fila, codigo in enumerate(columnas.codigos):
+        inmueble = inmobiliaria.buscarPropiedad(codigo)
+        assert columnas.area[fila] == inmueble.getCoveredArea()
+        assert columnas.rooms[fila] == inmueble.getRooms()
+        assert columnas.costo[fila] == inmueble.getCosto()
+        assert columnas.cochera[fila] == inmueble.getCochera()
+        assert columnas.estado[fila] == inmueble.getCodigoEstado()
+
+
+@pytest.fixture(params=["numpy", "python"])
+def motor(request, monkeypatch):
+    """Corre cada prueba con NumPy ( si esta instalado ) y con la alternativa en Python puro."""
+    if request.param == "numpy":
+        if Sistema.numpy is None:
+            pytest.skip("NumPy no esta instalado")
+    else:
+        monkeypatch.setattr(Sistema, "numpy", None)
+    return request.param
+
+
+def precioDeCadena(inmobiliaria, inmueble):
+    return float(inmobiliaria.calcularPrecio(inmueble).rsplit(":", 1)[1])
+
+
+def test_columnas_siguen_los_cambios(cartera):
+    inmobiliaria, inmuebles = cartera
+    comprador = Propietario("Comprador", 90000001)
+    for inmueble in inmuebles[:10]:
+        inmueble.setCoveredArea(inmueble.getCoveredArea() + 1)
+        inmueble.setCochera(not inmueble.getCochera())
+    inmobiliaria.ponerEnVentaBatch([inmueble.getUniquecode() for inmueble in inmuebles[10:30]])
+    inmobiliaria.venderPropiedadesBatch([(inmueble.getUniquecode(), comprador) for inmueble in inmuebles[10:20]])
+    for inmueble in inmuebles[30:40]:
+        inmobiliaria.eliminarPropiedad(inmueble.getUniquecode())
+    verificarColumnas(inmobiliaria)
+
+
+def test_precios_coinciden_con_calcularPrecio(cartera, motor):
+    inmobiliaria, inmuebles = cartera
+    inmuebles[0].setCoveredArea(77)
+    precios = inmobiliaria.calcularPreciosBatch()
+    for codigo, precio in zip(inmobiliaria.getColumnas().codigos, precios):
+        assert precio == pytest.approx(precioDeCadena(inmobiliaria, inmobiliaria.buscarPropiedad(codigo)))
+
+    codigos = [inmueble.getUniquecode() for inmueble in reversed(inmuebles[::5])]
+    assert list(inmobiliaria.calcularPreciosBatch(codigos)) == pytest.approx(
+        [precioDeCadena(inmobiliaria, inmobiliaria.buscarPropiedad(codigo)) for codigo in codigos])
+    with pytest.raises(KeyError):
+        inmobiliaria.calcularPreciosBatch([-1])
+
+
+def test_numpy_y_python_dan_lo_mismo(cartera, monkeypatch):
+    if Sistema.numpy is None:
+        pytest.skip("NumPy no esta instalado")
+    inmobiliaria, inmuebles = cartera
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles[::3]]
+    vectorizados = (inmobiliaria.calcularPreciosBatch(), inmobiliaria.calcularPreciosBatch(codigos))
+    monkeypatch.setattr(Sistema, "numpy", None)
+    assert (inmobiliaria.calcularPreciosBatch(), inmobiliaria.calcularPreciosBatch(codigos)) == vectorizados
+
+
+def test_cartera_vacia(motor):
+    assert len(Sistema.Inmobiliaria().calcularPreciosBatch()) == 0
@@ -0,0 +1,88 @@
+import sys
+import threading
+
+import pytest
+
+from conftest import generarCartera
+from test_agregados import verificarAgregados
+from test_indices import verificarIndices
+from Sistema import Inmobiliaria, Propietario
+
+HILOS = 6
+
+
+@pytest.fixture
+def cambiosFrecuentes():
+    # Cambios de hilo mas frecuentes para que las operaciones se intercalen.
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(intervalo)
+
+
+def enHilos(tarea):
+    barrera = threading.Barrier(HILOS)
+    errores = []
+
+    def correr(numero):
+        barrera.wait()
+        try:
+            tarea(numero)
+        except Exception as error:
+            errores.append(error)
+
+    hilos = [threading.Thread(target=correr, args=(numero,)) for numero in range(HILOS)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert errores == []
+
+
+def test_cada_inmueble_se_vende_una_sola_vez(cambiosFrecuentes):
+    inmobiliaria, inmuebles = generarCartera(200, inmobiliaria=Inmobiliaria(concurrente=True))
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+    inmobiliaria.ponerEnVentaBatch(codigos)
+    esperadas = inmobiliaria.getGanancias() + sum(inmueble.getCosto() for inmueble in inmuebles) * \
+        inmobiliaria.costoDeGestionventa
+    compradores = [Propietario(f"Comprador {numero}", 40000000 + numero) for numero in range(HILOS)]
+    vendidos = [[] for _ in range(HILOS)]
+
+    def vender(numero):
+        # Todos los hilos intentan vender todos los inmuebles, cada uno en otro orden.
+        for codigo in codigos[numero:] + codigos[:numero]:
+            if inmobiliaria.venderPropiedad(codigo, compradores[numero]):
+                vendidos[numero].append(codigo)
+
+    enHilos(vender)
+    assert sorted(codigo for lista in vendidos for codigo in lista) == sorted(codigos)
+    for numero, comprador in enumerate(compradores):
+        assert sorted(inmueble.getUniquecode() for inmueble in comprador.getListaPropiedades()) == sorted(vendidos[numero])
+    assert inmobiliaria.getGanancias() == pytest.approx(esperadas)
+    verificarIndices(inmobiliaria)
+    verificarAgregados(inmobiliaria)
+
+
+def test_operaciones_mezcladas(cambiosFrecuentes):
+    inmobiliaria, inmuebles = generarCartera(240, inmobiliaria=Inmobiliaria(concurrente=True))
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+    comprador = Propietario("Comprador", 40000100)
+
+    def operar(numero):
+        propios = codigos[numero::HILOS]
+        for codigo in propios[:10]:
+            inmobiliaria.ponerEnAlquiler(codigo)
+            inmobiliaria.alquilarInmueble(codigo, f"Inquilino {numero}")
+        inmobiliaria.ponerEnVentaBatch(propios[10:30])
+        inmobiliaria.venderPropiedadesBatch([(codigo, comprador) for codigo in propios[10:20]])
+        for codigo in propios[30:35]:
+            inmobiliaria.eliminarPropiedad(codigo)
+        inmobiliaria.buscar(area=(100, 300), estado="en venta")
+        inmobiliaria.datallarInmueble()
+
+    enHilos(operar)
+    assert inmobiliaria.cantidadPropiedades() == len(codigos) - 5 * HILOS
+    assert inmobiliaria.getAgregados().cantidadPorEstado("alquilado") >= 10 * HILOS
+    assert comprador.cantidadPropiedades() == 10 * HILOS
+    verificarIndices(inmobiliaria)
+    verificarAgregados(inmobiliaria)
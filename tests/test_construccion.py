@@ -0,0 +1,50 @@
+import pytest
+
+from test_indices import verificarIndices
+from Sistema import Inmobiliaria, Inmueble, Propietario
+
+
+def test_misma_reconstruccion_que_desdeRegistro(cartera):
+    _, inmuebles = cartera
+    for inmueble in inmuebles[:8]:
+        inmueble.modificarInquilino("Inquilino")
+        registro = inmueble.aRegistro()
+        validado = Inmueble.desdeRegistro(registro, Propietario(registro["fullname"], registro["dni"]))
+        confiable = Inmueble.desdeRegistroConfiable(registro, Propietario(registro["fullname"], registro["dni"]))
+        assert type(confiable) is type(inmueble)
+        assert confiable.aRegistro() == validado.aRegistro() == registro
+        assert confiable.detalleInmueble() == inmueble._generarDetalle()
+        assert confiable.getOwner().getListaPropiedades() == [confiable]
+
+
+def test_codigos(cartera):
+    _, inmuebles = cartera
+    registro = inmuebles[0].aRegistro()
+    registro["codigo"] = Inmueble.unique_code_seq + 50
+    restaurado = Inmueble.desdeRegistroConfiable(registro, Propietario("Propietario", 30000001))
+    assert restaurado.getUniquecode() == registro["codigo"]
+    # La secuencia avanza para no repetir el codigo restaurado.
+    del registro["codigo"]
+    nuevo = Inmueble.desdeRegistroConfiable(registro, Propietario("Propietario", 30000001))
+    assert nuevo.getUniquecode() > restaurado.getUniquecode()
+
+
+def test_inmueble_reconstruido_funciona_en_una_inmobiliaria(cartera):
+    _, inmuebles = cartera
+    inmobiliaria = Inmobiliaria()
+    propietario = Propietario("Propietario", 30000001)
+    copias = []
+    for inmueble in inmuebles[:12]:
+        registro = inmueble.aRegistro()
+        del registro["codigo"]
+        copias.append(Inmueble.desdeRegistroConfiable(registro, propietario))
+        inmobiliaria.anañadirPropiedad(copias[-1], registro["costo"])
+    copias[0].setCoveredArea(77.0)
+    inmobiliaria.ponerEnAlquiler(copias[1].getUniquecode())
+    inmobiliaria.alquilarInmueble(copias[1].getUniquecode(), "Inquilino")
+    verificarIndices(inmobiliaria)
+
+
+def test_tipo_desconocido():
+    with pytest.raises(ValueError):
+        Inmueble.desdeRegistroConfiable({"tipo": "Cochera"}, Propietario("Propietario", 30000001))
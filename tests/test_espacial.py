@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from Geocodificacion import Geocodificador
+from Sistema import IndiceEspacial, Inmobiliaria
+
+
+def cercanosRecorriendo(inmobiliaria, latitud, longitud, radioKm, estado=None, tipo=None):
+    """Pares (distancia, codigo) de la consulta por cercania, recorriendo la cartera."""
+    return sorted((IndiceEspacial.distancia((latitud, longitud), inmueble.getCoordenadas()), inmueble.getUniquecode())
+                  for inmueble in inmobiliaria.getlistaPropiedades()
+                  if inmueble.getCoordenadas() is not None
+                  and IndiceEspacial.distancia((latitud, longitud), inmueble.getCoordenadas()) <= radioKm
+                  and (estado is None or inmueble.getEstado() == estado)
+                  and (tipo is None or type(inmueble).__name__ == tipo))
+
+
+def verificarEspacial(inmobiliaria):
+    for latitud, longitud, radioKm in ((-34.6, -58.4, 0.5), (-34.6, -58.4, 3), (-34.58, -58.43, 1.2), (-34.6, -58.4, 0)):
+        for estado, tipo in ((None, None), ("en venta", None), (None, "Casa")):
+            cercanos = inmobiliaria.buscarCercanos(latitud, longitud, radioKm, estado=estado, tipo=tipo)
+            assert [(distancia, inmueble.getUniquecode()) for inmueble, distancia in cercanos] == \
+                cercanosRecorriendo(inmobiliaria, latitud, longitud, radioKm, estado, tipo)
+    recuadro = (-34.62, -58.42, -34.59, -58.39)
+    assert inmobiliaria.buscarEnRecuadro(*recuadro) == sorted(
+        (inmueble for inmueble in inmobiliaria.getlistaPropiedades() if inmueble.getCoordenadas() is not None
+         and recuadro[0] <= inmueble.getCoordenadas()[0] <= recuadro[2]
+         and recuadro[1] <= inmueble.getCoordenadas()[1] <= recuadro[3]),
+        key=lambda inmueble: inmueble.getUniquecode())
+
+
+def test_consultas_iguales_a_recorrer_la_cartera(cartera):
+    inmobiliaria, inmuebles = cartera
+    verificarEspacial(inmobiliaria)
+
+    azar = random.Random(3)
+    for inmueble in inmuebles[:30]:
+        inmueble.setCoordenadas((-34.6 + azar.uniform(-0.03, 0.03), -58.4 + azar.uniform(-0.03, 0.03)))
+    for inmueble in inmuebles[30:36]:
+        inmueble.setCoordenadas(None)
+    verificarEspacial(inmobiliaria)
+
+    for inmueble in inmuebles[:15]:
+        inmobiliaria.eliminarPropiedad(inmueble.getUniquecode())
+    verificarEspacial(inmobiliaria)
+    assert len(inmobiliaria._indiceEspacial) == sum(inmueble.getCoordenadas() is not None
+                                                    for inmueble in inmobiliaria.getlistaPropiedades())
+
+
+def test_orden_y_limite(cartera):
+    inmobiliaria, _ = cartera
+    cercanos = inmobiliaria.buscarCercanos(-34.6, -58.4, 5)
+    distancias = [distancia for _, distancia in cercanos]
+    assert distancias == sorted(distancias)
+    assert inmobiliaria.buscarCercanos(-34.6, -58.4, 5, limite=4) == cercanos[:4]
+
+
+def test_bordes_del_mapa():
+    indice = IndiceEspacial(tamañoCelda=1.0)
+    indice.agregar((0.0, 179.9), 1)
+    indice.agregar((0.0, -179.9), 2)
+    indice.agregar((89.95, 10.0), 3)
+    indice.agregar((89.95, -170.0), 4)
+    # El circulo cruza el antimeridiano.
+    assert {codigo for codigo, _ in indice.radio(0.0, 179.95, 50)} == {1, 2}
+    assert {codigo for codigo, _ in indice.radio(0.0, -179.95, 50)} == {1, 2}
+    # Cerca del polo cualquier longitud puede estar dentro del radio.
+    assert {codigo for codigo, _ in indice.radio(89.99, 100.0, 50)} == {3, 4}
+    indice.quitar((0.0, 179.9), 1)
+    indice.quitar((0.0, 179.9), 1)
+    assert len(indice) == 3
+
+
+def test_errores(cartera):
+    inmobiliaria, inmuebles = cartera
+    with pytest.raises(ValueError):
+        inmobiliaria.buscarCercanos(95, 0, 1)
+    with pytest.raises(TypeError):
+        inmobiliaria.buscarCercanos(-34.6, -58.4, -1)
+    with pytest.raises(ValueError):
+        inmobiliaria.buscarEnRecuadro(-34.5, -58.4, -34.6, -58.3)
+    with pytest.raises(TypeError):
+        inmuebles[0].setCoordenadas((True, 1.0))
+    with pytest.raises(ValueError):
+        inmuebles[0].setCoordenadas((0.0, 181.0))
+
+
+def test_geocodificar_cartera(cartera):
+    inmobiliaria, inmuebles = cartera
+    geocodificador = Geocodificador()
+    assert geocodificador.geocodificar("Calle Inexistente 10") is None
+    assert geocodificador.geocodificar("sin altura") is None
+    assert geocodificador.geocodificar("San Martín 1") == pytest.approx((-34.62, -58.375))
+    with pytest.raises(TypeError):
+        geocodificador.geocodificar(None)
+    with pytest.raises(TypeError):
+        geocodificador.geocodificarCartera(None)
+
+    ubicados, sinUbicar = geocodificador.geocodificarCartera(inmobiliaria, sobrescribir=True)
+    assert ubicados + sinUbicar == len(inmuebles)
+    for inmueble in inmuebles:
+        coordenadas = geocodificador.geocodificar(inmueble.getAddress())
+        if coordenadas is not None:
+            assert inmueble.getCoordenadas() == pytest.approx(coordenadas)
+    verificarEspacial(inmobiliaria)
+
+    otra = Inmobiliaria()
+    assert geocodificador.geocodificarCartera(otra) == (0, 0)
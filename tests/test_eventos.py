@@ -0,0 +1,108 @@
+import os
+import random
+
+import pytest
+
+from conftest import generarCartera, estadoDeCartera
+from Eventos import RegistroDeEventos
+from Sistema import Casa, Propietario
+
+
+def operar(inmobiliaria, inmuebles, semilla, cantidad):
+    """Aplica ventas, alquileres, cambios de atributos y bajas al azar. Los compradores tienen dni propios de la semilla."""
+    azar = random.Random(semilla)
+    compradores = [Propietario(f"Comprador {numero}", 50000000 + 100 * semilla + numero) for numero in range(4)]
+    for numero in range(cantidad):
+        inmueble = azar.choice(inmuebles)
+        codigo = inmueble.getUniquecode()
+        if inmobiliaria.buscarPropiedad(codigo) is None:
+            continue
+        operacion = azar.randrange(7)
+        if operacion == 0:
+            inmobiliaria.ponerEnVenta(codigo)
+            inmobiliaria.venderPropiedad(codigo, azar.choice(compradores))
+        elif operacion == 1:
+            inmobiliaria.ponerEnAlquiler(codigo)
+            inmobiliaria.alquilarInmueble(codigo, f"Inquilino {numero}")
+        elif operacion == 2:
+            inmueble.setCoveredArea(azar.randrange(30, 400))
+        elif operacion == 3:
+            inmueble.getOwner().setFullname(f"Nombre {numero}")
+        elif operacion == 4:
+            inmueble.setCosto(azar.randrange(1000, 90000))
+        elif operacion == 5 and isinstance(inmueble, Casa):
+            inmueble.setPatioSurface(float(numero))
+        elif azar.random() < 0.2:
+            inmobiliaria.eliminarPropiedad(codigo)
+
+
+@pytest.fixture
+def registroConCartera(tmp_path):
+    directorio = str(tmp_path / "eventos")
+    registro = RegistroDeEventos(directorio, eventosPorSnapshot=150)
+    inmobiliaria, inmuebles = generarCartera(60, inmobiliaria=registro.recuperar())
+    operar(inmobiliaria, inmuebles, 11, 600)
+    return directorio, registro, inmobiliaria
+
+
+def test_recuperar_reproduce_la_cartera(registroConCartera):
+    directorio, registro, inmobiliaria = registroConCartera
+    esperado = estadoDeCartera(inmobiliaria)
+    registro.cerrar()
+    assert any(nombre.startswith("snapshot-") for nombre in os.listdir(directorio))
+
+    recuperado = RegistroDeEventos(directorio, eventosPorSnapshot=150)
+    assert estadoDeCartera(recuperado.recuperar()) == esperado
+    assert recuperado.getSecuencia() == registro.getSecuencia()
+    recuperado.cerrar()
+
+
+def test_recuperar_tras_compactar(registroConCartera):
+    directorio, registro, inmobiliaria = registroConCartera
+    esperado = estadoDeCartera(inmobiliaria)
+    registro.cerrar()
+    registro.compactar()
+    assert len([nombre for nombre in os.listdir(directorio) if nombre.startswith("snapshot-")]) == 1
+
+    recuperado = RegistroDeEventos(directorio)
+    assert estadoDeCartera(recuperado.recuperar()) == esperado
+    recuperado.cerrar()
+
+
+def test_recuperar_sigue_registrando(registroConCartera):
+    directorio, registro, inmobiliaria = registroConCartera
+    registro.cerrar()
+
+    segundo = RegistroDeEventos(directorio, eventosPorSnapshot=150)
+    recuperada = segundo.recuperar()
+    operar(recuperada, recuperada.getlistaPropiedades(), 12, 200)
+    esperado = estadoDeCartera(recuperada)
+    segundo.cerrar()
+
+    tercero = RegistroDeEventos(directorio)
+    assert estadoDeCartera(tercero.recuperar()) == esperado
+    tercero.cerrar()
+
+
+def test_ultima_linea_incompleta_se_ignora(tmp_path):
+    directorio = str(tmp_path / "eventos")
+    registro = RegistroDeEventos(directorio)
+    inmobiliaria, _ = generarCartera(10, inmobiliaria=registro.recuperar())
+    esperado = estadoDeCartera(inmobiliaria)
+    registro.cerrar()
+
+    # Simula una escritura interrumpida a mitad de un evento.
+    segmento = sorted(nombre for nombre in os.listdir(directorio) if nombre.startswith("eventos-"))[-1]
+    with open(os.path.join(directorio, segmento), "a", encoding="utf-8") as archivo:
+        archivo.write('{"n": 999, "e": "baja", "c"')
+
+    recuperado = RegistroDeEventos(directorio)
+    assert estadoDeCartera(recuperado.recuperar()) == esperado
+    recuperado.cerrar()
+
+
+def test_parametros_invalidos(tmp_path):
+    with pytest.raises(TypeError):
+        RegistroDeEventos(123)
+    with pytest.raises(ValueError):
+        RegistroDeEventos(str(tmp_path), eventosPorSnapshot=0)
@@ -0,0 +1,75 @@
+import io
+import json
+
+import pytest
+
+from Importador import construirInmueble, exportarCSV, exportarJSONL, importar, leerCSV, leerJSONL
+from Sistema import Casa, Inmobiliaria, Propietario
+
+FILA = {"tipo": "Casa", "coveredArea": 80.0, "address": "Moreno 10", "rooms": 2, "dni": 80000001,
+        "fullname": "Ana Paz", "patioSurface": 15.0, "costo": 1000}
+
+
+@pytest.fixture
+def inmobiliariaConPropietario():
+    inmobiliaria = Inmobiliaria()
+    propietario = Propietario("Ana Paz", 80000001)
+    inmobiliaria.anañadirPropiedad(Casa(50.0, "Moreno 1", 1, propietario, 5.0), 500)
+    return inmobiliaria, propietario
+
+
+@pytest.mark.parametrize("cambios", [
+    {"patioSurface": "grande"},             # falla en el constructor
+    {"inquilino": 5},                       # falla despues de construir el inmueble
+    {"latitud": 500.0, "longitud": 0.0},    # coordenadas fuera de rango
+    {"costo": -1},
+    {"tipo": "Castillo"},
+])
+def test_fila_rechazada_no_deja_rastros(inmobiliariaConPropietario, cambios):
+    inmobiliaria, propietario = inmobiliariaConPropietario
+    rechazos = io.StringIO()
+    assert importar([dict(FILA, **cambios)], inmobiliaria, rechazos) == (0, 1)
+    assert propietario.cantidadPropiedades() == 1
+    assert len(inmobiliaria.getlistaPropiedades()) == 1
+    rechazo = json.loads(rechazos.getvalue())
+    assert rechazo["fila"] == 1 and rechazo["error"].startswith("Error")
+
+
+def test_propietario_nuevo_rechazado_no_se_registra():
+    propietarios = {}
+    with pytest.raises((TypeError, ValueError)):
+        construirInmueble(dict(FILA, dni=80000002, inquilino=5), propietarios)
+    assert propietarios == {}
+
+
+def test_filas_validas_y_rechazadas_mezcladas(inmobiliariaConPropietario):
+    inmobiliaria, propietario = inmobiliariaConPropietario
+    filas = [FILA, dict(FILA, rooms="dos"), dict(FILA, dni=80000003, fullname="Luis Paz"), {"_error": "Error: fila ilegible"}]
+    rechazos = io.StringIO()
+    assert importar(filas, inmobiliaria, rechazos, tamañoLote=1) == (2, 2)
+    # El propietario ya registrado se reutiliza por dni.
+    assert propietario.cantidadPropiedades() == 2
+    assert [json.loads(linea)["fila"] for linea in rechazos.getvalue().splitlines()] == [2, 4]
+
+
+def test_leer_csv_marca_celdas_invalidas():
+    archivo = io.StringIO("tipo,coveredArea,address,dni,patioSurface\nCasa,abc,Moreno 10,80000001,5\n")
+    filas = list(leerCSV(archivo))
+    assert "_error" in filas[0]
+    assert importar(filas, Inmobiliaria()) == (0, 1)
+
+
+def test_exportar_e_importar(cartera):
+    inmobiliaria, inmuebles = cartera
+    for exportar, leer in ((exportarCSV, leerCSV), (exportarJSONL, leerJSONL)):
+        archivo = io.StringIO()
+        assert exportar(inmobiliaria.getlistaPropiedades(), archivo) == len(inmuebles)
+        archivo.seek(0)
+        destino = Inmobiliaria()
+        assert importar(leer(archivo), destino) == (len(inmuebles), 0)
+        originales = sorted((inmueble.aRegistro() for inmueble in inmuebles), key=lambda registro: registro["address"])
+        importados = sorted((inmueble.aRegistro() for inmueble in destino.getlistaPropiedades()),
+                            key=lambda registro: registro["address"])
+        for original, importado in zip(originales, importados):
+            del original["codigo"], importado["codigo"]
+            assert importado == original
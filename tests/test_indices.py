@@ -0,0 +1,154 @@
+import random
+
+import pytest
+
+from conftest import generarCartera
+from Sistema import AgregadosDeCartera, Inmobiliaria, Inmueble, Propietario
+
+
+def verificarIndices(inmobiliaria):
+    """Compara cada consulta indexada con el mismo filtro aplicado recorriendo la cartera."""
+    inmuebles = sorted(inmobiliaria.getlistaPropiedades(), key=lambda inmueble: inmueble.getUniquecode())
+
+    def recorrer(condicion):
+        return [inmueble for inmueble in inmuebles if condicion(inmueble)]
+
+    for estado in Inmueble.posible_estado:
+        assert inmobiliaria.filtrarPropiedades(estado=estado) == recorrer(lambda i: i.getEstado() == estado)
+    for tipo in ("Casa", "Departamento", "Salon", "Quinta"):
+        assert inmobiliaria.filtrarPropiedades(tipo=tipo) == recorrer(lambda i: type(i).__name__ == tipo)
+    for cochera in (True, False):
+        assert inmobiliaria.filtrarPropiedades(cochera=cochera) == recorrer(lambda i: i.getCochera() == cochera)
+    for dni in {inmueble.getOwner().getDni() for inmueble in inmuebles}:
+        assert inmobiliaria.filtrarPropiedades(dni=dni) == recorrer(lambda i: i.getOwner().getDni() == dni)
+    assert inmobiliaria.buscar(area=(100, 250), estado="en venta") == recorrer(
+        lambda i: 100 <= i.getCoveredArea() <= 250 and i.getEstado() == "en venta")
+    assert inmobiliaria.buscar(costo=(None, 40000), rooms=(2, None)) == recorrer(
+        lambda i: i.getCosto() <= 40000 and i.getRooms() >= 2)
+
+    cercanos = inmobiliaria.buscarCercanos(-34.6, -58.4, 3)
+    esperados = {inmueble.getUniquecode() for inmueble in inmuebles
+                 if inmueble.getCoordenadas() is not None
+                 and inmobiliaria._indiceEspacial.distancia((-34.6, -58.4), inmueble.getCoordenadas()) <= 3}
+    assert {inmueble.getUniquecode() for inmueble, _ in cercanos} == esperados
+
+    assert set(inmobiliaria.getPropietarios()) == {inmueble.getOwner().getDni() for inmueble in inmuebles}
+
+    agregados = AgregadosDeCartera()
+    for inmueble in inmuebles:
+        agregados.agregar(inmueble)
+    assert inmobiliaria.getAgregados().cantidadPorEstado() == agregados.cantidadPorEstado()
+    assert inmobiliaria.getAgregados().cantidadPorTipo() == agregados.cantidadPorTipo()
+    assert round(inmobiliaria.getAgregados().valorEnVenta(), 6) == round(agregados.valorEnVenta(), 6)
+
+
+def test_indices_tras_altas(cartera):
+    inmobiliaria, _ = cartera
+    verificarIndices(inmobiliaria)
+
+
+def test_indices_tras_setters(cartera):
+    inmobiliaria, inmuebles = cartera
+    azar = random.Random(1)
+    for inmueble in inmuebles[::2]:
+        inmueble.setCoveredArea(azar.randrange(30, 400))
+        inmueble.setCosto(azar.randrange(1000, 90000))
+        inmueble.setCochera(not inmueble.getCochera())
+        inmueble.setEstado(azar.choice(Inmueble.posible_estado))
+    inmuebles[0].setCoordenadas((-34.6, -58.4))
+    inmuebles[3].setCoordenadas(None)
+    verificarIndices(inmobiliaria)
+
+
+def test_indices_tras_ventas_alquileres_y_bajas(cartera):
+    inmobiliaria, inmuebles = cartera
+    comprador = Propietario("Comprador", 40000001)
+    for inmueble in inmuebles[:20]:
+        codigo = inmueble.getUniquecode()
+        inmobiliaria.ponerEnVenta(codigo)
+        assert inmobiliaria.venderPropiedad(codigo, comprador)
+    for inmueble in inmuebles[20:40]:
+        codigo = inmueble.getUniquecode()
+        inmobiliaria.ponerEnAlquiler(codigo)
+        assert inmobiliaria.alquilarInmueble(codigo, "Inquilino Perez")
+    for inmueble in inmuebles[40:50]:
+        assert inmobiliaria.eliminarPropiedad(inmueble.getUniquecode())
+
+    verificarIndices(inmobiliaria)
+    assert comprador.cantidadPropiedades() == 20
+    assert inmobiliaria.buscarPropietario(40000001) is comprador
+    assert len(inmobiliaria.buscarTexto("perez", campos=["inquilino"], limite=None)) == 20
+
+
+def test_indices_tras_lotes(cartera):
+    inmobiliaria, inmuebles = cartera
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles]
+    comprador = Propietario("Comprador", 40000002)
+    inmobiliaria.ponerEnVentaBatch(codigos[:30])
+    resultados = inmobiliaria.venderPropiedadesBatch([(codigo, comprador) for codigo in codigos[:30]])
+    assert resultados == [True] * 30
+    inmobiliaria.ponerEnAlquilerBatch(codigos[30:60])
+    inmobiliaria.alquilarInmueblesBatch([(codigo, "Gomez") for codigo in codigos[30:60]])
+    verificarIndices(inmobiliaria)
+
+
+def test_lotes_equivalen_a_operaciones_individuales():
+    individual, inmueblesIndividual = generarCartera(60, semilla=3)
+    lote, inmueblesLote = generarCartera(60, semilla=3)
+    compradorIndividual = Propietario("Comprador", 40000003)
+    compradorLote = Propietario("Comprador", 40000003)
+
+    codigos = [inmueble.getUniquecode() for inmueble in inmueblesIndividual[:40]]
+    esperados = [individual.venderPropiedad(codigo, compradorIndividual) for codigo in codigos]
+    codigos = [inmueble.getUniquecode() for inmueble in inmueblesLote[:40]]
+    assert lote.venderPropiedadesBatch([(codigo, compradorLote) for codigo in codigos]) == esperados
+
+    # El lote suma las ganancias por tipo antes de acumularlas: el orden de las sumas puede variar el ultimo decimal.
+    assert lote.getGanancias() == pytest.approx(individual.getGanancias())
+    assert lote.getAgregados().gananciasPorTipo() == pytest.approx(individual.getAgregados().gananciasPorTipo())
+    assert lote.getAgregados().cantidadPorEstado() == individual.getAgregados().cantidadPorEstado()
+    verificarIndices(lote)
+
+
+def test_busqueda_de_texto_sigue_cambios(cartera):
+    inmobiliaria, inmuebles = cartera
+    inmueble = inmuebles[5]
+    inmueble.setAddress("Avenida Libertador 900")
+    assert inmueble in inmobiliaria.buscarTexto("libertador", campos=["address"], limite=None)
+    inmueble.setAddress("Lavalle 12")
+    assert inmobiliaria.buscarTexto("libertador", campos=["address"], limite=None) == []
+
+    inmueble.getOwner().setFullname("Zoe Quiroga")
+    encontrados = inmobiliaria.buscarTexto("quiroga", campos=["fullname"], limite=None)
+    assert set(encontrados) == set(inmobiliaria.filtrarPropiedades(dni=inmueble.getOwner().getDni()))
+
+
+def test_baja_desvincula_del_propietario(cartera):
+    inmobiliaria, inmuebles = cartera
+    inmueble = inmuebles[0]
+    propietario = inmueble.getOwner()
+    cantidad = propietario.cantidadPropiedades()
+    assert inmobiliaria.eliminarPropiedad(inmueble.getUniquecode())
+    assert propietario.cantidadPropiedades() == cantidad - 1
+    assert inmobiliaria.buscarPropiedad(inmueble.getUniquecode()) is None
+    assert not inmobiliaria.eliminarPropiedad(inmueble.getUniquecode())
+
+
+def test_inmueble_de_otra_inmobiliaria_se_rechaza(cartera):
+    inmobiliaria, inmuebles = cartera
+    otra = Inmobiliaria()
+    with pytest.raises(ValueError):
+        otra.anañadirPropiedad(inmuebles[0], 100)
+    assert otra.buscarPropiedad(inmuebles[0].getUniquecode()) is None
+
+    # El primer registro sigue recibiendo los cambios.
+    inmuebles[0].setEstado("alquilado")
+    assert inmuebles[0] in inmobiliaria.filtrarPropiedades(estado="alquilado")
+    verificarIndices(inmobiliaria)
+
+    # Una vez eliminado de la primera, puede pasar a la otra.
+    inmobiliaria.eliminarPropiedad(inmuebles[0].getUniquecode())
+    assert otra.anañadirPropiedad(inmuebles[0], 100)
+    inmuebles[0].setEstado("en venta")
+    assert otra.filtrarPropiedades(estado="en venta") == [inmuebles[0]]
+    verificarIndices(inmobiliaria)
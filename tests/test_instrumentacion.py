@@ -0,0 +1,89 @@
+import io
+import os
+
+import pytest
+
+from Instrumentacion import Instrumentacion, perfilar
+
+
+def test_instrumentar_y_desinstrumentar_restauran_los_metodos(cartera):
+    inmobiliaria, _ = cartera
+    instrumentacion = Instrumentacion()
+    instrumentacion.instrumentar(inmobiliaria)
+    envoltura = inmobiliaria.calcularPrecio
+    # Instrumentar dos veces no envuelve dos veces.
+    instrumentacion.instrumentar(inmobiliaria)
+    assert inmobiliaria.calcularPrecio is envoltura
+    instrumentacion.desinstrumentar(inmobiliaria)
+    for operacion in Instrumentacion.operaciones:
+        assert operacion not in vars(inmobiliaria)
+    with pytest.raises(TypeError):
+        instrumentacion.instrumentar(object())
+
+
+def test_llamadas_errores_y_recorridos(cartera):
+    inmobiliaria, inmuebles = cartera
+    instrumentacion = Instrumentacion()
+    instrumentacion.instrumentar(inmobiliaria)
+    for inmueble in inmuebles[:5]:
+        inmobiliaria.calcularPrecio(inmueble)
+    with pytest.raises((TypeError, ValueError)):
+        inmobiliaria.venderPropiedad(-1, None)
+    inmobiliaria.datallarInmueble()
+    inmobiliaria.escribirReporte(io.StringIO())
+    metricas = instrumentacion.snapshot()
+
+    precio = metricas["calcularPrecio"]
+    assert (precio["llamadas"], precio["errores"]) == (5, 0)
+    assert metricas["venderPropiedad"]["errores"] == 1
+    assert precio["histograma"][-1] == (float("inf"), 5)
+    assert [acumulado for _, acumulado in precio["histograma"]] == sorted(acumulado for _, acumulado in precio["histograma"])
+    assert 0 <= precio["maximo"] <= precio["segundos"]
+    assert "recorridos" not in precio
+    cantidad = inmobiliaria.cantidadPropiedades()
+    assert metricas["datallarInmueble"]["recorridos"] == {"cantidad": 1, "total": cantidad, "maximo": cantidad}
+    assert metricas["escribirReporte"]["recorridos"]["total"] == cantidad
+
+    # Las metricas se conservan al desinstrumentar, pero las llamadas ya no se cuentan.
+    instrumentacion.desinstrumentar()
+    inmobiliaria.calcularPrecio(inmuebles[0])
+    assert instrumentacion.snapshot()["calcularPrecio"]["llamadas"] == 5
+    instrumentacion.reiniciar()
+    assert instrumentacion.snapshot()["calcularPrecio"]["llamadas"] == 0
+
+
+def test_exportar_prometheus(cartera, tmp_path):
+    inmobiliaria, inmuebles = cartera
+    instrumentacion = Instrumentacion(limites=(0.5, 1e-3))
+    instrumentacion.instrumentar(inmobiliaria)
+    inmobiliaria.calcularPrecio(inmuebles[0])
+    inmobiliaria.datallarInmueble()
+    ruta = str(tmp_path / "metricas.prom")
+    instrumentacion.exportarPrometheus(ruta, prefijo="prueba")
+    with open(ruta, encoding="utf-8") as archivo:
+        texto = archivo.read()
+    assert not os.path.exists(ruta + ".tmp")
+    assert texto == instrumentacion.textoPrometheus("prueba")
+    lineas = texto.splitlines()
+    assert 'prueba_llamadas_total{operacion="calcularPrecio"} 1' in lineas
+    assert 'prueba_errores_total{operacion="calcularPrecio"} 0' in lineas
+    assert 'prueba_latencia_segundos_bucket{operacion="calcularPrecio",le="+Inf"} 1' in lineas
+    # Los limites se ordenan.
+    cubetas = [linea for linea in lineas if linea.startswith('prueba_latencia_segundos_bucket{operacion="calcularPrecio"')]
+    assert [linea.split('le="')[1].split('"')[0] for linea in cubetas] == ["0.001", "0.5", "+Inf"]
+    cantidad = inmobiliaria.cantidadPropiedades()
+    assert f'prueba_inmuebles_recorridos_sum{{operacion="datallarInmueble"}} {cantidad}' in lineas
+
+
+@pytest.mark.parametrize("limites", [(), (0, 1), (-1.0,), (True,), ("1",)])
+def test_limites_invalidos(limites):
+    with pytest.raises(ValueError):
+        Instrumentacion(limites)
+
+
+def test_perfilar(cartera):
+    inmobiliaria, _ = cartera
+    salida = io.StringIO()
+    with perfilar(salida=salida, limite=5):
+        inmobiliaria.calcularPreciosBatch()
+    assert "calcularPreciosBatch" in salida.getvalue()
@@ -0,0 +1,121 @@
+import pytest
+
+from conftest import estadoDeCartera, generarCartera
+from test_indices import verificarIndices
+from Sistema import Inmueble, Propietario
+
+
+def carteras(inmobiliaria):
+    return {dni: sorted(inmueble.getUniquecode() for inmueble in propietario.getListaPropiedades())
+            for dni, propietario in inmobiliaria.getPropietarios().items()}
+
+
+def enVenta(inmobiliaria):
+    return [inmueble.getUniquecode() for inmueble in inmobiliaria.filtrarPropiedades(estado="en venta")]
+
+
+def test_venta_que_falla_a_mitad_se_revierte(cartera, monkeypatch):
+    inmobiliaria, _ = cartera
+    codigos = enVenta(inmobiliaria)[:6]
+    comprador = Propietario("Comprador", 40000001)
+    antes = estadoDeCartera(inmobiliaria)
+    propietariosAntes = carteras(inmobiliaria)
+    eventos = []
+    inmobiliaria.agregarObservador(lambda evento, **datos: eventos.append(evento))
+
+    setCosto = Inmueble.setCosto
+
+    def fallarEnLaCuarta(inmueble, costo):
+        if inmueble.getUniquecode() == codigos[3] and costo == 0:
+            raise RuntimeError("falla simulada")
+        setCosto(inmueble, costo)
+    monkeypatch.setattr(Inmueble, "setCosto", fallarEnLaCuarta)
+
+    with pytest.raises(RuntimeError):
+        inmobiliaria.venderPropiedadesBatch([(codigo, comprador) for codigo in codigos])
+
+    assert estadoDeCartera(inmobiliaria) == antes
+    assert carteras(inmobiliaria) == propietariosAntes
+    assert comprador.getListaPropiedades() == []
+    assert eventos == []
+    verificarIndices(inmobiliaria)
+
+
+def test_alquiler_y_cambio_de_estado_que_fallan_se_revierten(cartera, monkeypatch):
+    inmobiliaria, _ = cartera
+    antes = estadoDeCartera(inmobiliaria)
+    paraAlquilar = enVenta(inmobiliaria)[:8]
+    alquilables = [inmueble.getUniquecode() for inmueble in inmobiliaria.filtrarPropiedades(estado="en alquiler")][:8]
+    fallas = {(paraAlquilar[-1], "en alquiler"), (alquilables[-1], "alquilado")}
+
+    setEstado = Inmueble.setEstado
+
+    def fallarEnLaUltima(inmueble, estado):
+        if (inmueble.getUniquecode(), estado) in fallas:
+            raise RuntimeError("falla simulada")
+        setEstado(inmueble, estado)
+    monkeypatch.setattr(Inmueble, "setEstado", fallarEnLaUltima)
+
+    with pytest.raises(RuntimeError):
+        inmobiliaria.ponerEnAlquilerBatch(paraAlquilar)
+    assert estadoDeCartera(inmobiliaria) == antes
+    with pytest.raises(RuntimeError):
+        inmobiliaria.alquilarInmueblesBatch([(codigo, f"Inquilino {codigo}") for codigo in alquilables])
+    assert estadoDeCartera(inmobiliaria) == antes
+    verificarIndices(inmobiliaria)
+
+
+def test_observador_que_falla_no_revierte_el_grupo(cartera):
+    inmobiliaria, _ = cartera
+    codigos = enVenta(inmobiliaria)[:5]
+    comprador = Propietario("Comprador", 40000002)
+    esperadas = inmobiliaria.getGanancias() + sum(inmobiliaria.buscarPropiedad(codigo).getCosto()
+                                                  for codigo in codigos) * inmobiliaria.costoDeGestionventa
+
+    def fallarEnElPrimerCambio(evento, **datos):
+        if evento == "cambio":
+            raise RuntimeError("observador roto")
+    inmobiliaria.agregarObservador(fallarEnElPrimerCambio)
+
+    with pytest.raises(RuntimeError):
+        inmobiliaria.venderPropiedadesBatch([(codigo, comprador) for codigo in codigos])
+
+    for codigo in codigos:
+        propiedad = inmobiliaria.buscarPropiedad(codigo)
+        assert propiedad.getEstado() == "vendido" and propiedad.getOwner() is comprador
+    assert sorted(inmueble.getUniquecode() for inmueble in comprador.getListaPropiedades()) == sorted(codigos)
+    assert inmobiliaria.getGanancias() == pytest.approx(esperadas)
+    verificarIndices(inmobiliaria)
+
+
+def test_lotes_equivalen_a_las_operaciones_de_a_uno():
+    porLotes, inmuebles = generarCartera(60)
+    deAUno, _ = generarCartera(60)
+    codigos = [inmueble.getUniquecode() - inmuebles[0].getUniquecode() for inmueble in inmuebles]
+    compradores = [Propietario(f"Comprador {numero}", 40000100 + numero) for numero in range(3)]
+
+    def operar(inmobiliaria, batch):
+        base = min(inmueble.getUniquecode() for inmueble in inmobiliaria.getlistaPropiedades())
+        ventas = [(base + codigo, compradores[codigo % 3]) for codigo in codigos[::2]]
+        alquileres = [(base + codigo, f"Inquilino {codigo}") for codigo in codigos[1::2]]
+        if batch:
+            inmobiliaria.ponerEnVentaBatch([codigo for codigo, _ in ventas])
+            inmobiliaria.venderPropiedadesBatch(ventas)
+            inmobiliaria.ponerEnAlquilerBatch([codigo for codigo, _ in alquileres])
+            inmobiliaria.alquilarInmueblesBatch(alquileres)
+        else:
+            for codigo, comprador in ventas:
+                inmobiliaria.ponerEnVenta(codigo)
+                inmobiliaria.venderPropiedad(codigo, comprador)
+            for codigo, inquilino in alquileres:
+                inmobiliaria.ponerEnAlquiler(codigo)
+                inmobiliaria.alquilarInmueble(codigo, inquilino)
+
+    operar(porLotes, True)
+    operar(deAUno, False)
+    uno, otro = estadoDeCartera(porLotes), estadoDeCartera(deAUno)
+    assert [dict(registro, codigo=None) for registro in uno.pop("registros")] == \
+        [dict(registro, codigo=None) for registro in otro.pop("registros")]
+    assert uno["ganancias"] == pytest.approx(otro["ganancias"])
+    assert uno["cantidadPorEstado"] == otro["cantidadPorEstado"]
+    verificarIndices(porLotes)
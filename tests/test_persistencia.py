@@ -0,0 +1,106 @@
+import gc
+import sqlite3
+import weakref
+
+from conftest import estadoDeCartera
+from Persistencia import AlmacenamientoSQLite
+from Sistema import Casa, Inmobiliaria, Propietario
+
+
+def test_ida_y_vuelta(cartera, tmp_path):
+    inmobiliaria, inmuebles = cartera
+    comprador = Propietario("Comprador", 70000001)
+    for inmueble in inmuebles[:10]:
+        inmobiliaria.ponerEnVenta(inmueble.getUniquecode())
+        inmobiliaria.venderPropiedad(inmueble.getUniquecode(), comprador)
+    ruta = str(tmp_path / "cartera.db")
+    almacenamiento = AlmacenamientoSQLite(ruta)
+    almacenamiento.guardarInmobiliaria(inmobiliaria)
+    almacenamiento.cerrar()
+
+    cargada = AlmacenamientoSQLite(ruta).cargarInmobiliaria()
+    assert estadoDeCartera(cargada) == estadoDeCartera(inmobiliaria)
+
+
+def test_cambios_posteriores_se_guardan(cartera, tmp_path):
+    inmobiliaria, inmuebles = cartera
+    ruta = str(tmp_path / "cartera.db")
+    almacenamiento = AlmacenamientoSQLite(ruta)
+    almacenamiento.guardarInmobiliaria(inmobiliaria)
+    # Desde ahora la inmobiliaria avisa cada cambio al almacenamiento.
+    almacenamiento.conectar(inmobiliaria)
+
+    codigo = inmuebles[0].getUniquecode()
+    inmobiliaria.ponerEnAlquiler(codigo)
+    inmobiliaria.alquilarInmueble(codigo, "Inquilino Lopez")
+    inmuebles[1].setCoveredArea(99)
+    inmobiliaria.eliminarPropiedad(inmuebles[2].getUniquecode())
+    almacenamiento.confirmar()
+    almacenamiento.cerrar()
+
+    segundo = AlmacenamientoSQLite(ruta)
+    assert estadoDeCartera(segundo.cargarInmobiliaria()) == estadoDeCartera(inmobiliaria)
+    assert [nuevo for _, nuevo, _ in segundo.historialDeEstados(codigo)][-1] == "alquilado"
+
+
+def test_cartera_perezosa(cartera, tmp_path):
+    inmobiliaria, inmuebles = cartera
+    almacenamiento = AlmacenamientoSQLite(str(tmp_path / "cartera.db"))
+    almacenamiento.guardarInmobiliaria(inmobiliaria)
+    perezosa = AlmacenamientoSQLite(str(tmp_path / "cartera.db")).cartera()
+    assert len(perezosa) == len(inmuebles)
+    assert perezosa[inmuebles[3].getUniquecode()].aRegistro() == inmuebles[3].aRegistro()
+
+
+def test_enteros_vuelven_como_int(tmp_path):
+    inmobiliaria = Inmobiliaria()
+    propietario = Propietario("Propietario", 30000001)
+    entero = Casa(120, "Mitre 10", 3, propietario, 40)
+    decimal = Casa(80.0, "Mitre 20", 2, propietario, 15.5)
+    inmobiliaria.anañadirPropiedad(entero, 50000)
+    inmobiliaria.anañadirPropiedad(decimal, 42000.0)
+    ruta = str(tmp_path / "cartera.db")
+    almacenamiento = AlmacenamientoSQLite(ruta)
+    almacenamiento.guardarInmobiliaria(inmobiliaria)
+    almacenamiento.cerrar()
+
+    cargada = AlmacenamientoSQLite(ruta).cargarInmobiliaria()
+    for original in (entero, decimal):
+        registro = cargada.buscarPropiedad(original.getUniquecode()).aRegistro()
+        esperado = original.aRegistro()
+        assert registro == esperado
+        assert [type(registro[campo]) for campo in ("coveredArea", "costo", "patioSurface")] == \
+            [type(esperado[campo]) for campo in ("coveredArea", "costo", "patioSurface")]
+
+
+def test_archivo_sin_columna_enteros_se_migra(cartera, tmp_path):
+    inmobiliaria, inmuebles = cartera
+    ruta = str(tmp_path / "cartera.db")
+    # Esquema anterior a la columna enteros.
+    conexion = sqlite3.connect(ruta)
+    conexion.executescript(AlmacenamientoSQLite._esquema.replace(
+        ",\n            enteros INTEGER NOT NULL DEFAULT 0", ""))
+    conexion.close()
+
+    almacenamiento = AlmacenamientoSQLite(ruta)
+    almacenamiento.guardarInmobiliaria(inmobiliaria)
+    almacenamiento.cerrar()
+    assert estadoDeCartera(AlmacenamientoSQLite(ruta).cargarInmobiliaria()) == estadoDeCartera(inmobiliaria)
+
+
+def test_mapa_de_identidad_no_retiene_inmuebles(cartera, tmp_path):
+    inmobiliaria, inmuebles = cartera
+    ruta = str(tmp_path / "cartera.db")
+    AlmacenamientoSQLite(ruta).guardarInmobiliaria(inmobiliaria)
+
+    almacenamiento = AlmacenamientoSQLite(ruta)
+    perezosa = almacenamiento.cartera()
+    codigo = inmuebles[5].getUniquecode()
+    inmueble = perezosa[codigo]
+    assert perezosa[codigo] is inmueble
+    referencia = weakref.ref(inmueble)
+    del inmueble
+    gc.collect()
+    assert referencia() is None
+    assert len(almacenamiento._inmuebles) == 0
+    assert perezosa[codigo].aRegistro() == inmuebles[5].aRegistro()
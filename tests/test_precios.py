@@ -0,0 +1,57 @@
+import pytest
+
+from Precios import REGLA_BASE, MotorDePrecios
+from Sistema import Casa, Inmobiliaria, Propietario, Salon
+
+
+def precioDeCalcularPrecio(inmobiliaria, inmueble):
+    return float(inmobiliaria.calcularPrecio(inmueble).rsplit(":", 1)[1])
+
+
+def test_sin_reglas_propias_coincide_con_calcularPrecio(cartera):
+    inmobiliaria, inmuebles = cartera
+    motor = MotorDePrecios.desdeInmobiliaria(inmobiliaria, {})
+    assert list(motor.valorarCartera(inmobiliaria)) == pytest.approx(
+        [precioDeCalcularPrecio(inmobiliaria, inmueble) for inmueble in inmobiliaria.getlistaPropiedades()])
+    assert [motor.precio(inmueble) for inmueble in inmuebles] == pytest.approx(
+        [precioDeCalcularPrecio(inmobiliaria, inmueble) for inmueble in inmuebles])
+
+
+def test_parametros_de_la_inmobiliaria(cartera):
+    inmobiliaria, inmuebles = cartera
+    inmobiliaria.metroCuadrado = 730
+    inmobiliaria.precioCochera = 1200
+    motor = MotorDePrecios.desdeInmobiliaria(inmobiliaria, {})
+    assert list(motor.precios(inmuebles)) == pytest.approx(
+        [precioDeCalcularPrecio(inmobiliaria, inmueble) for inmueble in inmuebles])
+
+
+def test_reglas_de_clases_hijas_se_suman_a_la_base():
+    propietario = Propietario("Propietario", 30000000)
+    casa = Casa(100.0, "Mitre 1", 3, propietario, 20.0, cochera=True)
+    salon = Salon(200.0, "Mitre 2", propietario, 80)
+    motor = MotorDePrecios({"Casa": {"patioSurface": 100}, "Salon": {"capacidad": 10, "coveredArea": 300}}, 0.2)
+    assert motor.precio(casa) == pytest.approx((100.0 * REGLA_BASE["coveredArea"] + REGLA_BASE["cochera"] + 20.0 * 100) * 1.2)
+    assert motor.precio(salon) == pytest.approx((200.0 * 300 + 80 * 10) * 1.2)
+
+
+@pytest.mark.parametrize("reglas", [
+    {"Salón": {"capacidad": 10}},
+    {"Propietario": {}},
+    {"Salon": {"patioSurface": 10}},
+    {"Casa": {"pileta": 1}},
+    {"Inmueble": {"expenses": 1}},
+    {"Quinta": {"superficie": 1}},
+])
+def test_reglas_invalidas_se_rechazan_al_crear_el_motor(reglas):
+    with pytest.raises(ValueError):
+        MotorDePrecios(reglas)
+
+
+def test_montos_invalidos():
+    with pytest.raises(TypeError):
+        MotorDePrecios({"Casa": {"patioSurface": "mucho"}})
+    with pytest.raises(TypeError):
+        MotorDePrecios({"Casa": []})
+    with pytest.raises(TypeError):
+        MotorDePrecios.desdeInmobiliaria(Inmobiliaria(), None)
@@ -0,0 +1,86 @@
+import gc
+import pickle
+import weakref
+
+from Sistema import Casa, Inmobiliaria, Propietario, Quinta
+
+
+def test_inmuebles_gestionados_se_resuelven_contra_la_inmobiliaria():
+    propietario = Propietario("Propietario", 30000000)
+    inmobiliaria = Inmobiliaria()
+    casa = Casa(100.0, "Mitre 1", 3, propietario, 20.0)
+    quinta = Quinta(300.0, "Alvear 2", propietario)
+    inmobiliaria.anañadirPropiedad(casa, 1000)
+    # El propietario guarda solo el codigo del inmueble gestionado y lo resuelve al pedirlo.
+    assert propietario._propiedades[casa.getUniquecode()] is None
+    assert propietario._propiedades[quinta.getUniquecode()] is quinta
+    assert propietario.getListaPropiedades() == [casa, quinta]
+    assert propietario.tienePropiedad(casa.getUniquecode()) and propietario.cantidadPropiedades() == 2
+
+    inmobiliaria.eliminarPropiedad(casa.getUniquecode())
+    assert propietario.getListaPropiedades() == [quinta]
+
+
+def test_inmobiliaria_recolectada_deja_de_listar_sus_inmuebles():
+    propietario = Propietario("Propietario", 30000000)
+    inmobiliaria = Inmobiliaria()
+    gestionada = Casa(100.0, "Mitre 1", 3, propietario, 20.0)
+    propia = Quinta(300.0, "Alvear 2", propietario)
+    inmobiliaria.anañadirPropiedad(gestionada, 1000)
+    codigo = gestionada.getUniquecode()
+    referencia = weakref.ref(inmobiliaria)
+    del inmobiliaria, gestionada
+    gc.collect()
+    assert referencia() is None
+
+    assert propietario.getListaPropiedades() == [propia]
+    assert propietario.cantidadPropiedades() == 1
+    assert not propietario.tienePropiedad(codigo)
+    # Las consultas no modifican al propietario: el codigo huerfano se descarta en la siguiente alta o baja.
+    assert codigo in propietario._propiedades
+    propietario.eliminarPropiedad(propia.getUniquecode())
+    assert propietario._propiedades == {} and propietario._carteras == ()
+
+
+def test_copia_del_propietario_lleva_los_inmuebles_resueltos():
+    propietario = Propietario("Propietario", 30000000)
+    inmobiliaria = Inmobiliaria()
+    casa = Casa(100.0, "Mitre 1", 3, propietario, 20.0)
+    inmobiliaria.anañadirPropiedad(casa, 1000)
+    copia = pickle.loads(pickle.dumps(propietario))
+    assert [inmueble.aRegistro() for inmueble in copia.getListaPropiedades()] == [casa.aRegistro()]
+
+
+def test_inmueble_eliminado_se_libera_sin_recolector():
+    propietario = Propietario("Propietario", 30000000)
+    inmobiliaria = Inmobiliaria()
+    casa = Casa(100.0, "Mitre 1", 3, propietario, 20.0)
+    inmobiliaria.anañadirPropiedad(casa, 1000)
+    referencia = weakref.ref(casa)
+    inmobiliaria.eliminarPropiedad(casa.getUniquecode())
+    gc.disable()
+    try:
+        del casa
+        # Sin ciclo con la inmobiliaria ni referencia del propietario, alcanza el conteo de referencias.
+        assert referencia() is None
+    finally:
+        gc.enable()
+    assert propietario.getListaPropiedades() == []
+
+
+def test_propietario_en_dos_inmobiliarias():
+    propietario = Propietario("Propietario", 30000000)
+    primera, segunda = Inmobiliaria(), Inmobiliaria()
+    casa = Casa(100.0, "Mitre 1", 3, propietario, 20.0)
+    quinta = Quinta(300.0, "Alvear 2", propietario)
+    primera.anañadirPropiedad(casa, 1000)
+    segunda.anañadirPropiedad(quinta, 2000)
+    assert propietario.getListaPropiedades() == [casa, quinta]
+    del segunda, quinta
+    gc.collect()
+    assert propietario.getListaPropiedades() == [casa]
+    assert len(propietario._carteras) == 2
+    # La siguiente alta ( el constructor llama a añadirPropiedad ) descarta la inmobiliaria recolectada.
+    nueva = Quinta(80.0, "Alvear 3", propietario)
+    assert len(propietario._carteras) == 1
+    assert propietario.getListaPropiedades() == [casa, nueva]
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from Sistema import IndiceDeRango
+
+
+def rangoEsperado(entradas, minimo, maximo):
+    return [codigo for valor, codigo in sorted(entradas)
+            if (minimo is None or valor >= minimo) and (maximo is None or valor <= maximo)]
+
+
+def test_indice_de_rango_contra_recorrido():
+    azar = random.Random(3)
+    indice = IndiceDeRango()
+    # Cubetas chicas para que las altas dividan cubetas y las bajas las vacien.
+    indice.tamañoCubeta = 4
+    entradas = set()
+    for codigo in range(400):
+        valor = azar.choice([azar.randrange(50), round(azar.uniform(0, 50), 1)])
+        indice.agregar(valor, codigo)
+        entradas.add((valor, codigo))
+    for valor, codigo in azar.sample(sorted(entradas), 250):
+        assert indice.quitar(valor, codigo)
+        entradas.discard((valor, codigo))
+    assert not indice.quitar(1000, 1) and len(indice) == len(entradas)
+
+    for minimo, maximo in [(None, None), (10, 20), (None, 5), (45, None), (20, 10), (12.5, 12.5), (-5, 100)]:
+        assert indice.rango(minimo, maximo) == rangoEsperado(entradas, minimo, maximo)
+        assert indice.contar(minimo, maximo) == len(rangoEsperado(entradas, minimo, maximo))
+
+
+def test_buscar_combina_rangos_y_conjuntos(cartera):
+    inmobiliaria, inmuebles = cartera
+    inmuebles[0].setCoveredArea(500.0)
+    inmuebles[1].setRooms(9)
+    inmuebles[2].setCosto(123456)
+    ordenados = sorted(inmobiliaria.getlistaPropiedades(), key=lambda inmueble: inmueble.getUniquecode())
+
+    def recorrer(condicion):
+        return [inmueble for inmueble in ordenados if condicion(inmueble)]
+
+    assert inmobiliaria.buscar(area=(450, None)) == recorrer(lambda i: i.getCoveredArea() >= 450)
+    assert inmobiliaria.buscar(rooms=(9, 9)) == recorrer(lambda i: i.getRooms() == 9)
+    assert inmobiliaria.buscar(costo=(100000, None), tipo=type(inmuebles[2])) == recorrer(
+        lambda i: i.getCosto() >= 100000 and type(i) is type(inmuebles[2]))
+    assert inmobiliaria.buscar(area=(50, 300), rooms=(1, 3), cochera=True) == recorrer(
+        lambda i: 50 <= i.getCoveredArea() <= 300 and 1 <= i.getRooms() <= 3 and i.getCochera())
+    assert inmobiliaria.buscar() == inmobiliaria.getlistaPropiedades()
+    inmobiliaria.eliminarPropiedad(inmuebles[0].getUniquecode())
+    assert inmuebles[0] not in inmobiliaria.buscar(area=(450, None))
+    with pytest.raises(TypeError):
+        inmobiliaria.buscar(area=[1, 2])
@@ -0,0 +1,48 @@
+from Sistema import Casa, Inmobiliaria, Propietario, Quinta
+
+
+def test_registro_por_dni(cartera):
+    inmobiliaria, inmuebles = cartera
+    propietarios = {inmueble.getOwner().getDni(): inmueble.getOwner() for inmueble in inmuebles}
+    assert inmobiliaria.getPropietarios() == propietarios
+    for dni, propietario in propietarios.items():
+        assert inmobiliaria.buscarPropietario(dni) is propietario
+    cadena, lista = inmobiliaria.listaPropietarios()
+    assert sorted(propietario.getDni() for propietario in lista) == sorted(propietarios)
+    assert str(len(inmuebles)) in cadena
+    assert inmobiliaria.buscarPropietario(1) is None
+
+
+def test_registro_sigue_ventas_bajas_y_cambios_de_dni():
+    inmobiliaria = Inmobiliaria()
+    vendedor = Propietario("Vendedor", 30000001)
+    casa = Casa(100.0, "Mitre 1", 3, vendedor, 20.0)
+    quinta = Quinta(300.0, "Alvear 2", vendedor)
+    inmobiliaria.anañadirPropiedad(casa, 1000)
+    inmobiliaria.anañadirPropiedad(quinta, 2000)
+    comprador = Propietario("Comprador", 30000002)
+
+    inmobiliaria.venderPropiedad(casa.getUniquecode(), comprador)
+    assert set(inmobiliaria.getPropietarios()) == {30000001, 30000002}
+    inmobiliaria.eliminarPropiedad(quinta.getUniquecode())
+    # El vendedor ya no tiene inmuebles en la cartera.
+    assert set(inmobiliaria.getPropietarios()) == {30000002}
+    comprador.setDni(30000003)
+    assert inmobiliaria.getPropietarios() == {30000003: comprador}
+    assert inmobiliaria.filtrarPropiedades(dni=30000003) == [casa]
+    assert inmobiliaria.listaPropietarios()[1] == [comprador]
+    inmobiliaria.eliminarPropiedad(casa.getUniquecode())
+    assert inmobiliaria.getPropietarios() == {} and inmobiliaria.listaPropietarios() is None
+
+
+def test_cartera_del_propietario_en_o1():
+    propietario = Propietario("Propietario", 30000001)
+    casas = [Casa(50.0 + numero, f"Mitre {numero}", 2, propietario, 0.0) for numero in range(5)]
+    assert propietario.cantidadPropiedades() == 5
+    assert all(propietario.tienePropiedad(casa.getUniquecode()) for casa in casas)
+    assert propietario.eliminarPropiedad(casas[2].getUniquecode())
+    assert not propietario.eliminarPropiedad(casas[2].getUniquecode())
+    assert not propietario.tienePropiedad(casas[2].getUniquecode())
+    # Se conserva el orden de alta.
+    assert propietario.getListaPropiedades() == casas[:2] + casas[3:]
+    assert not propietario.añadirPropiedad(casas[0])
@@ -0,0 +1,115 @@
+import gc
+import weakref
+
+import pytest
+
+from conftest import generarCartera
+from Sistema import CacheDeRender, Casa, Departamento, Inmueble, Propietario, Quinta, Salon
+
+
+def test_la_cache_no_retiene_inmuebles_dados_de_baja(cartera):
+    inmobiliaria, inmuebles = cartera
+    inmueble = inmuebles.pop()
+    inmueble.detalleInmueble()
+    repr(inmueble)
+    referencia = weakref.ref(inmueble)
+    inmobiliaria.eliminarPropiedad(inmueble.getUniquecode())
+    del inmueble
+    gc.collect()
+    assert referencia() is None
+
+
+def test_expulsion_con_inmuebles_liberados():
+    cache = CacheDeRender(3)
+    propietario = Propietario("Propietario", 30000000)
+    vivos = [Casa(50.0, f"Mitre {numero}", 2, propietario, 10.0) for numero in range(3)]
+    for inmueble in vivos:
+        _, ficha = cache.obtener(inmueble, "detalle")
+        cache.guardar(inmueble, "detalle", "cadena", ficha)
+    propietario.eliminarPropiedad(vivos[0].getUniquecode())
+    del vivos[0]
+    gc.collect()
+    nuevo = Casa(50.0, "Mitre 9", 2, propietario, 10.0)
+    _, ficha = cache.obtener(nuevo, "detalle")
+    cache.guardar(nuevo, "detalle", "cadena", ficha)
+    assert len(cache) == 3
+    assert all(cache.obtener(inmueble, "detalle")[0] == "cadena" for inmueble in vivos + [nuevo])
+
+
+def test_cadena_generada_antes_de_un_cambio_no_se_guarda():
+    inmobiliaria, inmuebles = generarCartera(4)
+    inmueble = inmuebles[0]
+    cache = Inmueble.cacheDeRender
+    # Un hilo obtiene la ficha y genera la cadena; otro modifica el inmueble antes de que la guarde.
+    _, ficha = cache.obtener(inmueble, "detalle")
+    vieja = (inmueble._firmaDePropietario(), inmueble._generarDetalle())
+    inmueble.setCosto(inmueble.getCosto() + 1)
+    cache.guardar(inmueble, "detalle", vieja, ficha)
+    assert inmueble.detalleInmueble() == inmueble._generarDetalle() != vieja[1]
+
+
+SETTERS = [
+    (Casa, "setCosto", 1234),
+    (Casa, "setCoveredArea", 321.5),
+    (Casa, "setAddress", "Moreno 77"),
+    (Casa, "setCoordenadas", (-34.61, -58.42)),
+    (Casa, "setRooms", 6),
+    (Casa, "setOwner", Propietario("Otro Propietario", 30000099)),
+    (Casa, "setEstado", "alquilado"),
+    (Casa, "setCochera", True),
+    (Casa, "modificarInquilino", "Inquilino Perez"),
+    (Casa, "setPatioSurface", 88.0),
+    (Departamento, "setExpenses", 999.0),
+    (Departamento, "setDepartamentNumber", 31),
+    (Salon, "setCapacidad", 450),
+    (Quinta, "setPileta", True),
+    (Quinta, "setQuincho", True),
+]
+
+
+@pytest.mark.parametrize("clase, setter, valor", SETTERS, ids=[setter for _, setter, _ in SETTERS])
+def test_cada_setter_invalida_las_cadenas(clase, setter, valor):
+    inmobiliaria, inmuebles = generarCartera(8)
+    inmueble = next(inmueble for inmueble in inmuebles if type(inmueble) is clase)
+    inmueble.detalleInmueble()
+    repr(inmueble)
+    assert inmueble._render is not None
+    getattr(inmueble, setter)(valor)
+    assert inmueble._render is None
+    assert inmueble.detalleInmueble() == inmueble._generarDetalle()
+    assert repr(inmueble) == inmueble._generarRepr()
+    # La segunda vez sale de la cache.
+    aciertos = Inmueble.cacheDeRender.aciertos
+    assert inmueble.detalleInmueble() == inmueble._generarDetalle()
+    assert Inmueble.cacheDeRender.aciertos == aciertos + 1
+
+
+@pytest.mark.parametrize("setter, valor", [("setFullname", "Nombre Nuevo"), ("setDni", 30000098)])
+def test_cambios_del_propietario_invalidan_sus_inmuebles(setter, valor):
+    _, inmuebles = generarCartera(16)
+    propietario = inmuebles[0].getOwner()
+    suyos = [inmueble for inmueble in inmuebles if inmueble.getOwner() is propietario]
+    anteriores = [(inmueble.detalleInmueble(), repr(inmueble)) for inmueble in suyos]
+    getattr(propietario, setter)(valor)
+    for inmueble, (detalle, representacion) in zip(suyos, anteriores):
+        assert inmueble.detalleInmueble() == inmueble._generarDetalle() != detalle
+        assert repr(inmueble) == inmueble._generarRepr() != representacion
+
+
+def test_tamaño_acotado_y_redimensionar():
+    cache = CacheDeRender(5)
+    _, inmuebles = generarCartera(12)
+    for inmueble in inmuebles:
+        _, ficha = cache.obtener(inmueble, "detalle")
+        cache.guardar(inmueble, "detalle", inmueble.getUniquecode(), ficha)
+    assert len(cache) == 5
+    # Quedan los usados mas recientemente.
+    assert [cache.obtener(inmueble, "detalle")[0] for inmueble in inmuebles[-5:]] == \
+        [inmueble.getUniquecode() for inmueble in inmuebles[-5:]]
+    assert inmuebles[0]._render is None
+    cache.redimensionar(2)
+    assert len(cache) == 2
+    cache.limpiar()
+    assert len(cache) == 0 and cache.estadisticas()["aciertos"] == 0
+    with pytest.raises(ValueError):
+        CacheDeRender(-1)
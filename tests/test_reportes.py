@@ -0,0 +1,44 @@
+import io
+import types
+
+from conftest import generarCartera
+from Sistema import Inmobiliaria
+
+
+class Escritor():
+    """Archivo en memoria que cuenta las escrituras."""
+
+    def __init__(self):
+        self.partes = []
+
+    def write(self, texto):
+        self.partes.append(texto)
+
+
+def test_reporte_de_la_inmobiliaria(cartera):
+    inmobiliaria, inmuebles = cartera
+    assert isinstance(inmobiliaria.iterarDetalles(), types.GeneratorType)
+    escritor = Escritor()
+    assert inmobiliaria.escribirReporte(escritor) == len(inmuebles)
+    # Una escritura por inmueble mas el encabezado, sin armar el reporte completo.
+    assert len(escritor.partes) == len(inmuebles) + 1
+    assert "".join(escritor.partes) == inmobiliaria.datallarInmueble()
+    assert inmobiliaria.datallarInmueble() == "Cantidad de inmuebles en cartera: " + str(len(inmuebles)) + "".join(
+        inmueble.detalleInmueble() + "\n==========\n" for inmueble in inmobiliaria.getlistaPropiedades())
+    assert Inmobiliaria().datallarInmueble() is None
+
+
+def test_reporte_concurrente_coincide():
+    inmobiliaria, _ = generarCartera(20, inmobiliaria=Inmobiliaria(concurrente=True))
+    archivo = io.StringIO()
+    inmobiliaria.escribirReporte(archivo)
+    assert archivo.getvalue() == inmobiliaria.datallarInmueble()
+
+
+def test_reporte_del_propietario(cartera):
+    _, inmuebles = cartera
+    propietario = inmuebles[0].getOwner()
+    archivo = io.StringIO()
+    assert propietario.escribirReporte(archivo) == propietario.cantidadPropiedades()
+    assert archivo.getvalue() == propietario.describirPropiedad()
+    assert all(propiedad.detalleInmueble() in archivo.getvalue() for propiedad in propietario.getListaPropiedades())
@@ -0,0 +1,40 @@
+import copy
+import pickle
+
+import pytest
+
+from Sistema import Casa, Departamento, Inmobiliaria, Propietario, Quinta, Salon
+
+
+def ejemplos():
+    propietario = Propietario("Propietario", 30000000)
+    return propietario, [Casa(120.5, "San Martin 100", 3, propietario, 40.0),
+                         Departamento(60.0, "Belgrano 200", 2, propietario, 150.0, 4),
+                         Salon(300.0, "Mitre 300", propietario, 120),
+                         Quinta(250.0, "Alvear 400", propietario, True, False)]
+
+
+def test_sin_dict_por_instancia():
+    propietario, inmuebles = ejemplos()
+    for objeto in [propietario] + inmuebles:
+        assert not hasattr(objeto, "__dict__")
+        with pytest.raises(AttributeError):
+            objeto.atributoNuevo = 1
+
+
+@pytest.mark.parametrize("copiar", [copy.deepcopy, lambda objeto: pickle.loads(pickle.dumps(objeto))],
+                         ids=["deepcopy", "pickle"])
+def test_copias_conservan_los_datos(copiar):
+    propietario, inmuebles = ejemplos()
+    inmobiliaria = Inmobiliaria()
+    inmobiliaria.anañadirPropiedad(inmuebles[0], 1000)
+    inmuebles[0].detalleInmueble()
+    for inmueble in inmuebles:
+        copia = copiar(inmueble)
+        assert copia.aRegistro() == inmueble.aRegistro()
+        assert copia.detalleInmueble() == inmueble._generarDetalle()
+        # La copia no pertenece a ninguna inmobiliaria ni arrastra las cadenas cacheadas.
+        assert copia._inmobiliaria is None
+    copiaPropietario = copiar(propietario)
+    assert [inmueble.aRegistro() for inmueble in copiaPropietario.getListaPropiedades()] == \
+        [inmueble.aRegistro() for inmueble in inmuebles]
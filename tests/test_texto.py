@@ -0,0 +1,104 @@
+import pytest
+
+from Sistema import IndiceDeTexto, Propietario
+
+
+def textos(inmueble):
+    return {"address": inmueble.getAddress(), "fullname": inmueble.getOwner().getFullname(),
+            "inquilino": inmueble.getInquilino() or ""}
+
+
+def recorrer(inmobiliaria, consulta, campos=("address", "fullname", "inquilino")):
+    """Codigos que cumplen la consulta, revisando los textos de cada inmueble de la cartera."""
+    terminos = IndiceDeTexto.tokens(consulta)
+    prefijo = not consulta[-1:].isspace()
+    encontrados = set()
+    for inmueble in inmobiliaria.getlistaPropiedades():
+        tokens = [IndiceDeTexto.tokens(texto) for campo, texto in textos(inmueble).items() if campo in campos]
+        tokens = [token for lista in tokens for token in lista]
+        if all(termino in tokens or (prefijo and posicion == len(terminos) - 1
+                                     and any(token.startswith(termino) for token in tokens))
+               for posicion, termino in enumerate(terminos)):
+            encontrados.add(inmueble.getUniquecode())
+    return encontrados
+
+
+def buscar(inmobiliaria, consulta, **kwargs):
+    return {inmueble.getUniquecode() for inmueble in inmobiliaria.buscarTexto(consulta, limite=None, **kwargs)}
+
+
+CONSULTAS = ["san martin", "san mar", "SAN", "belgrano 1", "propietario", "propietario 3", "mi", "m", "perez ",
+             "rivadavia pe", "inexistente"]
+
+
+def verificarTexto(inmobiliaria):
+    for consulta in CONSULTAS:
+        assert buscar(inmobiliaria, consulta) == recorrer(inmobiliaria, consulta)
+    for campo in ("address", "fullname", "inquilino"):
+        assert buscar(inmobiliaria, "pe", campos=[campo]) == recorrer(inmobiliaria, "pe", campos=[campo])
+
+
+def test_busqueda_igual_a_recorrer_la_cartera(cartera):
+    inmobiliaria, inmuebles = cartera
+    verificarTexto(inmobiliaria)
+
+    for numero, inmueble in enumerate(inmuebles[:10]):
+        inmueble.setAddress(f"San Martín {numero}")
+        inmueble.modificarInquilino(f"Juan Pérez {numero}")
+    inmuebles[0].getOwner().setFullname("Mirta Belgrano")
+    verificarTexto(inmobiliaria)
+
+    for inmueble in inmuebles[:5]:
+        inmueble.modificarInquilino("")
+    for inmueble in inmuebles[10:30]:
+        inmobiliaria.eliminarPropiedad(inmueble.getUniquecode())
+    verificarTexto(inmobiliaria)
+
+
+def test_mayusculas_tildes_y_relevancia(cartera):
+    inmobiliaria, inmuebles = cartera
+    inmuebles[3].setAddress("Güemes 1500")
+    inmuebles[4].setAddress("Guemes Guemes 10")
+    assert inmobiliaria.buscarTexto("GUEMES", limite=None)[:2] == sorted(inmuebles[3:5], key=lambda i: i.getUniquecode())
+    # Una coincidencia exacta pesa mas que una por prefijo.
+    inmuebles[5].setAddress("Guemesito 1")
+    assert inmobiliaria.buscarTexto("guemes", limite=None)[-1] is inmuebles[5]
+    assert inmobiliaria.buscarTexto("guemes ", limite=None) == inmobiliaria.buscarTexto("guemes", limite=2)
+    assert len(inmobiliaria.buscarTexto("propietario", limite=3)) == 3
+    assert inmobiliaria.buscarTexto("  ") == []
+
+
+def test_errores(cartera):
+    inmobiliaria, _ = cartera
+    with pytest.raises(TypeError):
+        inmobiliaria.buscarTexto(5)
+    with pytest.raises(ValueError):
+        inmobiliaria.buscarTexto("san", campos=["costo"])
+
+
+def test_indice_de_texto():
+    indice = IndiceDeTexto()
+    indice.agregar("San Martín 120", 1)
+    indice.agregar("Santa Fe 4", 2)
+    indice.agregar("Sarmiento 9", 1)
+    assert set(indice.ids("martin")) == {1}
+    assert sorted(indice.tokensConPrefijo("san")) == ["san", "santa"]
+    assert sorted(indice.tokensConPrefijo("s")) == ["san", "santa", "sarmiento"]
+    assert list(indice.tokensConPrefijo("x")) == []
+    indice.quitar("San Martín 120", 1)
+    indice.quitar("Santa Fe 4", 2)
+    indice.quitar("Sarmiento 9", 1)
+    assert len(indice) == 0
+    assert indice._porPrefijo == {}
+    assert indice.ids("san") == ()
+
+
+def test_propietario_nuevo_y_renombrado(cartera):
+    inmobiliaria, inmuebles = cartera
+    vendido = next(inmueble for inmueble in inmuebles if inmueble.getEstado() == "en venta")
+    propietario = Propietario("Ramona Quiroga", 39999999)
+    assert inmobiliaria.venderPropiedad(vendido.getUniquecode(), propietario)
+    assert buscar(inmobiliaria, "quiroga") == {vendido.getUniquecode()} == recorrer(inmobiliaria, "quiroga")
+    propietario.setFullname("Ramona Lugones")
+    assert buscar(inmobiliaria, "quiroga") == set()
+    assert buscar(inmobiliaria, "lugo") == {vendido.getUniquecode()} == recorrer(inmobiliaria, "lugo")
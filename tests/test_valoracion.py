@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import Sistema
+
+ESCENARIOS = [{"metroCuadrado": 650}, {"precioCochera": 0, "costoDeGestionventa": 0.3}, {}]
+
+
+def precioEsperado(inmueble, metroCuadrado=500, precioCochera=500, costoDeGestionventa=0.2):
+    return (inmueble.getCoveredArea() * metroCuadrado + precioCochera * inmueble.getCochera()) * (1 + costoDeGestionventa)
+
+
+def test_escenarios(cartera):
+    inmobiliaria, _ = cartera
+    resultados = inmobiliaria.valorarEscenarios(ESCENARIOS, procesos=1)
+    inmuebles = [inmobiliaria.buscarPropiedad(codigo) for codigo in inmobiliaria.getColumnas().codigos]
+    for escenario, precios in zip(ESCENARIOS, resultados):
+        assert list(precios) == pytest.approx([precioEsperado(inmueble, **escenario) for inmueble in inmuebles])
+
+
+def test_poco_trabajo_no_crea_procesos(cartera, monkeypatch):
+    inmobiliaria, _ = cartera
+
+    def sinPool(*args, **kwargs):
+        raise AssertionError("no deberia crear un pool para tan pocos precios")
+    monkeypatch.setattr(Sistema, "ProcessPoolExecutor", sinPool)
+    assert inmobiliaria.valorarEscenarios(ESCENARIOS, procesos=4) == inmobiliaria.valorarEscenarios(ESCENARIOS, procesos=1)
+
+
+def test_reparto_entre_procesos_da_lo_mismo(cartera):
+    inmobiliaria, inmuebles = cartera
+    inmobiliaria.minimoParaProcesos = 0
+    codigos = [inmueble.getUniquecode() for inmueble in inmuebles[::3]]
+    assert inmobiliaria.valorarEscenarios(ESCENARIOS, procesos=3) == inmobiliaria.valorarEscenarios(ESCENARIOS, procesos=1)
+    assert inmobiliaria.valorarEscenarios(ESCENARIOS, codigos, procesos=2) == \
+        inmobiliaria.valorarEscenarios(ESCENARIOS, codigos, procesos=1)
+
+
+def test_executor_propio_siempre_se_usa(cartera):
+    inmobiliaria, _ = cartera
+    with ThreadPoolExecutor(2) as executor:
+        enviados = []
+        submit = executor.submit
+        executor.submit = lambda *args: enviados.append(args) or submit(*args)
+        resultados = inmobiliaria.valorarEscenarios(ESCENARIOS, procesos=2, executor=executor)
+    assert len(enviados) == 2
+    assert resultados == inmobiliaria.valorarEscenarios(ESCENARIOS, procesos=1)
+
+
+def test_procesos_invalidos(cartera):
+    inmobiliaria, _ = cartera
+    with pytest.raises(ValueError):
+        inmobiliaria.valorarEscenarios(ESCENARIOS, procesos=0)